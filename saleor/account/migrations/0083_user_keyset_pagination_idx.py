@@ -0,0 +1,28 @@
+# Generated by Django 3.2.22 on 2023-11-06 10:12
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("account", "0082_user_last_confirm_email_request"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="user",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                fields=["date_joined", "id"], name="user_date_joined_id_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="user",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                fields=["updated_at", "id"], name="user_updated_at_id_idx"
+            ),
+        ),
+    ]
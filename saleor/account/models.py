@@ -5,7 +5,7 @@ from uuid import uuid4
 
 from django.conf import settings
 from django.contrib.auth.base_user import AbstractBaseUser, BaseUserManager
-from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.indexes import BTreeIndex, GinIndex
 from django.db import models
 from django.db.models import JSONField, Q, Value
 from django.db.models.expressions import Exists, OuterRef
@@ -222,6 +222,9 @@ class User(
                 fields=["private_metadata"],
                 opclasses=["jsonb_path_ops"],
             ),
+            # Keyset pagination indexes matching the `UserSortField` orderings
+            BTreeIndex(fields=["date_joined", "id"], name="user_date_joined_id_idx"),
+            BTreeIndex(fields=["updated_at", "id"], name="user_updated_at_id_idx"),
         ]
 
     def __init__(self, *args, **kwargs):
@@ -2,7 +2,7 @@ from typing import TYPE_CHECKING
 
 from django.db.models import Q, Value, prefetch_related_objects
 
-from ..core.postgres import NoValidationSearchVector
+from ..core.postgres import NoValidationSearchVector, TrigramWordSimilarity
 
 if TYPE_CHECKING:
     from .models import Address, User
@@ -107,9 +107,17 @@ def generate_address_search_vector_value(
 
 
 def search_users(qs, value):
+    """Filter users by all words of the value and annotate them with `search_rank`.
+
+    Every `ILIKE` condition is served by the `user_search_gin` trigram index
+    on `search_document`. The rank is the trigram word similarity of the whole
+    value to the document, so users matching it more closely are ranked higher.
+    """
     if value:
         lookup = Q()
         for val in value.split():
             lookup &= Q(search_document__ilike=val.lower())
-        qs = qs.filter(lookup)
+        qs = qs.filter(lookup).annotate(
+            search_rank=TrigramWordSimilarity(value.lower(), "search_document")
+        )
     return qs
@@ -1,4 +1,7 @@
-from ..search import prepare_user_search_document_value
+from django.db import connection
+
+from ..models import User
+from ..search import prepare_user_search_document_value, search_users
 
 
 def test_prepare_user_search_document_value(customer_user, address, address_usa):
@@ -63,3 +66,31 @@ def test_prepare_user_search_document_value_do_not_attach_addresses_data(
 
     # then
     assert search_document_value == expected_search_value
+
+
+def test_search_users_ranks_closer_matches_higher(customer_user, customer_user2):
+    # given
+    customer_user.search_document = "john@example.com\njohn\nsmith\n"
+    customer_user2.search_document = "johnathan@example.com\njohnathan\nsmith\n"
+    User.objects.bulk_update([customer_user, customer_user2], ["search_document"])
+
+    # when
+    users = search_users(User.objects.all(), "John Smith").order_by("-search_rank")
+
+    # then
+    assert list(users) == [customer_user, customer_user2]
+    assert users[0].search_rank > users[1].search_rank
+
+
+def test_search_users_uses_trigram_index(customer_user):
+    # given
+    qs = search_users(User.objects.all(), "john smith").order_by()
+
+    # when
+    with connection.cursor() as cursor:
+        # The table is too small for the planner to choose the index on its own.
+        cursor.execute("SET LOCAL enable_seqscan = off")
+        plan = qs.explain()
+
+    # then
+    assert "user_search_gin" in plan
@@ -1,13 +1,17 @@
 from django.apps import AppConfig as DjangoAppConfig
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 
 
 class AppConfig(DjangoAppConfig):
     name = "saleor.app"
 
     def ready(self):
-        from .models import App, AppInstallation
-        from .signals import delete_brand_images
+        from .models import App, AppInstallation, AppToken
+        from .signals import (
+            delete_brand_images,
+            forget_verified_app_token,
+            forget_verified_inactive_app_tokens,
+        )
 
         # preventing duplicate signals
         post_delete.connect(
@@ -20,3 +24,13 @@ class AppConfig(DjangoAppConfig):
             sender=AppInstallation,
             dispatch_uid="delete_app_installation_brand_images",
         )
+        post_delete.connect(
+            forget_verified_app_token,
+            sender=AppToken,
+            dispatch_uid="forget_verified_app_token",
+        )
+        post_save.connect(
+            forget_verified_inactive_app_tokens,
+            sender=App,
+            dispatch_uid="forget_verified_inactive_app_tokens",
+        )
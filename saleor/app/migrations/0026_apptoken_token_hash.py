@@ -0,0 +1,17 @@
+# Generated by Django 3.2.22 on 2023-11-20 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("app", "0025_auto_20230420_1544"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="apptoken",
+            name="token_hash",
+            field=models.CharField(blank=True, db_index=True, max_length=64, null=True),
+        ),
+    ]
@@ -11,6 +11,7 @@ from ..core.models import Job, ModelWithMetadata
 from ..permission.enums import AppPermission, BasePermissionEnum
 from ..permission.models import Permission
 from ..webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
+from .tokens import get_token_lookup_hash
 from .types import AppExtensionMount, AppExtensionTarget, AppType
 
 
@@ -138,12 +139,16 @@ class AppToken(models.Model):
     name = models.CharField(blank=True, default="", max_length=128)
     auth_token = models.CharField(unique=True, max_length=128)
     token_last_4 = models.CharField(max_length=4)
+    # SHA-256 of the raw token used to narrow down the candidate rows before the
+    # slow password hash is checked. Empty for tokens created before it was added.
+    token_hash = models.CharField(max_length=64, null=True, blank=True, db_index=True)
 
     objects = AppTokenManager()
 
     def set_auth_token(self, raw_token=None):
         self.auth_token = make_password(raw_token)
         self.token_last_4 = raw_token[-4:]
+        self.token_hash = get_token_lookup_hash(raw_token)
 
 
 class AppExtension(models.Model):
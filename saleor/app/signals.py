@@ -1,6 +1,16 @@
 from ..core.tasks import delete_from_storage_task
+from .tokens import verified_app_tokens
 
 
 def delete_brand_images(sender, instance, **kwargs):
     if img := instance.brand_logo_default:
         delete_from_storage_task.delay(img.name)
+
+
+def forget_verified_app_token(sender, instance, **kwargs):
+    verified_app_tokens.delete_matching(lambda value: value[0] == instance.auth_token)
+
+
+def forget_verified_inactive_app_tokens(sender, instance, **kwargs):
+    if not instance.is_active:
+        verified_app_tokens.delete_matching(lambda value: value[1] == instance.pk)
@@ -0,0 +1,88 @@
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth.hashers import check_password
+
+from ..models import AppToken
+from ..tokens import check_app_token, get_token_lookup_hash, verified_app_tokens
+
+
+@pytest.fixture(autouse=True)
+def _clear_verified_app_tokens():
+    verified_app_tokens.clear()
+    yield
+    verified_app_tokens.clear()
+
+
+def test_set_auth_token_sets_lookup_hash(app):
+    # when
+    token, raw_token = AppToken.objects.create_with_token(app=app)
+
+    # then
+    assert token.token_hash == get_token_lookup_hash(raw_token)
+    assert token.token_hash != raw_token
+
+
+@patch("saleor.app.tokens.check_password", wraps=check_password)
+def test_check_app_token_uses_cached_verification(mocked_check_password, app):
+    # given
+    token, raw_token = AppToken.objects.create_with_token(app=app)
+
+    # when
+    first_result = check_app_token(raw_token, token.auth_token, app.pk)
+    second_result = check_app_token(raw_token, token.auth_token, app.pk)
+
+    # then
+    assert first_result is True
+    assert second_result is True
+    mocked_check_password.assert_called_once_with(raw_token, token.auth_token)
+
+
+def test_check_app_token_invalid_token_not_cached(app):
+    # given
+    token, _ = AppToken.objects.create_with_token(app=app)
+
+    # when
+    result = check_app_token("invalid-token", token.auth_token, app.pk)
+
+    # then
+    assert result is False
+    assert len(verified_app_tokens) == 0
+
+
+def test_check_app_token_cached_verification_for_other_hash(app):
+    # given
+    token, raw_token = AppToken.objects.create_with_token(app=app)
+    check_app_token(raw_token, token.auth_token, app.pk)
+    other_token, _ = AppToken.objects.create_with_token(app=app)
+
+    # when
+    result = check_app_token(raw_token, other_token.auth_token, app.pk)
+
+    # then
+    assert result is False
+
+
+def test_deleting_app_token_removes_cached_verification(app):
+    # given
+    token, raw_token = AppToken.objects.create_with_token(app=app)
+    check_app_token(raw_token, token.auth_token, app.pk)
+
+    # when
+    token.delete()
+
+    # then
+    assert len(verified_app_tokens) == 0
+
+
+def test_deactivating_app_removes_cached_verifications(app):
+    # given
+    token, raw_token = AppToken.objects.create_with_token(app=app)
+    check_app_token(raw_token, token.auth_token, app.pk)
+
+    # when
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+
+    # then
+    assert len(verified_app_tokens) == 0
@@ -0,0 +1,54 @@
+import hashlib
+import hmac
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password
+
+from ..core.utils.lru_cache import LRUCache
+
+# Successful app token verifications, keyed by an HMAC of the raw token. Values are
+# `(auth_token, app_id)` tuples, where `auth_token` is the stored password hash the
+# raw token was verified against.
+verified_app_tokens = LRUCache(
+    maxsize=settings.APP_TOKEN_VERIFICATION_CACHE_SIZE,
+    ttl=settings.APP_TOKEN_VERIFICATION_CACHE_TTL,
+)
+
+
+def get_token_lookup_hash(raw_token: str) -> str:
+    """Return a non-reversible digest used to find the token row in the database."""
+    return hashlib.sha256(raw_token.encode()).hexdigest()
+
+
+def _get_verification_cache_key(raw_token: str) -> str:
+    return hmac.new(
+        settings.SECRET_KEY.encode(), raw_token.encode(), hashlib.sha256
+    ).hexdigest()
+
+
+def check_app_token(raw_token: str, auth_token: str, app_id: int) -> bool:
+    """Check the raw token against the stored hash, skipping known good pairs.
+
+    A cached verification is only used when the stored hash is still the same, so
+    a token row that was removed or regenerated is never matched from the cache.
+    """
+    cache_key = _get_verification_cache_key(raw_token)
+    if verified_app_tokens.get(cache_key) == (auth_token, app_id):
+        return True
+    if not check_password(raw_token, auth_token):
+        return False
+    verified_app_tokens.set(cache_key, (auth_token, app_id))
+    return True
+
+
+def set_missing_token_lookup_hash(token_id: int, raw_token: str):
+    """Store the lookup hash of a token created before the hash was introduced.
+
+    Called once the raw token is verified, so the token is matched by its hash
+    instead of the last four characters from then on.
+    """
+    from .models import AppToken
+
+    AppToken.objects.filter(pk=token_id, token_hash__isnull=True).update(
+        token_hash=get_token_lookup_hash(raw_token)
+    )
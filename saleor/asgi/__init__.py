@@ -8,6 +8,7 @@ https://docs.djangoproject.com/en/3.1/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
 from .cors_handler import cors_handler
@@ -18,5 +19,10 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "saleor.settings")
 
 application = get_asgi_application()
 application = health_check(application, "/health/")  # type: ignore[arg-type] # Django's ASGI app is less strict than the spec # noqa: E501
-application = gzip_compression(application)
+application = gzip_compression(
+    application,
+    minimum_size=settings.RESPONSE_COMPRESSION_MINIMUM_SIZE,
+    compresslevel=settings.RESPONSE_COMPRESSION_LEVEL,
+    thread_minimum_size=settings.RESPONSE_COMPRESSION_THREAD_MINIMUM_SIZE,
+)
 application = cors_handler(application)
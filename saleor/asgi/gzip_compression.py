@@ -1,9 +1,11 @@
 # adapted from Starlette's GZipMiddleware
 # Starlette does not work with Django's case-sensitive headers
 
+import asyncio
 import gzip
 import io
-from typing import Optional
+import zlib
+from typing import Callable, Optional, Union
 
 from asgiref.typing import (
     ASGI3Application,
@@ -15,9 +17,112 @@ from asgiref.typing import (
 )
 
 
+class GzipCompressor:
+    def __init__(self, compresslevel: int):
+        self.buffer = io.BytesIO()
+        self.file = gzip.GzipFile(
+            mode="wb", fileobj=self.buffer, compresslevel=compresslevel
+        )
+
+    def compress(self, data: bytes, last: bool) -> bytes:
+        self.file.write(data)
+        if last:
+            self.file.close()
+        compressed = self.buffer.getvalue()
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        return compressed
+
+
+class DeflateCompressor:
+    def __init__(self, compresslevel: int):
+        self.compressobj = zlib.compressobj(compresslevel)
+
+    def compress(self, data: bytes, last: bool) -> bytes:
+        compressed = self.compressobj.compress(data)
+        if last:
+            compressed += self.compressobj.flush()
+        return compressed
+
+
+Compressor = Union[GzipCompressor, DeflateCompressor]
+
+# Supported encodings in the order of preference when the client accepts several
+# of them with the same quality.
+COMPRESSORS: dict[bytes, Callable[[int], Compressor]] = {
+    b"gzip": GzipCompressor,
+    b"deflate": DeflateCompressor,
+}
+
+
+def negotiate_encoding(accepted_encoding: bytes) -> Optional[bytes]:
+    """Return the supported encoding with the highest quality accepted by the client.
+
+    Follows the `Accept-Encoding` rules of RFC 9110: encodings with `q=0` are
+    not acceptable and `*` matches any encoding that is not listed explicitly.
+    """
+    qualities: dict[bytes, float] = {}
+    for item in accepted_encoding.split(b","):
+        coding, *params = item.strip().split(b";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.strip().partition(b"=")
+            if name.strip().lower() == b"q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    wildcard_quality = qualities.get(b"*", 0.0)
+    best_encoding, best_quality = None, 0.0
+    for encoding in COMPRESSORS:
+        quality = qualities.get(encoding, wildcard_quality)
+        if quality > best_quality:
+            best_encoding, best_quality = encoding, quality
+    return best_encoding
+
+
 def gzip_compression(
-    app: ASGI3Application, minimum_size: int = 500, compresslevel: int = 9
+    app: ASGI3Application,
+    minimum_size: int = 500,
+    compresslevel: int = 9,
+    thread_minimum_size: Optional[int] = None,
 ) -> ASGI3Application:
+    """Compress HTTP responses with the best encoding accepted by the client.
+
+    Bodies shorter than `minimum_size` are sent uncompressed. Chunks of at least
+    `thread_minimum_size` bytes are compressed in a worker thread so that
+    compressing large responses does not block the event loop.
+    """
+
+    async def compress(compressor: Compressor, data: bytes, last: bool) -> bytes:
+        if thread_minimum_size is not None and len(data) >= thread_minimum_size:
+            return await asyncio.to_thread(compressor.compress, data, last)
+        return compressor.compress(data, last)
+
+    def set_encoding_headers(
+        start_message: HTTPResponseStartEvent,
+        encoding: bytes,
+        content_length: Optional[int],
+    ) -> None:
+        headers = [
+            (key, value)
+            for key, value in start_message["headers"]
+            if key.lower() not in (b"content-length", b"content-encoding")
+        ]
+        headers.append((b"content-encoding", encoding))
+        if content_length is not None:
+            headers.append((b"content-length", str(content_length).encode("latin-1")))
+        for index, (key, value) in enumerate(headers):
+            if key.lower() == b"vary":
+                if b"accept-encoding" not in value.lower():
+                    headers[index] = (key, value + b", Accept-Encoding")
+                break
+        start_message["headers"] = headers
+
     async def gzip_compression_wrapper(
         scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable
     ) -> None:
@@ -30,14 +135,12 @@ def gzip_compression(
                 ),
                 b"",
             )
-            if b"gzip" in accepted_encoding:
+            encoding = negotiate_encoding(accepted_encoding)
+            if encoding is not None:
                 start_message: Optional[HTTPResponseStartEvent] = None
                 content_encoding_set = False
                 started = False
-                gzip_buffer = io.BytesIO()
-                gzip_file = gzip.GzipFile(
-                    mode="wb", fileobj=gzip_buffer, compresslevel=compresslevel
-                )
+                compressor = COMPRESSORS[encoding](compresslevel)
 
                 async def send_compressed(message: ASGISendEvent) -> None:
                     nonlocal content_encoding_set
@@ -65,78 +168,32 @@ def gzip_compression(
                         body = message.get("body", b"")
                         more_body = message.get("more_body", False)
                         if len(body) < minimum_size and not more_body:
-                            # Don't apply GZip to small outgoing responses.
+                            # Don't compress small outgoing responses.
                             await send(start_message)
                             await send(message)
                         elif not more_body:
-                            # Standard GZip response.
-                            gzip_file.write(body)
-                            gzip_file.close()
-                            body = gzip_buffer.getvalue()
-
-                            headers = start_message["headers"]
-                            headers = [
-                                (key, value)
-                                for key, value in headers
-                                if key.lower()
-                                not in (b"content-length", b"content-encoding")
-                            ]
-                            headers.append((b"content-encoding", b"gzip"))
-                            headers.append(
-                                (
-                                    b"content-length",
-                                    str(len(body)).encode("latin-1"),
-                                )
-                            )
-                            for key, value in headers:
-                                if key.lower() == b"vary":
-                                    if b"Accept-Encoding" not in value:
-                                        value += b", Accept-Encoding"
-                                        break
-                            start_message["headers"] = headers
-
+                            # Standard compressed response.
+                            body = await compress(compressor, body, last=True)
+                            set_encoding_headers(start_message, encoding, len(body))
                             message["body"] = body
-
                             await send(start_message)
                             await send(message)
                         else:
-                            # Initial body in streaming GZip response.
-                            headers = start_message["headers"]
-                            headers = [
-                                (key, value)
-                                for key, value in headers
-                                if key.lower()
-                                not in (b"content-length", b"content-encoding")
-                            ]
-                            headers.append((b"content-encoding", b"gzip"))
-                            for key, value in headers:
-                                if key.lower() == b"vary":
-                                    if b"Accept-Encoding" not in value:
-                                        value += b", Accept-Encoding"
-                                        break
-                            start_message["headers"] = headers
-
-                            gzip_file.write(body)
-                            message["body"] = gzip_buffer.getvalue()
-                            gzip_buffer.seek(0)
-                            gzip_buffer.truncate()
-
+                            # Initial body in streaming compressed response.
+                            set_encoding_headers(start_message, encoding, None)
+                            message["body"] = await compress(
+                                compressor, body, last=False
+                            )
                             await send(start_message)
                             await send(message)
 
                     elif message["type"] == "http.response.body":
-                        # Remaining body in streaming GZip response.
+                        # Remaining body in streaming compressed response.
                         body = message.get("body", b"")
                         more_body = message.get("more_body", False)
-
-                        gzip_file.write(body)
-                        if not more_body:
-                            gzip_file.close()
-
-                        message["body"] = gzip_buffer.getvalue()
-                        gzip_buffer.seek(0)
-                        gzip_buffer.truncate()
-
+                        message["body"] = await compress(
+                            compressor, body, last=not more_body
+                        )
                         await send(message)
 
                 await app(scope, receive, send_compressed)
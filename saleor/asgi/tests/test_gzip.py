@@ -1,14 +1,22 @@
+import asyncio
 import gzip
+import time
+import zlib
+from unittest import mock
 
+import pytest
 from asgiref.typing import (
     ASGI3Application,
+    ASGIReceiveCallable,
     ASGIReceiveEvent,
+    ASGISendCallable,
     HTTPResponseBodyEvent,
     HTTPResponseStartEvent,
     HTTPScope,
+    Scope,
 )
 
-from ..gzip_compression import gzip_compression
+from ..gzip_compression import gzip_compression, negotiate_encoding
 
 
 def build_scope(origin: str, encodings: bytes) -> HTTPScope:
@@ -86,3 +94,117 @@ async def test_with_supported_compression(large_asgi_app: ASGI3Application, sett
             type="http.response.body", body=expected_payload, more_body=False
         ),
     ]
+
+
+def build_app(chunks: list[bytes]) -> ASGI3Application:
+    async def fake_app(
+        scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable
+    ) -> None:
+        await send(
+            HTTPResponseStartEvent(
+                type="http.response.start",
+                status=200,
+                headers=[(b"content-type", b"text/plain"), (b"vary", b"Origin")],
+                trailers=False,
+            )
+        )
+        for index, chunk in enumerate(chunks):
+            await send(
+                HTTPResponseBodyEvent(
+                    type="http.response.body",
+                    body=chunk,
+                    more_body=index < len(chunks) - 1,
+                )
+            )
+
+    return fake_app
+
+
+@pytest.mark.parametrize(
+    ("accepted_encoding", "expected_encoding"),
+    [
+        (b"", None),
+        (b"identity", None),
+        (b"gzip", b"gzip"),
+        (b"deflate", b"deflate"),
+        (b"gzip, deflate, br", b"gzip"),
+        (b"gzip;q=0.5, deflate", b"deflate"),
+        (b"GZIP;Q=0", None),
+        (b"*", b"gzip"),
+        (b"*;q=0.1, gzip;q=0", b"deflate"),
+    ],
+)
+def test_negotiate_encoding(accepted_encoding, expected_encoding):
+    assert negotiate_encoding(accepted_encoding) == expected_encoding
+
+
+async def test_with_deflate_compression(large_asgi_app: ASGI3Application):
+    app = gzip_compression(large_asgi_app)
+    events = await run_app(app, build_scope("http://localhost:3000", b"deflate"))
+    start, body = events
+    assert (b"content-encoding", b"deflate") in start["headers"]
+    assert zlib.decompress(body["body"]) == 10000 * b"x"
+
+
+async def test_streaming_compression():
+    # given
+    chunks = [index * 1000 * b"x" for index in range(5)]
+    app = gzip_compression(build_app(chunks))
+
+    # when
+    events = await run_app(app, build_scope("http://localhost:3000", b"gzip"))
+
+    # then
+    start, *bodies = events
+    assert start["headers"] == [
+        (b"content-type", b"text/plain"),
+        (b"vary", b"Origin, Accept-Encoding"),
+        (b"content-encoding", b"gzip"),
+    ]
+    assert [body["more_body"] for body in bodies] == [True] * 4 + [False]
+    compressed = b"".join(body["body"] for body in bodies)
+    assert gzip.decompress(compressed) == b"".join(chunks)
+
+
+@mock.patch("saleor.asgi.gzip_compression.asyncio.to_thread", wraps=asyncio.to_thread)
+async def test_compression_of_large_bodies_in_thread(mocked_to_thread):
+    # given
+    small_body, large_body = 1000 * b"x", 100_000 * b"x"
+    app = gzip_compression(
+        build_app([small_body, large_body]), thread_minimum_size=10_000
+    )
+
+    # when
+    events = await run_app(app, build_scope("http://localhost:3000", b"gzip"))
+
+    # then
+    _, *bodies = events
+    compressed = b"".join(body["body"] for body in bodies)
+    assert gzip.decompress(compressed) == small_body + large_body
+    mocked_to_thread.assert_called_once()
+    assert mocked_to_thread.call_args.args[1] == large_body
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("compresslevel", [1, 6, 9])
+@pytest.mark.parametrize("payload_size", [1_000, 100_000, 1_000_000])
+async def test_compression_throughput(payload_size, compresslevel, record_property):
+    # given
+    payload = b"".join(
+        b'{"id": "UHJvZHVjdDo%d", "name": "Product %d"},' % (index, index)
+        for index in range(payload_size // 40)
+    )[:payload_size]
+    app = gzip_compression(
+        build_app([payload]), compresslevel=compresslevel, thread_minimum_size=0
+    )
+    scope = build_scope("http://localhost:3000", b"gzip")
+
+    # when
+    start = time.perf_counter()
+    events = await run_app(app, scope)
+    duration = time.perf_counter() - start
+
+    # then
+    record_property("megabytes_per_second", len(payload) / duration / 1_000_000)
+    record_property("compression_ratio", len(payload) / len(events[1]["body"]))
+    assert gzip.decompress(events[1]["body"]) == payload
@@ -0,0 +1,48 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class AttributeAppConfig(AppConfig):
+    name = "saleor.attribute"
+
+    def ready(self):
+        self.connect_sort_keys_signals()
+
+    def connect_sort_keys_signals(self):
+        from ..product.models import Product
+        from .models import Attribute, AttributeProduct, AttributeValue
+        from .sort_keys import (
+            handle_attribute_change,
+            handle_attribute_value_save,
+            handle_product_save,
+            handle_product_type_attributes_change,
+        )
+
+        post_save.connect(
+            handle_product_save,
+            sender=Product,
+            dispatch_uid="update_attribute_sort_keys_on_product_save",
+        )
+        post_save.connect(
+            handle_attribute_value_save,
+            sender=AttributeValue,
+            dispatch_uid="update_attribute_sort_keys_on_attribute_value_save",
+        )
+        for model in [AttributeValue, AttributeProduct]:
+            model_name = model._meta.model_name
+            post_delete.connect(
+                handle_attribute_change,
+                sender=model,
+                dispatch_uid=f"update_attribute_sort_keys_on_{model_name}_delete",
+            )
+        post_save.connect(
+            handle_attribute_change,
+            sender=AttributeProduct,
+            dispatch_uid="update_attribute_sort_keys_on_attributeproduct_save",
+        )
+        # Adding attributes to product types creates assignments in bulk.
+        m2m_changed.connect(
+            handle_product_type_attributes_change,
+            sender=Attribute.product_types.through,
+            dispatch_uid="update_attribute_sort_keys_on_product_types_change",
+        )
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from ....product.models import Product
+from ...sort_keys import SORT_KEYS_BATCH_SIZE, update_products_attribute_sort_keys
+
+
+class Command(BaseCommand):
+    help = "Populate the sort keys used for sorting products by attributes."
+
+    def handle(self, *args, **options):
+        products = Product.objects.order_by("pk")
+        updated_count = 0
+        last_id = 0
+        while True:
+            product_ids = list(
+                products.filter(pk__gt=last_id).values_list("pk", flat=True)[
+                    :SORT_KEYS_BATCH_SIZE
+                ]
+            )
+            if not product_ids:
+                break
+            last_id = product_ids[-1]
+            update_products_attribute_sort_keys(product_ids)
+            updated_count += len(product_ids)
+            self.stdout.write(f"Updated sort keys of {updated_count} products")
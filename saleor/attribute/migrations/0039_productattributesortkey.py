@@ -0,0 +1,55 @@
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("product", "0189_merge_20230929_0857"),
+        ("attribute", "0038_remove_assignedproductattribute"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductAttributeSortKey",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("sort_key", models.TextField(blank=True, default="")),
+                ("bucket", models.PositiveSmallIntegerField()),
+                (
+                    "attribute",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="product_sort_keys",
+                        to="attribute.attribute",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="attribute_sort_keys",
+                        to="product.product",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("product", "attribute")},
+            },
+        ),
+        migrations.AddIndex(
+            model_name="productattributesortkey",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                fields=["attribute", "bucket", "sort_key"],
+                name="prodattrsortkey_sort_key_idx",
+            ),
+        ),
+    ]
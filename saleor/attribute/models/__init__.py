@@ -5,7 +5,11 @@ from .base import (
     AttributeValueTranslation,
 )
 from .page import AssignedPageAttributeValue, AttributePage
-from .product import AssignedProductAttributeValue, AttributeProduct
+from .product import (
+    AssignedProductAttributeValue,
+    AttributeProduct,
+    ProductAttributeSortKey,
+)
 from .product_variant import (
     AssignedVariantAttribute,
     AssignedVariantAttributeValue,
@@ -21,6 +25,7 @@ __all__ = [
     "AttributePage",
     "AssignedProductAttributeValue",
     "AttributeProduct",
+    "ProductAttributeSortKey",
     "AssignedVariantAttribute",
     "AssignedVariantAttributeValue",
     "AttributeVariant",
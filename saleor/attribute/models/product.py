@@ -32,6 +32,34 @@ class AssignedProductAttributeValue(SortableModel):
         return self.product.attributevalues.all()
 
 
+class ProductAttributeSortKey(models.Model):
+    """Precomputed key used for sorting products by values of an attribute.
+
+    Rows exist for attributes assigned to the product's type or having values
+    assigned to the product; see `saleor.attribute.sort_keys`.
+    """
+
+    product = models.ForeignKey(
+        Product, related_name="attribute_sort_keys", on_delete=models.CASCADE
+    )
+    attribute = models.ForeignKey(
+        "Attribute", related_name="product_sort_keys", on_delete=models.CASCADE
+    )
+    # Names of the assigned values, joined in the order of the attribute's values.
+    sort_key = models.TextField(blank=True, default="")
+    # 0 when the product has values of the attribute, 1 when it has none.
+    bucket = models.PositiveSmallIntegerField()
+
+    class Meta:
+        unique_together = (("product", "attribute"),)
+        indexes = [
+            BTreeIndex(
+                fields=["attribute", "bucket", "sort_key"],
+                name="prodattrsortkey_sort_key_idx",
+            )
+        ]
+
+
 class AttributeProduct(SortableModel):
     attribute = models.ForeignKey(
         "Attribute", related_name="attributeproduct", on_delete=models.CASCADE
@@ -0,0 +1,229 @@
+"""Precomputed keys for sorting products by values of an attribute.
+
+Sorting products by an attribute aggregates names of the values assigned to every
+product matching the filters before the first page can be returned. When
+`PRODUCT_ATTRIBUTE_SORT_KEYS_ENABLED` is set, `ProductsQueryset.sort_by_attribute`
+joins a single `ProductAttributeSortKey` row per product instead, and reads the
+listing in the order of the `(attribute, bucket, sort_key)` index.
+
+Keys are refreshed in Celery tasks once the transaction is committed: for
+a product when it is created or its attribute values are assigned, and for all
+products with an attribute when its values are renamed, reordered or deleted, or
+when it is assigned to or removed from a product type. A refresh scheduled while
+another one for the same object is still queued is dropped, as the queued task
+reads the data only once it starts.
+
+Keys of existing products are populated with the `update_product_attribute_sort_keys`
+management command before enabling the setting.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+
+from ..product.models import Product
+from .models import (
+    AssignedProductAttributeValue,
+    AttributeProduct,
+    AttributeValue,
+    ProductAttributeSortKey,
+)
+
+# Buckets order products having values of the attribute first, then products
+# whose type has the attribute but which have no values, then all the others.
+BUCKET_WITH_VALUES = 0
+BUCKET_WITHOUT_VALUES = 1
+BUCKET_NOT_ASSIGNED = 2
+
+SORT_KEYS_BATCH_SIZE = 500
+
+PRODUCT_FIELDS_TO_PREFETCH = [
+    "attributevalues__value",
+    "product_type__attributeproduct",
+]
+
+SORT_KEYS_UPDATE_PENDING_CACHE_KEY_PREFIX = "attribute_sort_keys_update_pending"
+# Limits how long refreshes are dropped when a queued task is lost.
+SORT_KEYS_UPDATE_PENDING_TIMEOUT = 60 * 60
+
+
+def _get_value_ordering(value: AttributeValue):
+    # Mirrors `AttributeValue.Meta.ordering`, with nulls sorted last as in Postgres.
+    return (value.sort_order is None, value.sort_order or 0, value.pk)
+
+
+def prepare_product_attribute_sort_keys(
+    product: Product,
+) -> list[ProductAttributeSortKey]:
+    """Return sort keys of the product, which has `PRODUCT_FIELDS_TO_PREFETCH`."""
+    values_by_attribute_id: defaultdict[int, list[AttributeValue]] = defaultdict(list)
+    for assigned_value in product.attributevalues.all():
+        value = assigned_value.value
+        values_by_attribute_id[value.attribute_id].append(value)
+    attribute_ids = set(values_by_attribute_id)
+    attribute_ids.update(
+        attribute_product.attribute_id
+        for attribute_product in product.product_type.attributeproduct.all()
+    )
+
+    sort_keys = []
+    for attribute_id in sorted(attribute_ids):
+        values = sorted(
+            values_by_attribute_id.get(attribute_id, []), key=_get_value_ordering
+        )
+        sort_key = ",".join(value.name for value in values)
+        sort_keys.append(
+            ProductAttributeSortKey(
+                product=product,
+                attribute_id=attribute_id,
+                sort_key=sort_key,
+                bucket=BUCKET_WITH_VALUES if sort_key else BUCKET_WITHOUT_VALUES,
+            )
+        )
+    return sort_keys
+
+
+def update_products_attribute_sort_keys(product_ids: Iterable[int]):
+    product_ids = list(product_ids)
+    with transaction.atomic():
+        # SELECT … FOR UPDATE needs to lock rows in a consistent order
+        # to avoid deadlocks between updates touching the same rows.
+        products = list(
+            Product.objects.select_for_update(of=("self",))
+            .filter(pk__in=product_ids)
+            .order_by("pk")
+            .prefetch_related(*PRODUCT_FIELDS_TO_PREFETCH)
+        )
+        ProductAttributeSortKey.objects.filter(product_id__in=product_ids).delete()
+        ProductAttributeSortKey.objects.bulk_create(
+            [
+                sort_key
+                for product in products
+                for sort_key in prepare_product_attribute_sort_keys(product)
+            ]
+        )
+
+
+def get_products_with_attribute(attribute_id: int):
+    """Return products whose sort keys for the attribute may need a refresh."""
+    return Product.objects.filter(
+        Q(
+            Exists(
+                AttributeProduct.objects.filter(
+                    product_type_id=OuterRef("product_type_id"),
+                    attribute_id=attribute_id,
+                )
+            )
+        )
+        | Q(
+            Exists(
+                AssignedProductAttributeValue.objects.filter(
+                    product_id=OuterRef("id"), value__attribute_id=attribute_id
+                )
+            )
+        )
+        | Q(
+            Exists(
+                ProductAttributeSortKey.objects.filter(
+                    product_id=OuterRef("id"), attribute_id=attribute_id
+                )
+            )
+        )
+    )
+
+
+def update_attribute_sort_keys(attribute_id: int):
+    products = get_products_with_attribute(attribute_id).order_by("pk")
+    last_id = 0
+    while True:
+        product_ids = list(
+            products.filter(pk__gt=last_id).values_list("pk", flat=True)[
+                :SORT_KEYS_BATCH_SIZE
+            ]
+        )
+        if not product_ids:
+            break
+        last_id = product_ids[-1]
+        update_products_attribute_sort_keys(product_ids)
+
+
+def _get_pending_cache_key(name: str, pk: int) -> str:
+    return f"{SORT_KEYS_UPDATE_PENDING_CACHE_KEY_PREFIX}:{name}:{pk}"
+
+
+def clear_sort_keys_update_pending(name: str, pks: Iterable[int]):
+    """Allow scheduling refreshes again, once the task is about to read the data."""
+    cache.delete_many([_get_pending_cache_key(name, pk) for pk in pks])
+
+
+def _enqueue_sort_keys_update(name: str, pks: list[int], task):
+    pending_pks = [
+        pk
+        for pk in pks
+        if cache.add(
+            _get_pending_cache_key(name, pk), True, SORT_KEYS_UPDATE_PENDING_TIMEOUT
+        )
+    ]
+    if pending_pks:
+        task.delay(pending_pks)
+
+
+def schedule_products_attribute_sort_keys_update(product_ids: Iterable[int]):
+    if not settings.PRODUCT_ATTRIBUTE_SORT_KEYS_ENABLED:
+        return
+    from .tasks import update_products_attribute_sort_keys_task
+
+    transaction.on_commit(
+        partial(
+            _enqueue_sort_keys_update,
+            "product",
+            list(product_ids),
+            update_products_attribute_sort_keys_task,
+        )
+    )
+
+
+def schedule_attributes_sort_keys_update(attribute_ids: Iterable[int]):
+    if not settings.PRODUCT_ATTRIBUTE_SORT_KEYS_ENABLED:
+        return
+    from .tasks import update_attributes_sort_keys_task
+
+    transaction.on_commit(
+        partial(
+            _enqueue_sort_keys_update,
+            "attribute",
+            list(attribute_ids),
+            update_attributes_sort_keys_task,
+        )
+    )
+
+
+def handle_product_save(sender, instance, created, **kwargs):
+    if created:
+        schedule_products_attribute_sort_keys_update([instance.pk])
+
+
+def handle_attribute_value_save(sender, instance, created, update_fields, **kwargs):
+    if created:
+        return
+    if update_fields is None or {"name", "sort_order"}.intersection(update_fields):
+        schedule_attributes_sort_keys_update([instance.attribute_id])
+
+
+def handle_attribute_change(sender, instance, **kwargs):
+    schedule_attributes_sort_keys_update([instance.attribute_id])
+
+
+def handle_product_type_attributes_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action != "post_add":
+        return
+    # Forward changes are made through `Attribute.product_types`.
+    attribute_ids = pk_set if reverse else [instance.pk]
+    schedule_attributes_sort_keys_update(attribute_ids)
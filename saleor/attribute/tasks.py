@@ -4,6 +4,11 @@ from django.db.models import Exists, OuterRef, Q
 from ..attribute.models import AttributeValue
 from ..celeryconf import app
 from ..product.models import Product, ProductVariant
+from .sort_keys import (
+    clear_sort_keys_update_pending,
+    update_attribute_sort_keys,
+    update_products_attribute_sort_keys,
+)
 
 task_logger = get_task_logger(__name__)
 
@@ -29,3 +34,16 @@ def update_associated_products_search_vector(attribute_value_pk: int):
         Q(Exists(instance.productvalueassignment.filter(product_id=OuterRef("id"))))
         | Q(Exists(variants.filter(product_id=OuterRef("id"))))
     ).update(search_index_dirty=True)
+
+
+@app.task
+def update_products_attribute_sort_keys_task(product_ids: list[int]):
+    clear_sort_keys_update_pending("product", product_ids)
+    update_products_attribute_sort_keys(product_ids)
+
+
+@app.task
+def update_attributes_sort_keys_task(attribute_ids: list[int]):
+    clear_sort_keys_update_pending("attribute", attribute_ids)
+    for attribute_id in attribute_ids:
+        update_attribute_sort_keys(attribute_id)
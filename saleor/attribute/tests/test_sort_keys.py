@@ -0,0 +1,271 @@
+import time
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ...product import ProductTypeKind
+from ...product.models import Product, ProductType
+from ..models import Attribute, AttributeValue, ProductAttributeSortKey
+from ..sort_keys import (
+    BUCKET_WITH_VALUES,
+    BUCKET_WITHOUT_VALUES,
+    clear_sort_keys_update_pending,
+    schedule_attributes_sort_keys_update,
+)
+from ..utils import associate_attribute_values_to_instance
+
+
+@pytest.fixture
+def _product_attribute_sort_keys(settings):
+    settings.PRODUCT_ATTRIBUTE_SORT_KEYS_ENABLED = True
+
+
+@pytest.fixture
+def sortable_attribute(db):
+    attribute = Attribute.objects.create(name="Size", slug="size")
+    AttributeValue.objects.bulk_create(
+        [
+            AttributeValue(attribute=attribute, name=name, slug=name, sort_order=index)
+            for index, name in enumerate(["M", "S", "L"])
+        ]
+    )
+    return attribute
+
+
+@pytest.fixture
+def sortable_products(sortable_attribute, category):
+    product_type = ProductType.objects.create(
+        name="Shirts", slug="shirts", kind=ProductTypeKind.NORMAL
+    )
+    other_product_type = ProductType.objects.create(
+        name="Mugs", slug="mugs", kind=ProductTypeKind.NORMAL
+    )
+    product_type.product_attributes.add(sortable_attribute)
+    products = Product.objects.bulk_create(
+        [
+            Product(
+                name=name,
+                slug=name.lower(),
+                product_type=product_type,
+                category=category,
+            )
+            for name in ["Large", "Small", "Medium", "No size"]
+        ]
+        + [
+            Product(
+                name="Mug",
+                slug="mug",
+                product_type=other_product_type,
+                category=category,
+            )
+        ]
+    )
+    large, small, medium, *_ = products
+    values = {value.name: value for value in sortable_attribute.values.all()}
+    associate_attribute_values_to_instance(large, sortable_attribute, values["L"])
+    associate_attribute_values_to_instance(
+        small, sortable_attribute, values["S"], values["M"]
+    )
+    associate_attribute_values_to_instance(medium, sortable_attribute, values["M"])
+    return products
+
+
+def _get_sort_keys(attribute):
+    return {
+        product_name: (sort_key, bucket)
+        for product_name, sort_key, bucket in ProductAttributeSortKey.objects.filter(
+            attribute=attribute
+        ).values_list("product__name", "sort_key", "bucket")
+    }
+
+
+def test_update_product_attribute_sort_keys_command(
+    sortable_attribute, sortable_products
+):
+    # when
+    call_command("update_product_attribute_sort_keys")
+
+    # then
+    assert _get_sort_keys(sortable_attribute) == {
+        "Large": ("L", BUCKET_WITH_VALUES),
+        "Small": ("M,S", BUCKET_WITH_VALUES),
+        "Medium": ("M", BUCKET_WITH_VALUES),
+        "No size": ("", BUCKET_WITHOUT_VALUES),
+    }
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_sort_by_attribute_using_sort_keys_matches_aggregation(
+    descending, sortable_attribute, sortable_products, settings
+):
+    # given
+    call_command("update_product_attribute_sort_keys")
+    products = Product.objects.all()
+    expected_names = list(
+        products.sort_by_attribute(sortable_attribute.pk, descending).values_list(
+            "name", flat=True
+        )
+    )
+    settings.PRODUCT_ATTRIBUTE_SORT_KEYS_ENABLED = True
+
+    # when
+    names = list(
+        products.sort_by_attribute(sortable_attribute.pk, descending).values_list(
+            "name", flat=True
+        )
+    )
+
+    # then
+    assert names == expected_names
+    assert names[:3] == (
+        ["Large", "Medium", "Small"] if not descending else ["Mug", "No size", "Small"]
+    )
+
+
+@pytest.mark.usefixtures("_product_attribute_sort_keys")
+def test_sort_keys_updated_on_assigning_values(
+    sortable_attribute, sortable_products, django_capture_on_commit_callbacks
+):
+    # given
+    _, _, _, product_without_size, _ = sortable_products
+    value = sortable_attribute.values.get(name="S")
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        associate_attribute_values_to_instance(
+            product_without_size, sortable_attribute, value
+        )
+
+    # then
+    assert _get_sort_keys(sortable_attribute)["No size"] == ("S", BUCKET_WITH_VALUES)
+
+
+@pytest.mark.usefixtures("_product_attribute_sort_keys")
+def test_sort_keys_updated_on_renaming_value(
+    sortable_attribute, sortable_products, django_capture_on_commit_callbacks
+):
+    # given
+    call_command("update_product_attribute_sort_keys")
+    value = sortable_attribute.values.get(name="L")
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        value.name = "XL"
+        value.save(update_fields=["name"])
+
+    # then
+    assert _get_sort_keys(sortable_attribute)["Large"] == ("XL", BUCKET_WITH_VALUES)
+
+
+@pytest.mark.usefixtures("_product_attribute_sort_keys")
+def test_sort_keys_updated_on_deleting_value(
+    sortable_attribute, sortable_products, django_capture_on_commit_callbacks
+):
+    # given
+    call_command("update_product_attribute_sort_keys")
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        sortable_attribute.values.filter(name="M").delete()
+
+    # then
+    sort_keys = _get_sort_keys(sortable_attribute)
+    assert sort_keys["Small"] == ("S", BUCKET_WITH_VALUES)
+    assert sort_keys["Medium"] == ("", BUCKET_WITHOUT_VALUES)
+
+
+@pytest.mark.usefixtures("_product_attribute_sort_keys")
+def test_sort_keys_updated_on_assigning_attribute_to_product_type(
+    sortable_attribute, sortable_products, django_capture_on_commit_callbacks
+):
+    # given
+    call_command("update_product_attribute_sort_keys")
+    *_, mug = sortable_products
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        mug.product_type.product_attributes.add(sortable_attribute)
+
+    # then
+    assert _get_sort_keys(sortable_attribute)["Mug"] == ("", BUCKET_WITHOUT_VALUES)
+
+
+@pytest.mark.usefixtures("_product_attribute_sort_keys")
+def test_sort_keys_updated_on_removing_attribute_from_product_type(
+    sortable_attribute, sortable_products, django_capture_on_commit_callbacks
+):
+    # given
+    call_command("update_product_attribute_sort_keys")
+    _, _, _, product_without_size, _ = sortable_products
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        product_without_size.product_type.product_attributes.remove(sortable_attribute)
+
+    # then
+    sort_keys = _get_sort_keys(sortable_attribute)
+    assert "No size" not in sort_keys
+    assert sort_keys["Large"] == ("L", BUCKET_WITH_VALUES)
+
+
+@pytest.mark.usefixtures("_product_attribute_sort_keys")
+@mock.patch("saleor.attribute.tasks.update_attributes_sort_keys_task.delay")
+def test_schedule_attributes_sort_keys_update_skips_queued_updates(
+    mocked_task, sortable_attribute, django_capture_on_commit_callbacks
+):
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        schedule_attributes_sort_keys_update([sortable_attribute.pk])
+        schedule_attributes_sort_keys_update([sortable_attribute.pk])
+
+    # then
+    mocked_task.assert_called_once_with([sortable_attribute.pk])
+    clear_sort_keys_update_pending("attribute", [sortable_attribute.pk])
+
+
+@pytest.mark.parametrize("sort_keys_enabled", [False, True])
+def test_sort_by_attribute_page_benchmark(
+    sort_keys_enabled, sortable_attribute, category, settings, record_property
+):
+    # given
+    product_type = ProductType.objects.create(
+        name="Benchmark", slug="benchmark", kind=ProductTypeKind.NORMAL
+    )
+    product_type.product_attributes.add(sortable_attribute)
+    values = list(sortable_attribute.values.all())
+    products = Product.objects.bulk_create(
+        [
+            Product(
+                name=f"Product {index}",
+                slug=f"product-{index}",
+                product_type=product_type,
+                category=category,
+            )
+            for index in range(500)
+        ]
+    )
+    for index, product in enumerate(products):
+        associate_attribute_values_to_instance(
+            product, sortable_attribute, values[index % len(values)]
+        )
+    call_command("update_product_attribute_sort_keys")
+    settings.PRODUCT_ATTRIBUTE_SORT_KEYS_ENABLED = sort_keys_enabled
+
+    # when
+    with CaptureQueriesContext(connection) as queries:
+        start = time.perf_counter()
+        page = list(
+            Product.objects.sort_by_attribute(sortable_attribute.pk).values_list(
+                "pk", flat=True
+            )[:20]
+        )
+        duration = time.perf_counter() - start
+
+    # then
+    record_property("duration_ms", duration * 1000)
+    assert len(page) == 20
+    assert len(queries) == 1
+    assert ("GROUP BY" in queries[0]["sql"]) is not sort_keys_enabled
@@ -14,6 +14,7 @@ from .models import (
     AttributeValue,
     AttributeVariant,
 )
+from .sort_keys import schedule_products_attribute_sort_keys_update
 
 T_INSTANCE = Union[Product, ProductVariant, Page]
 
@@ -122,6 +123,7 @@ def _associate_attribute_to_instance(
         )
 
         sort_assigned_attribute_values(instance, attribute, values)
+        schedule_products_attribute_sort_keys_update([instance.pk])
         return None
 
     if isinstance(instance, ProductVariant):
@@ -11,9 +11,13 @@ from typing import (
 )
 from uuid import UUID
 
+from django.db.models import Prefetch
+
 from ..core.utils.lazyobjects import lazy_no_retry
 from ..discount import DiscountType, VoucherType
 from ..discount.interface import fetch_variant_rules_info, fetch_voucher_info
+from ..discount.models import PromotionRuleTranslation, PromotionTranslation
+from ..product.models import ProductChannelListing, ProductVariantChannelListing
 from ..shipping.interface import ShippingMethodData
 from ..shipping.models import ShippingMethod, ShippingMethodChannelListing
 from ..shipping.utils import (
@@ -32,10 +36,8 @@ if TYPE_CHECKING:
     from ..product.models import (
         Collection,
         Product,
-        ProductChannelListing,
         ProductType,
         ProductVariant,
-        ProductVariantChannelListing,
     )
     from ..tax.models import TaxClass, TaxConfiguration
     from .models import Checkout, CheckoutLine
@@ -232,14 +234,36 @@ def fetch_checkout_lines(
     from .utils import get_voucher_for_checkout
 
     select_related_fields = ["variant__product__product_type__tax_class"]
-    prefetch_related_fields = [
+    # Only the listings of the checkout channel and the translations in the checkout
+    # language are used, so the other ones are not fetched at all.
+    prefetch_related_fields: list[Union[str, Prefetch]] = [
         "variant__product__collections",
-        "variant__product__channel_listings__channel",
+        Prefetch(
+            "variant__product__channel_listings",
+            queryset=ProductChannelListing.objects.filter(
+                channel_id=checkout.channel_id
+            ).select_related("channel"),
+        ),
         "variant__product__product_type__tax_class__country_rates",
         "variant__product__tax_class__country_rates",
-        "variant__channel_listings__channel",
-        "variant__channel_listings__variantlistingpromotionrule__promotion_rule__promotion__translations",
-        "variant__channel_listings__variantlistingpromotionrule__promotion_rule__translations",
+        Prefetch(
+            "variant__channel_listings",
+            queryset=ProductVariantChannelListing.objects.filter(
+                channel_id=checkout.channel_id
+            ).select_related("channel"),
+        ),
+        Prefetch(
+            "variant__channel_listings__variantlistingpromotionrule__promotion_rule__promotion__translations",
+            queryset=PromotionTranslation.objects.filter(
+                language_code=checkout.language_code
+            ),
+        ),
+        Prefetch(
+            "variant__channel_listings__variantlistingpromotionrule__promotion_rule__translations",
+            queryset=PromotionRuleTranslation.objects.filter(
+                language_code=checkout.language_code
+            ),
+        ),
         "discounts",
     ]
     if prefetch_variant_attributes:
@@ -0,0 +1,146 @@
+import time
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ...channel.models import Channel
+from ...discount.models import PromotionRuleTranslation, PromotionTranslation
+from ...product.models import (
+    ProductChannelListing,
+    ProductVariantChannelListing,
+    VariantChannelListingPromotionRule,
+)
+from ..fetch import fetch_checkout_lines
+
+
+def _list_variant_in_channels(variant, promotion_rule, channels_count):
+    channels = Channel.objects.bulk_create(
+        [
+            Channel(
+                name=f"Channel {index}",
+                slug=f"channel-{index}",
+                currency_code="USD",
+                default_country="US",
+            )
+            for index in range(channels_count)
+        ]
+    )
+    ProductChannelListing.objects.bulk_create(
+        [
+            ProductChannelListing(
+                product=variant.product,
+                channel=channel,
+                currency=channel.currency_code,
+                is_published=True,
+            )
+            for channel in channels
+        ]
+    )
+    variant_listings = ProductVariantChannelListing.objects.bulk_create(
+        [
+            ProductVariantChannelListing(
+                variant=variant,
+                channel=channel,
+                currency=channel.currency_code,
+                price_amount=Decimal("10"),
+            )
+            for channel in channels
+        ]
+    )
+    VariantChannelListingPromotionRule.objects.bulk_create(
+        [
+            VariantChannelListingPromotionRule(
+                variant_channel_listing=listing,
+                promotion_rule=promotion_rule,
+                discount_amount=Decimal("5"),
+                currency=listing.currency,
+            )
+            for listing in variant_listings
+        ]
+    )
+
+
+def test_fetch_checkout_lines_prefetches_only_checkout_channel_listings(
+    checkout_with_item, channel_PLN
+):
+    # given
+    checkout = checkout_with_item
+    variant = checkout.lines.get().variant
+    ProductChannelListing.objects.create(
+        product=variant.product, channel=channel_PLN, currency="PLN"
+    )
+    ProductVariantChannelListing.objects.create(
+        variant=variant, channel=channel_PLN, currency="PLN", price_amount=10
+    )
+
+    # when
+    lines_info, _ = fetch_checkout_lines(checkout)
+
+    # then
+    [line_info] = lines_info
+    [variant_listing] = line_info.variant.channel_listings.all()
+    [product_listing] = line_info.product.channel_listings.all()
+    assert line_info.channel_listing == variant_listing
+    assert variant_listing.channel_id == checkout.channel_id
+    assert product_listing.channel_id == checkout.channel_id
+
+
+def test_fetch_checkout_lines_prefetches_translations_in_checkout_language(
+    checkout_with_item_on_promotion,
+):
+    # given
+    checkout = checkout_with_item_on_promotion
+    checkout.language_code = "pl"
+    checkout.save(update_fields=["language_code"])
+    listing_rule = VariantChannelListingPromotionRule.objects.get()
+    rule = listing_rule.promotion_rule
+    for language_code in ["pl", "de"]:
+        PromotionTranslation.objects.create(
+            promotion=rule.promotion, language_code=language_code, name=language_code
+        )
+        PromotionRuleTranslation.objects.create(
+            promotion_rule=rule, language_code=language_code, name=language_code
+        )
+
+    # when
+    lines_info, _ = fetch_checkout_lines(checkout)
+
+    # then
+    [line_info] = lines_info
+    [rule_info] = line_info.rules_info
+    assert rule_info.promotion_translation.language_code == "pl"
+    assert rule_info.rule_translation.language_code == "pl"
+    assert [
+        translation.language_code
+        for translation in rule_info.promotion.translations.all()
+    ] == ["pl"]
+
+
+@pytest.mark.parametrize("channels_count", [10, 40])
+def test_fetch_checkout_lines_queries_do_not_depend_on_channels_count(
+    channels_count, checkout_with_item_on_promotion, record_property
+):
+    # given
+    checkout = checkout_with_item_on_promotion
+    variant = checkout.lines.get().variant
+    promotion_rule = VariantChannelListingPromotionRule.objects.get().promotion_rule
+    with CaptureQueriesContext(connection) as single_channel_queries:
+        fetch_checkout_lines(checkout)
+
+    _list_variant_in_channels(variant, promotion_rule, channels_count)
+
+    # when
+    with CaptureQueriesContext(connection) as queries:
+        start = time.perf_counter()
+        lines_info, _ = fetch_checkout_lines(checkout)
+        duration = time.perf_counter() - start
+
+    # then
+    record_property("duration_ms", duration * 1000)
+    [line_info] = lines_info
+    assert len(line_info.variant.channel_listings.all()) == 1
+    assert len(line_info.product.channel_listings.all()) == 1
+    assert len(line_info.rules_info) == 1
+    assert len(queries) == len(single_channel_queries)
@@ -17,6 +17,12 @@ class CoreAppConfig(AppConfig):
         if settings.SENTRY_DSN:
             settings.SENTRY_INIT(settings.SENTRY_DSN, settings.SENTRY_OPTS)
         self.validate_jwt_manager()
+        self.connect_reference_data_signals()
+
+    def connect_reference_data_signals(self):
+        from .reference_data import connect_reference_data_signals
+
+        connect_reference_data_signals()
 
     def validate_jwt_manager(self):
         jwt_manager_path = getattr(settings, "JWT_MANAGER_PATH", None)
@@ -1,7 +1,15 @@
 import json
-from typing import Callable
+import zlib
+from typing import Callable, Optional, Union
 
-from django.db.models import JSONField
+from django.db.models import BinaryField, JSONField
+
+# The first byte of a value stored by `CompressedTextField` marks its format.
+TEXT_FORMAT_PLAIN = b"p"
+TEXT_FORMAT_ZLIB = b"z"
+# Shorter values are stored uncompressed, as compressing them saves only few bytes.
+TEXT_COMPRESSION_MIN_LENGTH = 256
+TEXT_COMPRESSION_LEVEL = 6
 
 
 class SanitizedJSONField(JSONField):
@@ -20,3 +28,43 @@ class SanitizedJSONField(JSONField):
     def get_db_prep_save(self, value: dict, connection):
         """Sanitize the value for saving using the passed sanitizer."""
         return json.dumps(self._sanitizer_method(value))
+
+
+def compress_text(value: str) -> bytes:
+    data = value.encode("utf-8")
+    if len(data) < TEXT_COMPRESSION_MIN_LENGTH:
+        return TEXT_FORMAT_PLAIN + data
+    return TEXT_FORMAT_ZLIB + zlib.compress(data, TEXT_COMPRESSION_LEVEL)
+
+
+def decompress_text(value: Union[bytes, memoryview]) -> str:
+    data = bytes(value)
+    text_format, data = data[:1], data[1:]
+    if text_format == TEXT_FORMAT_ZLIB:
+        data = zlib.decompress(data)
+    elif text_format != TEXT_FORMAT_PLAIN:
+        raise ValueError(f"Unknown format of compressed text: {text_format!r}.")
+    return data.decode("utf-8")
+
+
+class CompressedTextField(BinaryField):
+    description = "A text field stored compressed with zlib in a binary column."
+
+    def get_prep_value(self, value: Optional[str]):
+        value = super().get_prep_value(value)
+        if isinstance(value, str):
+            return compress_text(value)
+        return value
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return decompress_text(value)
+
+    def to_python(self, value):
+        if isinstance(value, (bytes, memoryview)):
+            return decompress_text(value)
+        return value
+
+    def value_to_string(self, obj):
+        return self.value_from_object(obj)
@@ -0,0 +1,36 @@
+import datetime
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from ...partitioning import get_start_of_day, partition_event_tables
+
+
+class Command(BaseCommand):
+    help = (
+        "Convert tables of webhook event payloads, deliveries and delivery attempts "
+        "into tables partitioned by the day of creation. Rows created before the "
+        "conversion stay in the existing tables, which are dropped once they are "
+        "older than the value set in EVENT_PAYLOAD_DELETE_PERIOD."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=1,
+            help=(
+                "Number of days from today after which rows are stored in daily "
+                "partitions. The conversion has to finish before that day."
+            ),
+        )
+
+    def handle(self, **options):
+        boundary = get_start_of_day(
+            timezone.now().date() + datetime.timedelta(days=options["days"])
+        )
+        models = partition_event_tables(boundary)
+        if not models:
+            self.stdout.write("Event tables are already partitioned.")
+        for model in models:
+            self.stdout.write(f"Partitioned {model._meta.db_table}.")
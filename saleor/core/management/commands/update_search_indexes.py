@@ -1,6 +1,7 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 
 from ...search_tasks import (
+    get_product_id_ranges,
     set_order_search_document_values,
     set_product_search_document_values,
     set_user_search_document_values,
@@ -10,10 +11,29 @@ from ...search_tasks import (
 class Command(BaseCommand):
     help = "Populate search indexes."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help=(
+                "Number of task chains updating products in parallel. Each chain "
+                "processes a separate range of product IDs."
+            ),
+        )
+
     def handle(self, *args, **options):
+        workers = options["workers"]
+        if workers < 1:
+            raise CommandError("The number of workers must be a positive integer.")
+
         # Update products
         self.stdout.write("Updating products")
-        set_product_search_document_values.delay()
+        if workers == 1:
+            set_product_search_document_values.delay()
+        else:
+            for min_id, max_id in get_product_id_ranges(workers):
+                set_product_search_document_values.delay(0, min_id, max_id)
 
         # Update orders
         self.stdout.write("Updating orders")
@@ -0,0 +1,45 @@
+# Generated by Django 3.2.23 on 2026-10-16 12:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0010_drop_vatlayer_tables"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventDeliveryPendingPayload",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("object_model", models.CharField(max_length=255)),
+                ("object_id", models.CharField(max_length=255)),
+                (
+                    "requestor_model",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                (
+                    "requestor_id",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                (
+                    "delivery",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pending_payload",
+                        to="core.eventdelivery",
+                    ),
+                ),
+            ],
+        ),
+    ]
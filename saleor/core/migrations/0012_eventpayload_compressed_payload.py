@@ -0,0 +1,29 @@
+# Generated by Django 3.2.23 on 2026-10-16 14:00
+
+from django.db import migrations, models
+
+import saleor.core.db.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0011_eventdeliverypendingpayload"),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name="eventpayload",
+            old_name="payload",
+            new_name="legacy_payload",
+        ),
+        migrations.AlterField(
+            model_name="eventpayload",
+            name="legacy_payload",
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="eventpayload",
+            name="payload",
+            field=saleor.core.db.fields.CompressedTextField(null=True),
+        ),
+    ]
@@ -7,6 +7,7 @@ from django.db import models, transaction
 from django.db.models import F, JSONField, Max, Q
 
 from . import EventDeliveryStatus, JobStatus
+from .db.fields import CompressedTextField
 from .utils.json_serializer import CustomJsonEncoder
 
 
@@ -143,9 +144,19 @@ class Job(models.Model):
 
 
 class EventPayload(models.Model):
-    payload = models.TextField()
+    payload = CompressedTextField(null=True)
+    # Uncompressed payloads stored before compression was introduced.
+    legacy_payload = models.TextField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        loaded_values = instance.__dict__
+        if "payload" in loaded_values and instance.payload is None:
+            instance.payload = loaded_values.get("legacy_payload")
+        return instance
+
 
 class EventDelivery(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
@@ -164,6 +175,23 @@ class EventDelivery(models.Model):
         ordering = ("-created_at",)
 
 
+class EventDeliveryPendingPayload(models.Model):
+    """Reference to the object for which the delivery payload is not generated yet.
+
+    Subscription payloads of deferred deliveries are generated by the worker sending
+    the delivery, from the objects read from the database once the transaction that
+    triggered the event has been committed.
+    """
+
+    delivery = models.OneToOneField(
+        EventDelivery, related_name="pending_payload", on_delete=models.CASCADE
+    )
+    object_model = models.CharField(max_length=255)
+    object_id = models.CharField(max_length=255)
+    requestor_model = models.CharField(max_length=255, null=True, blank=True)
+    requestor_id = models.CharField(max_length=255, null=True, blank=True)
+
+
 class EventDeliveryAttempt(models.Model):
     delivery = models.ForeignKey(
         EventDelivery, related_name="attempts", null=True, on_delete=models.CASCADE
@@ -0,0 +1,267 @@
+"""Partitioning of webhook event tables by the day of creation.
+
+Payloads, deliveries and delivery attempts of async webhooks are deleted once they
+are older than `EVENT_PAYLOAD_DELETE_PERIOD`. Deleting them in batches leaves dead
+rows behind in the tables and their indexes, so the tables can be converted with
+the `partition_event_tables` command into tables partitioned by the day of
+`created_at`. `delete_event_payloads_task` then drops whole expired partitions and
+creates the partitions of the following `EVENT_PARTITIONS_CREATED_AHEAD_DAYS` days.
+
+The existing table is attached as the partition of all rows created before the
+conversion, without copying them, and is dropped once all of them expire. Primary
+keys of partitioned tables have to include `created_at`, so the foreign keys
+referencing the converted tables are dropped and deletes cascade only through
+the ORM. Rows of a delivery that fall into a later partition than the delivery,
+e.g. attempts made after midnight, are dropped together with their own partition.
+"""
+
+import datetime
+import re
+from typing import Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import (
+    EventDelivery,
+    EventDeliveryAttempt,
+    EventDeliveryPendingPayload,
+    EventPayload,
+)
+
+EVENT_PARTITIONED_MODELS = [EventPayload, EventDelivery, EventDeliveryAttempt]
+PARTITION_KEY = "created_at"
+
+PARTITION_UPPER_BOUND_RE = re.compile(r"TO \('([^']+)'\)")
+
+
+def _quote(name: str) -> str:
+    return connection.ops.quote_name(name)
+
+
+def get_start_of_day(day: datetime.date) -> datetime.datetime:
+    return datetime.datetime.combine(
+        day, datetime.time.min, tzinfo=datetime.timezone.utc
+    )
+
+
+def is_partitioned(model) -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)",
+            [model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    return row is not None and row[0] == "p"
+
+
+def get_partitions(model) -> list[tuple[str, Optional[datetime.datetime]]]:
+    """Return names of partitions of the model's table with their upper bounds.
+
+    The upper bound of the default partition is None.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+            "FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(%s)",
+            [model._meta.db_table],
+        )
+        rows = cursor.fetchall()
+    partitions = []
+    for name, bound in rows:
+        match = PARTITION_UPPER_BOUND_RE.search(bound)
+        partitions.append((name, parse_datetime(match.group(1)) if match else None))
+    return partitions
+
+
+def create_partitions(model, until: datetime.date) -> list[str]:
+    """Create daily partitions following the last one, up to the given day.
+
+    Days with rows already stored in the default partition are skipped, as their
+    partition can't be attached; the rows are deleted once they expire.
+    """
+    table = model._meta.db_table
+    default_table = f"{table}_default"
+    upper_bounds = [bound for _, bound in get_partitions(model) if bound is not None]
+    day = (
+        max(upper_bounds).astimezone(datetime.timezone.utc).date()
+        if upper_bounds
+        else timezone.now().date()
+    )
+    created = []
+    with connection.cursor() as cursor:
+        while day <= until:
+            start = get_start_of_day(day)
+            end = get_start_of_day(day + datetime.timedelta(days=1))
+            day += datetime.timedelta(days=1)
+            cursor.execute(
+                f"SELECT EXISTS (SELECT 1 FROM {_quote(default_table)} "
+                f"WHERE {PARTITION_KEY} >= %s AND {PARTITION_KEY} < %s)",
+                [start, end],
+            )
+            if cursor.fetchone()[0]:
+                continue
+            name = f"{table}_p{start:%Y%m%d}"
+            cursor.execute(
+                f"CREATE TABLE {_quote(name)} PARTITION OF {_quote(table)} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+            created.append(name)
+    return created
+
+
+def drop_expired_partitions(model, expiration: datetime.datetime) -> list[str]:
+    """Drop partitions with rows created before the expiration date only.
+
+    Expired rows of the default partition, which stores rows without a daily
+    partition, are deleted.
+    """
+    dropped = []
+    with connection.cursor() as cursor:
+        for name, upper_bound in get_partitions(model):
+            if upper_bound is None:
+                cursor.execute(
+                    f"DELETE FROM {_quote(name)} WHERE {PARTITION_KEY} < %s",
+                    [expiration],
+                )
+            elif upper_bound <= expiration:
+                cursor.execute(f"DROP TABLE {_quote(name)}")
+                dropped.append(name)
+    return dropped
+
+
+def manage_event_partitions():
+    now = timezone.now()
+    expiration = now - settings.EVENT_PAYLOAD_DELETE_PERIOD
+    until = now.date() + datetime.timedelta(
+        days=settings.EVENT_PARTITIONS_CREATED_AHEAD_DAYS
+    )
+    for model in EVENT_PARTITIONED_MODELS:
+        create_partitions(model, until)
+        drop_expired_partitions(model, expiration)
+    EventDeliveryPendingPayload.objects.filter(
+        ~Exists(EventDelivery.objects.filter(pk=OuterRef("delivery_id")))
+    ).delete()
+
+
+def _get_check_constraint_name(table: str) -> str:
+    return f"{table}_partition_check"
+
+
+def _get_partition_key_index_name(table: str) -> str:
+    return f"{table}_id_{PARTITION_KEY}_key"
+
+
+def prepare_partitioning(model, boundary: datetime.datetime, concurrently=True):
+    """Validate the existing table as the partition of rows before the boundary.
+
+    Constraints and indexes required to attach the table are created without
+    locking out writes for the time of scanning it.
+    """
+    table = model._meta.db_table
+    check_name = _get_check_constraint_name(table)
+    index_name = _get_partition_key_index_name(table)
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, table)
+        if check_name not in constraints:
+            cursor.execute(
+                f"ALTER TABLE {_quote(table)} ADD CONSTRAINT {_quote(check_name)} "
+                f"CHECK ({PARTITION_KEY} < '{boundary.isoformat()}') NOT VALID"
+            )
+        cursor.execute(
+            f"ALTER TABLE {_quote(table)} VALIDATE CONSTRAINT {_quote(check_name)}"
+        )
+        cursor.execute(
+            f"CREATE UNIQUE INDEX {'CONCURRENTLY ' if concurrently else ''}"
+            f"IF NOT EXISTS {_quote(index_name)} "
+            f"ON {_quote(table)} (id, {PARTITION_KEY})"
+        )
+
+
+def _drop_foreign_keys_to(cursor, model):
+    table = model._meta.db_table
+    for relation in model._meta.related_objects:
+        related_table = relation.related_model._meta.db_table
+        constraints = connection.introspection.get_constraints(cursor, related_table)
+        for name, constraint in constraints.items():
+            if constraint["foreign_key"] and constraint["foreign_key"][0] == table:
+                cursor.execute(
+                    f"ALTER TABLE {_quote(related_table)} "
+                    f"DROP CONSTRAINT {_quote(name)}"
+                )
+
+
+def _convert_to_partitioned_table(cursor, model, boundary: datetime.datetime):
+    table = model._meta.db_table
+    legacy_table = f"{table}_legacy"
+    cursor.execute(f"ALTER TABLE {_quote(table)} RENAME TO {_quote(legacy_table)}")
+    cursor.execute(
+        f"CREATE TABLE {_quote(table)} "
+        f"(LIKE {_quote(legacy_table)} INCLUDING DEFAULTS) "
+        f"PARTITION BY RANGE ({PARTITION_KEY})"
+    )
+    cursor.execute(
+        f"ALTER TABLE {_quote(table)} "
+        f"ADD CONSTRAINT {_quote(f'{table}_partitioned_pkey')} "
+        f"PRIMARY KEY (id, {PARTITION_KEY})"
+    )
+    # The sequence would be dropped together with the legacy partition.
+    cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [legacy_table])
+    (sequence,) = cursor.fetchone()
+    cursor.execute(f"ALTER SEQUENCE {sequence} OWNED BY {_quote(table)}.id")
+    for field in model._meta.concrete_fields:
+        if field.db_index and not field.primary_key:
+            cursor.execute(
+                f"CREATE INDEX {_quote(f'{table}_{field.column}_part_idx')} "
+                f"ON {_quote(table)} ({_quote(field.column)})"
+            )
+    # The primary key of a partition has to match the one of the partitioned table.
+    constraints = connection.introspection.get_constraints(cursor, legacy_table)
+    for name, constraint in constraints.items():
+        if constraint["primary_key"]:
+            cursor.execute(
+                f"ALTER TABLE {_quote(legacy_table)} DROP CONSTRAINT {_quote(name)}"
+            )
+    cursor.execute(
+        f"ALTER TABLE {_quote(legacy_table)} "
+        f"ADD CONSTRAINT {_quote(f'{legacy_table}_pkey')} "
+        f"PRIMARY KEY USING INDEX {_quote(_get_partition_key_index_name(table))}"
+    )
+    # Existing indexes on the same columns are attached instead of being rebuilt.
+    cursor.execute(
+        f"ALTER TABLE {_quote(table)} ATTACH PARTITION {_quote(legacy_table)} "
+        f"FOR VALUES FROM (MINVALUE) TO ('{boundary.isoformat()}')"
+    )
+    cursor.execute(
+        f"CREATE TABLE {_quote(f'{table}_default')} "
+        f"PARTITION OF {_quote(table)} DEFAULT"
+    )
+
+
+def partition_event_tables(boundary: datetime.datetime, concurrently=True):
+    """Convert event tables into tables partitioned by the day of creation.
+
+    Rows created before the boundary stay in the existing tables, which become
+    partitions of the new ones; the boundary has to be later than the conversion.
+    """
+    models = [model for model in EVENT_PARTITIONED_MODELS if not is_partitioned(model)]
+    for model in models:
+        prepare_partitioning(model, boundary, concurrently=concurrently)
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            for model in models:
+                cursor.execute(
+                    f"LOCK TABLE {_quote(model._meta.db_table)} "
+                    "IN ACCESS EXCLUSIVE MODE"
+                )
+            for model in models:
+                _drop_foreign_keys_to(cursor, model)
+            for model in models:
+                _convert_to_partitioned_table(cursor, model, boundary)
+    manage_event_partitions()
+    return models
@@ -7,7 +7,7 @@ from django.contrib.postgres.search import (
     SearchVector,
     SearchVectorCombinable,
 )
-from django.db.models import Expression
+from django.db.models import BooleanField, Expression, FloatField, Func, Value
 
 logger = logging.getLogger(__name__)
 
@@ -139,3 +139,82 @@ class FlatConcat(Expression):
 class FlatConcatSearchVector(FlatConcat):
     max_expression_count = settings.INDEX_MAXIMUM_EXPR_COUNT
     silent_drop_expression = True
+
+
+class RowValueComparison(Expression):
+    """Compare a row of expressions with a row of values, e.g. ``(a, b) > (1, 2)``.
+
+    Unlike the equivalent ``a > 1 OR (a = 1 AND b > 2)`` condition, PostgreSQL can
+    use a row comparison as a range scan of a B-tree index on the same columns.
+    None of the compared expressions can be NULL, as NULL makes the whole row
+    comparison NULL instead of sorting the row first or last.
+    """
+
+    template = "(%(expressions)s) %(operator)s (%(values)s)"
+    arg_joiner = ", "
+    operators = ("<", ">")
+
+    conditional = True
+    contains_aggregate = False
+    contains_over_clause = False
+
+    def __init__(self, expressions, operator, values):
+        super().__init__(output_field=BooleanField())
+        if operator not in self.operators:
+            raise ValueError(f"Unsupported row comparison operator: {operator}.")
+        if len(expressions) != len(values):
+            raise ValueError("Rows of expressions and values differ in length.")
+        self.source_expressions = self._parse_expressions(*expressions)
+        self.operator = operator
+        self.values = list(values)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({self.source_expressions!r} "
+            f"{self.operator} {self.values!r})"
+        )
+
+    def get_source_expressions(self):
+        return self.source_expressions
+
+    def set_source_expressions(self, exprs):
+        self.source_expressions = exprs
+
+    def copy(self):
+        copy = super().copy()
+        copy.source_expressions = self.source_expressions[:]
+        return copy
+
+    def as_sql(self, compiler, connection, **_extra_context):
+        connection.ops.check_expression_support(self)
+        sql_parts: list[str] = []
+        params: list = []
+        value_params: list = []
+        for expression, value in zip(self.source_expressions, self.values):
+            expression_sql, expression_params = compiler.compile(expression)
+            sql_parts.append(expression_sql)
+            params.extend(expression_params)
+            value_params.append(
+                expression.output_field.get_db_prep_value(value, connection)
+            )
+        data = {
+            "expressions": self.arg_joiner.join(sql_parts),
+            "operator": self.operator,
+            "values": self.arg_joiner.join(["%s"] * len(value_params)),
+        }
+        return self.template % data, params + value_params
+
+
+class TrigramWordSimilarity(Func):
+    """Greatest similarity of the string to any extent of the expression's words.
+
+    Counterpart of the class added to `django.contrib.postgres.search` in Django 4.0.
+    """
+
+    function = "WORD_SIMILARITY"
+    output_field = FloatField()
+
+    def __init__(self, string, expression, **extra):
+        if not hasattr(string, "resolve_expression"):
+            string = Value(string)
+        super().__init__(string, expression, **extra)
@@ -0,0 +1,197 @@
+"""Process-wide snapshots of small, rarely changing tables.
+
+Channels, tax configurations, tax rates, sites with their settings and warehouses
+are read by almost every storefront request, while they change only when staff
+users update the configuration. Data loaders can opt into serving them from
+a snapshot of the whole table kept per process instead of querying the database.
+
+Snapshots are tagged with a version number stored in the Django cache. Saving or
+deleting any of the owning models bumps the version, so the next request in any
+process rebuilds the snapshot from the database. Mutations that modify these
+tables with bulk queries, which don't send model signals, call `invalidate()`
+explicitly.
+
+Snapshots are always loaded from the default database, so they are not affected
+by the replication lag of read replicas.
+"""
+
+import copy
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Model, QuerySet
+from django.db.models.signals import post_delete, post_save
+
+from ..channel.models import Channel
+from ..site.models import SiteSettings
+from ..tax.models import (
+    TaxClassCountryRate,
+    TaxConfiguration,
+    TaxConfigurationPerCountry,
+)
+from ..warehouse.models import Warehouse
+
+REFERENCE_DATA_VERSION_CACHE_KEY_PREFIX = "reference_data_version"
+
+
+class ReferenceDataSnapshot:
+    """Immutable list of objects with lazily built lookup indexes.
+
+    Objects are shared by all requests handled by the process, so lookups return
+    copies which the caller is free to modify.
+    """
+
+    def __init__(self, version: Optional[int], objects: Iterable[Model]):
+        self.version = version
+        self.objects = tuple(objects)
+        self._indexes: dict[str, dict[Any, Model]] = {}
+        self._groups: dict[str, dict[Any, list[Model]]] = {}
+
+    def index(self, field: str) -> dict[Any, Model]:
+        if field not in self._indexes:
+            self._indexes[field] = {getattr(obj, field): obj for obj in self.objects}
+        return self._indexes[field]
+
+    def group(self, field: str) -> dict[Any, list[Model]]:
+        if field not in self._groups:
+            groups: defaultdict[Any, list[Model]] = defaultdict(list)
+            for obj in self.objects:
+                groups[getattr(obj, field)].append(obj)
+            self._groups[field] = dict(groups)
+        return self._groups[field]
+
+    def get_many(self, field: str, keys: Iterable[Any]) -> list[Optional[Model]]:
+        index = self.index(field)
+        return [copy.deepcopy(index.get(key)) for key in keys]
+
+    def get_grouped(self, field: str, keys: Iterable[Any]) -> list[list[Model]]:
+        groups = self.group(field)
+        return [copy.deepcopy(groups.get(key, [])) for key in keys]
+
+
+class ReferenceData:
+    def __init__(
+        self,
+        name: str,
+        get_queryset: Callable[[], QuerySet],
+        models: Iterable[type[Model]],
+    ):
+        self.name = name
+        self.get_queryset = get_queryset
+        self.models = tuple(models)
+        self._snapshot: Optional[ReferenceDataSnapshot] = None
+        self._lock = threading.Lock()
+
+    @property
+    def version_cache_key(self) -> str:
+        return f"{REFERENCE_DATA_VERSION_CACHE_KEY_PREFIX}:{self.name}"
+
+    def get_version(self) -> int:
+        version = cache.get(self.version_cache_key)
+        if version is None:
+            # The key is seeded with a timestamp rather than zero so that a version
+            # lost on cache eviction is never reused by snapshots built before it.
+            cache.add(self.version_cache_key, time.time_ns(), None)
+            version = cache.get(self.version_cache_key)
+        return version
+
+    def bump_version(self):
+        try:
+            cache.incr(self.version_cache_key)
+        except ValueError:
+            cache.set(self.version_cache_key, time.time_ns(), None)
+
+    def invalidate(self):
+        """Mark cached snapshots as outdated in all processes.
+
+        The version is bumped only after commit, so a snapshot is never built from
+        changes that may be rolled back. Until then, the transaction that changed
+        the data reads it from the database, as snapshots are used only by requests
+        allowed to read from the replica.
+        """
+        transaction.on_commit(self.bump_version)
+
+    def load_snapshot(self, version: Optional[int] = None) -> ReferenceDataSnapshot:
+        queryset = self.get_queryset().using(settings.DATABASE_CONNECTION_DEFAULT_NAME)
+        return ReferenceDataSnapshot(version, queryset.iterator())
+
+    def get_snapshot(self) -> ReferenceDataSnapshot:
+        """Return the cached snapshot, rebuilding it when outdated."""
+        version = self.get_version()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version != version:
+                snapshot = self.load_snapshot(version)
+                self._snapshot = snapshot
+        return snapshot
+
+    def handle_change(self, sender, **kwargs):
+        self.invalidate()
+
+    def connect_signals(self):
+        for model in self.models:
+            model_name = model._meta.label_lower
+            post_save.connect(
+                self.handle_change,
+                sender=model,
+                weak=False,
+                dispatch_uid=f"invalidate_{self.name}_on_{model_name}_save",
+            )
+            post_delete.connect(
+                self.handle_change,
+                sender=model,
+                weak=False,
+                dispatch_uid=f"invalidate_{self.name}_on_{model_name}_delete",
+            )
+
+    def clear(self):
+        with self._lock:
+            self._snapshot = None
+
+
+channels = ReferenceData("channels", Channel.objects.all, [Channel])
+tax_configurations = ReferenceData(
+    "tax_configurations", TaxConfiguration.objects.all, [TaxConfiguration]
+)
+tax_configurations_per_country = ReferenceData(
+    "tax_configurations_per_country",
+    TaxConfigurationPerCountry.objects.all,
+    [TaxConfigurationPerCountry],
+)
+tax_class_country_rates = ReferenceData(
+    "tax_class_country_rates", TaxClassCountryRate.objects.all, [TaxClassCountryRate]
+)
+sites = ReferenceData(
+    "sites", lambda: Site.objects.select_related("settings"), [Site, SiteSettings]
+)
+warehouses = ReferenceData("warehouses", Warehouse.objects.all, [Warehouse])
+
+ALL_REFERENCE_DATA = [
+    channels,
+    tax_configurations,
+    tax_configurations_per_country,
+    tax_class_country_rates,
+    sites,
+    warehouses,
+]
+
+
+def connect_reference_data_signals():
+    for reference_data in ALL_REFERENCE_DATA:
+        reference_data.connect_signals()
+
+
+def clear_reference_data_snapshots():
+    for reference_data in ALL_REFERENCE_DATA:
+        reference_data.clear()
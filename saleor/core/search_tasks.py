@@ -1,4 +1,7 @@
+from typing import Optional
+
 from celery.utils.log import get_task_logger
+from django.db.models import Max, Min
 
 from ..account.models import User
 from ..account.search import prepare_user_search_document_value
@@ -80,10 +83,38 @@ def set_order_search_document_values(updated_count: int = 0) -> None:
     set_order_search_document_values.delay(updated_count)
 
 
+def get_product_id_ranges(workers: int) -> list[tuple[int, int]]:
+    """Split IDs of products without search vector into ranges for workers.
+
+    Each range is processed by a separate chain of
+    `set_product_search_document_values` tasks, so the ranges don't overlap.
+    """
+    id_bounds = Product.objects.filter(search_vector=None).aggregate(
+        min_id=Min("id"), max_id=Max("id")
+    )
+    min_id, max_id = id_bounds["min_id"], id_bounds["max_id"]
+    if min_id is None or max_id is None:
+        return []
+    step = -(-(max_id - min_id + 1) // workers)
+    return [
+        (start, min(start + step - 1, max_id))
+        for start in range(min_id, max_id + 1, step)
+    ]
+
+
 @app.task
-def set_product_search_document_values(updated_count: int = 0) -> None:
+def set_product_search_document_values(
+    updated_count: int = 0,
+    min_id: Optional[int] = None,
+    max_id: Optional[int] = None,
+) -> None:
+    lookup = {}
+    if min_id is not None:
+        lookup["id__gte"] = min_id
+    if max_id is not None:
+        lookup["id__lte"] = max_id
     products = list(
-        Product.objects.filter(search_vector=None)
+        Product.objects.filter(search_vector=None, **lookup)
         .prefetch_related(*PRODUCT_FIELDS_TO_PREFETCH)
         .order_by("-id")[:BATCH_SIZE]
     )
@@ -105,7 +136,7 @@ def set_product_search_document_values(updated_count: int = 0) -> None:
 
     del products
 
-    set_product_search_document_values.delay(updated_count)
+    set_product_search_document_values.delay(updated_count, min_id, max_id)
 
 
 def set_search_document_values(instances: list, prepare_search_document_func):
@@ -10,6 +10,7 @@ from django.utils import timezone
 
 from ..celeryconf import app
 from .models import EventDelivery, EventPayload
+from .partitioning import is_partitioned, manage_event_partitions
 
 task_logger: logging.Logger = get_task_logger(__name__)
 
@@ -26,6 +27,9 @@ def delete_from_storage_task(path):
 
 @app.task
 def delete_event_payloads_task(expiration_date=None):
+    if is_partitioned(EventPayload):
+        manage_event_partitions()
+        return
     expiration_date = expiration_date or timezone.now() + datetime.timedelta(minutes=60)
     delete_period = timezone.now() - settings.EVENT_PAYLOAD_DELETE_PERIOD
     valid_deliveries = EventDelivery.objects.filter(created_at__gt=delete_period)
@@ -0,0 +1,96 @@
+import json
+import time
+
+import pytest
+from django.db import connection
+
+from ..db.fields import TEXT_FORMAT_PLAIN, TEXT_FORMAT_ZLIB
+from ..models import EventPayload
+
+
+def _get_stored_payload(event_payload):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT payload FROM core_eventpayload WHERE id = %s", [event_payload.pk]
+        )
+        return bytes(cursor.fetchone()[0])
+
+
+def _generate_order_payload(lines_count):
+    return json.dumps(
+        {
+            "order": {
+                "id": "T3JkZXI6MQ==",
+                "lines": [
+                    {
+                        "productName": f"Product {index}",
+                        "variantName": "XL",
+                        "quantity": index,
+                        "unitPrice": {"gross": {"amount": 10.5, "currency": "USD"}},
+                    }
+                    for index in range(lines_count)
+                ],
+            }
+        }
+    )
+
+
+def test_event_payload_stored_compressed(db):
+    # given
+    payload = _generate_order_payload(100)
+
+    # when
+    event_payload = EventPayload.objects.create(payload=payload)
+
+    # then
+    stored_payload = _get_stored_payload(event_payload)
+    assert stored_payload[:1] == TEXT_FORMAT_ZLIB
+    assert len(stored_payload) < len(payload) / 5
+    assert EventPayload.objects.get().payload == payload
+
+
+def test_short_event_payload_stored_uncompressed(db):
+    # given
+    payload = '{"id": 1}'
+
+    # when
+    event_payload = EventPayload.objects.create(payload=payload)
+
+    # then
+    assert _get_stored_payload(event_payload) == TEXT_FORMAT_PLAIN + payload.encode()
+    assert EventPayload.objects.get().payload == payload
+
+
+def test_legacy_event_payload_read(db):
+    # given
+    payload = '{"id": 1}'
+    EventPayload.objects.create(legacy_payload=payload)
+
+    # when
+    event_payload = EventPayload.objects.get()
+
+    # then
+    assert event_payload.payload == payload
+
+
+@pytest.mark.parametrize("lines_count", [10, 1000])
+def test_event_payload_write_benchmark(lines_count, db, record_property):
+    # given
+    payload = _generate_order_payload(lines_count)
+    payloads_count = 100
+
+    # when
+    start = time.perf_counter()
+    EventPayload.objects.bulk_create(
+        [EventPayload(payload=payload) for _ in range(payloads_count)]
+    )
+    duration = time.perf_counter() - start
+
+    # then
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT SUM(OCTET_LENGTH(payload)) FROM core_eventpayload")
+        (stored_size,) = cursor.fetchone()
+    record_property("payload_size", len(payload))
+    record_property("stored_payload_size", stored_size / payloads_count)
+    record_property("writes_per_second", payloads_count / duration)
+    assert stored_size < len(payload) * payloads_count
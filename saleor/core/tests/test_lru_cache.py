@@ -0,0 +1,61 @@
+from freezegun import freeze_time
+
+from ..utils.lru_cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    # given
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    # when
+    cache.set("c", 3)
+
+    # then
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.hits == 3
+    assert cache.misses == 1
+
+
+def test_lru_cache_expires_entries():
+    # given
+    cache = LRUCache(maxsize=10, ttl=60)
+    with freeze_time("2023-11-20 12:00:00"):
+        cache.set("a", 1)
+
+    # when
+    with freeze_time("2023-11-20 12:01:01"):
+        value = cache.get("a")
+
+    # then
+    assert value is None
+    assert len(cache) == 0
+
+
+def test_lru_cache_delete_matching():
+    # given
+    cache = LRUCache(maxsize=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # when
+    cache.delete_matching(lambda value: value == 1)
+
+    # then
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_lru_cache_disabled_with_zero_size():
+    # given
+    cache = LRUCache(maxsize=0)
+
+    # when
+    cache.set("a", 1)
+
+    # then
+    assert cache.get("a") is None
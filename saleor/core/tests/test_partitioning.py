@@ -0,0 +1,136 @@
+import time
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from freezegun import freeze_time
+
+from ...webhook.event_types import WebhookEventAsyncType
+from ..models import (
+    EventDelivery,
+    EventDeliveryAttempt,
+    EventDeliveryPendingPayload,
+    EventPayload,
+)
+from ..partitioning import (
+    EVENT_PARTITIONED_MODELS,
+    get_partitions,
+    get_start_of_day,
+    is_partitioned,
+    partition_event_tables,
+)
+from ..tasks import delete_event_payloads_task
+
+
+def _create_events(webhook, count=1):
+    payloads = EventPayload.objects.bulk_create(
+        [EventPayload(payload='{"key": "data"}') for _ in range(count)]
+    )
+    deliveries = EventDelivery.objects.bulk_create(
+        [
+            EventDelivery(
+                event_type=WebhookEventAsyncType.ANY,
+                payload=payload,
+                webhook=webhook,
+            )
+            for payload in payloads
+        ]
+    )
+    EventDeliveryAttempt.objects.bulk_create(
+        [EventDeliveryAttempt(delivery=delivery) for delivery in deliveries]
+    )
+    return deliveries
+
+
+def _partition_event_tables_at(conversion_time):
+    with freeze_time(conversion_time):
+        boundary = get_start_of_day(conversion_time.date() + timedelta(days=1))
+        partition_event_tables(boundary, concurrently=False)
+
+
+def test_partition_event_tables(webhook, settings):
+    # given
+    settings.EVENT_PARTITIONS_CREATED_AHEAD_DAYS = 2
+    [delivery] = _create_events(webhook)
+    today = timezone.now().date()
+    boundary = get_start_of_day(today + timedelta(days=1))
+
+    # when
+    partition_event_tables(boundary, concurrently=False)
+
+    # then
+    for model in EVENT_PARTITIONED_MODELS:
+        assert is_partitioned(model)
+        table = model._meta.db_table
+        assert {name for name, _ in get_partitions(model)} == {
+            f"{table}_legacy",
+            f"{table}_default",
+            f"{table}_p{today + timedelta(days=1):%Y%m%d}",
+            f"{table}_p{today + timedelta(days=2):%Y%m%d}",
+        }
+    assert EventDelivery.objects.get().payload == delivery.payload
+    assert EventDeliveryAttempt.objects.get().delivery == delivery
+    [new_delivery] = _create_events(webhook)
+    assert new_delivery.pk > delivery.pk
+    assert EventDelivery.objects.count() == 2
+
+
+def test_delete_event_payloads_task_drops_expired_partitions(webhook, settings):
+    # given
+    settings.EVENT_PARTITIONS_CREATED_AHEAD_DAYS = 30
+    delete_period = settings.EVENT_PAYLOAD_DELETE_PERIOD
+    start_time = timezone.now()
+    _partition_event_tables_at(start_time - delete_period - timedelta(days=2))
+    with freeze_time(start_time - delete_period - timedelta(days=1)):
+        [expired_delivery] = _create_events(webhook)
+        EventDeliveryPendingPayload.objects.create(
+            delivery=expired_delivery, object_model="order.Order", object_id="1"
+        )
+    with freeze_time(start_time - delete_period + timedelta(days=1)):
+        [valid_delivery] = _create_events(webhook)
+
+    # when
+    with freeze_time(start_time):
+        delete_event_payloads_task()
+
+    # then
+    assert list(EventDelivery.objects.all()) == [valid_delivery]
+    assert EventPayload.objects.get() == valid_delivery.payload
+    assert EventDeliveryAttempt.objects.get().delivery == valid_delivery
+    assert not EventDeliveryPendingPayload.objects.exists()
+    assert all(
+        name != f"{EventPayload._meta.db_table}_legacy"
+        for name, _ in get_partitions(EventPayload)
+    )
+
+
+@pytest.mark.parametrize("partitioned", [False, True])
+def test_delete_event_payloads_benchmark(
+    partitioned, webhook, settings, record_property
+):
+    # given
+    events_count = 2000
+    settings.EVENT_PARTITIONS_CREATED_AHEAD_DAYS = 30
+    delete_period = settings.EVENT_PAYLOAD_DELETE_PERIOD
+    start_time = timezone.now()
+    if partitioned:
+        _partition_event_tables_at(start_time - delete_period - timedelta(days=2))
+
+    insert_start = time.perf_counter()
+    with freeze_time(start_time - delete_period - timedelta(days=1)):
+        _create_events(webhook, events_count)
+    insert_duration = time.perf_counter() - insert_start
+    with freeze_time(start_time - delete_period + timedelta(days=1)):
+        _create_events(webhook, events_count)
+
+    # when
+    cleanup_start = time.perf_counter()
+    with freeze_time(start_time):
+        delete_event_payloads_task()
+    cleanup_duration = time.perf_counter() - cleanup_start
+
+    # then
+    record_property("inserts_per_second", events_count / insert_duration)
+    record_property("deletes_per_second", events_count / cleanup_duration)
+    assert EventPayload.objects.count() == events_count
+    assert EventDelivery.objects.count() == events_count
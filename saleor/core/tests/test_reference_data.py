@@ -0,0 +1,85 @@
+import pytest
+
+from ...tax.models import TaxClass, TaxClassCountryRate
+from ..reference_data import (
+    channels,
+    clear_reference_data_snapshots,
+    tax_class_country_rates,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_reference_data():
+    clear_reference_data_snapshots()
+    yield
+    clear_reference_data_snapshots()
+
+
+def test_get_snapshot_is_reused(channel_USD, django_assert_num_queries):
+    # given
+    snapshot = channels.get_snapshot()
+
+    # when
+    with django_assert_num_queries(0):
+        cached_snapshot = channels.get_snapshot()
+
+    # then
+    assert cached_snapshot is snapshot
+    assert snapshot.index("slug") == {channel_USD.slug: channel_USD}
+
+
+def test_snapshot_lookups_return_copies(channel_USD):
+    # given
+    snapshot = channels.get_snapshot()
+
+    # when
+    [channel] = snapshot.get_many("slug", [channel_USD.slug])
+    channel.name = "Changed"
+
+    # then
+    assert channel == channel_USD
+    assert snapshot.index("slug")[channel_USD.slug].name == channel_USD.name
+
+
+def test_snapshot_rebuilt_after_save_is_committed(
+    channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    snapshot = channels.get_snapshot()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        channel_USD.name = "New name"
+        channel_USD.save(update_fields=["name"])
+
+    # then
+    new_snapshot = channels.get_snapshot()
+    assert new_snapshot is not snapshot
+    assert new_snapshot.index("pk")[channel_USD.pk].name == "New name"
+
+
+def test_snapshot_not_rebuilt_before_commit(channel_USD):
+    # given
+    snapshot = channels.get_snapshot()
+
+    # when
+    channel_USD.name = "New name"
+    channel_USD.save(update_fields=["name"])
+
+    # then
+    assert channels.get_snapshot() is snapshot
+
+
+def test_get_grouped_returns_empty_list_for_missing_keys(db):
+    # given
+    tax_class = TaxClass.objects.create(name="Reference data")
+    TaxClassCountryRate.objects.create(tax_class=tax_class, country="PL", rate=23)
+
+    # when
+    rates, missing = tax_class_country_rates.get_snapshot().get_grouped(
+        "tax_class_id", [tax_class.pk, -1]
+    )
+
+    # then
+    assert [rate.country.code for rate in rates] == ["PL"]
+    assert missing == []
@@ -1,8 +1,13 @@
+import pytest
+
 from ...core.postgres import FlatConcatSearchVector
 from ...core.search_tasks import (
+    get_product_id_ranges,
     set_order_search_document_values,
+    set_product_search_document_values,
     set_user_search_document_values,
 )
+from ...product.models import Product
 
 
 def test_set_user_search_document_values(customer_user, customer_user2):
@@ -48,3 +53,50 @@ def test_set_order_search_document_values_no_vector(order):
     # then
     order.refresh_from_db()
     assert order.user.email in order.search_vector
+
+
+def test_set_product_search_document_values_in_id_range(product_list):
+    # given
+    Product.objects.update(search_vector=None)
+    first_product, *other_products = sorted(product_list, key=lambda p: p.pk)
+
+    # when
+    set_product_search_document_values(
+        min_id=other_products[0].pk, max_id=other_products[-1].pk
+    )
+
+    # then
+    first_product.refresh_from_db()
+    assert first_product.search_vector is None
+    for product in other_products:
+        product.refresh_from_db()
+        assert product.search_vector
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3, 5])
+def test_get_product_id_ranges(workers, product_list):
+    # given
+    Product.objects.update(search_vector=None)
+    product_ids = sorted(product.pk for product in product_list)
+
+    # when
+    ranges = get_product_id_ranges(workers)
+
+    # then
+    assert 1 <= len(ranges) <= workers
+    assert ranges[0][0] == product_ids[0]
+    assert ranges[-1][1] == product_ids[-1]
+    for (_, previous_max_id), (next_min_id, _) in zip(ranges, ranges[1:]):
+        assert next_min_id == previous_max_id + 1
+
+
+@pytest.mark.usefixtures("product_list")
+def test_get_product_id_ranges_no_products_to_update():
+    # given
+    assert not Product.objects.filter(search_vector=None).exists()
+
+    # when
+    ranges = get_product_id_ranges(2)
+
+    # then
+    assert ranges == []
@@ -1,6 +1,7 @@
 import datetime
 import json
 import shutil
+import time
 from tempfile import NamedTemporaryFile
 from unittest.mock import ANY, MagicMock, patch
 
@@ -29,6 +30,7 @@ from ...utils.export import (
     export_voucher_codes_in_batches,
     get_filename,
     get_queryset,
+    open_file_writer,
     parse_input,
     save_csv_file_in_export_file,
 )
@@ -1150,3 +1152,89 @@ def test_export_voucher_codes_in_batches_to_xlsx(
         assert [voucher_code.code] in data
 
     shutil.rmtree(tmpdir)
+
+
+def test_open_file_writer_for_xlsx_appends_batches_to_open_workbook(tmpdir):
+    # given
+    headers = ["id", "name"]
+    temp_file = NamedTemporaryFile(suffix=".xlsx")
+    etl.io.xlsx.toxlsx(etl.wrap([headers]), temp_file.name)
+    batches = [
+        [{"id": "1", "name": "A"}, {"id": "2"}],
+        [{"id": "3", "name": "C"}],
+    ]
+
+    # when
+    with patch(
+        "saleor.csv.utils.export.openpyxl.load_workbook",
+        wraps=openpyxl.load_workbook,
+    ) as load_workbook_mock:
+        with open_file_writer(temp_file, headers, FileTypes.XLSX, ",") as writer:
+            for batch in batches:
+                writer.append(batch)
+
+    # then
+    load_workbook_mock.assert_called_once()
+    sheet = openpyxl.load_workbook(temp_file).active
+    assert list(sheet.values) == [
+        ("id", "name"),
+        ("1", "A"),
+        ("2", None),
+        ("3", "C"),
+    ]
+
+    temp_file.close()
+    shutil.rmtree(tmpdir)
+
+
+def test_open_file_writer_for_csv_appends_batches(tmpdir):
+    # given
+    headers = ["id", "name"]
+    temp_file = NamedTemporaryFile()
+    etl.tocsv(etl.wrap([headers]), temp_file.name, delimiter=";")
+
+    # when
+    with open_file_writer(temp_file, headers, FileTypes.CSV, ";") as writer:
+        writer.append([{"id": "1", "name": "A"}, {"id": "2"}])
+        writer.append([{"id": "3", "name": "C"}])
+
+    # then
+    file_content = temp_file.read().decode().split("\r\n")
+    assert file_content == ["id;name", "1;A", "2;", "3;C", ""]
+
+    temp_file.close()
+    shutil.rmtree(tmpdir)
+
+
+@pytest.mark.slow
+@pytest.mark.limit_memory("50 MB")
+@pytest.mark.parametrize("rows_count", [10_000, 100_000, 500_000])
+@pytest.mark.parametrize("file_type", [FileTypes.CSV, FileTypes.XLSX])
+def test_open_file_writer_memory_usage(rows_count, file_type, tmpdir, record_property):
+    # given
+    headers = ["id", "name", "description"]
+    temp_file = create_file_with_headers(headers, ",", file_type)
+    batch_size = 10_000
+
+    # when
+    start = time.perf_counter()
+    with open_file_writer(temp_file, headers, file_type, ",") as writer:
+        for offset in range(0, rows_count, batch_size):
+            writer.append(
+                [
+                    {
+                        "id": str(index),
+                        "name": f"Product {index}",
+                        "description": "Description of the product.",
+                    }
+                    for index in range(offset, offset + batch_size)
+                ]
+            )
+    duration = time.perf_counter() - start
+
+    # then
+    record_property("duration_s", duration)
+    record_property("file_size", temp_file.seek(0, 2))
+
+    temp_file.close()
+    shutil.rmtree(tmpdir)
@@ -1,8 +1,12 @@
+import csv
 import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import date, datetime
 from tempfile import NamedTemporaryFile
 from typing import IO, TYPE_CHECKING, Any, Optional, Union
 
+import openpyxl
 import petl as etl
 from django.utils import timezone
 
@@ -195,21 +199,22 @@ def export_products_in_batches(
     attributes = export_info.get("attributes")
     channels = export_info.get("channels")
 
-    for batch_pks in queryset_in_batches(queryset):
-        product_batch = Product.objects.filter(pk__in=batch_pks).prefetch_related(
-            "attributevalues",
-            "variants",
-            "collections",
-            "media",
-            "product_type",
-            "category",
-        )
+    with open_file_writer(temporary_file, headers, file_type, delimiter) as writer:
+        for batch_pks in queryset_in_batches(queryset):
+            product_batch = Product.objects.filter(pk__in=batch_pks).prefetch_related(
+                "attributevalues",
+                "variants",
+                "collections",
+                "media",
+                "product_type",
+                "category",
+            )
 
-        export_data = get_products_data(
-            product_batch, export_fields, attributes, warehouses, channels
-        )
+            export_data = get_products_data(
+                product_batch, export_fields, attributes, warehouses, channels
+            )
 
-        append_to_file(export_data, headers, temporary_file, file_type, delimiter)
+            writer.append(export_data)
 
 
 def export_gift_cards_in_batches(
@@ -219,12 +224,15 @@ def export_gift_cards_in_batches(
     temporary_file: Any,
     file_type: str,
 ):
-    for batch_pks in queryset_in_batches(queryset):
-        gift_card_batch = GiftCard.objects.filter(pk__in=batch_pks)
+    with open_file_writer(
+        temporary_file, export_fields, file_type, delimiter
+    ) as writer:
+        for batch_pks in queryset_in_batches(queryset):
+            gift_card_batch = GiftCard.objects.filter(pk__in=batch_pks)
 
-        export_data = list(gift_card_batch.values(*export_fields))
+            export_data = list(gift_card_batch.values(*export_fields))
 
-        append_to_file(export_data, export_fields, temporary_file, file_type, delimiter)
+            writer.append(export_data)
 
 
 def export_voucher_codes_in_batches(
@@ -234,12 +242,15 @@ def export_voucher_codes_in_batches(
     temporary_file: Any,
     file_type: str,
 ):
-    for batch_pks in queryset_in_batches(queryset):
-        voucher_codes_batch = VoucherCode.objects.filter(pk__in=batch_pks)
+    with open_file_writer(
+        temporary_file, export_fields, file_type, delimiter
+    ) as writer:
+        for batch_pks in queryset_in_batches(queryset):
+            voucher_codes_batch = VoucherCode.objects.filter(pk__in=batch_pks)
 
-        export_data = list(voucher_codes_batch.values(*export_fields))
+            export_data = list(voucher_codes_batch.values(*export_fields))
 
-        append_to_file(export_data, export_fields, temporary_file, file_type, delimiter)
+            writer.append(export_data)
 
 
 def queryset_in_batches(queryset):
@@ -261,6 +272,68 @@ def queryset_in_batches(queryset):
         start_pk = pks[-1]
 
 
+class CSVFileWriter:
+    """Append rows to a CSV file through a single open file handle."""
+
+    def __init__(self, temporary_file: Any, headers: list[str], delimiter: str):
+        self.headers = headers
+        self.file = open(temporary_file.name, "a", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file, delimiter=delimiter)
+
+    def append(self, export_data: list[dict[str, Union[str, bool]]]):
+        self.writer.writerows(
+            [row.get(header) for header in self.headers] for row in export_data
+        )
+
+    def close(self):
+        self.file.close()
+
+
+class XLSXFileWriter:
+    """Append rows to an XLSX file with an openpyxl write-only workbook.
+
+    Write-only workbooks can't be reopened, so the rows that are already in the file,
+    e.g. the headers, are copied to the new workbook first. Appended rows are streamed
+    to disk, and the file is replaced with the new workbook when the writer is closed.
+    """
+
+    def __init__(self, temporary_file: Any, headers: list[str]):
+        self.headers = headers
+        self.file_name = temporary_file.name
+        self.workbook = openpyxl.Workbook(write_only=True)
+
+        existing_workbook = openpyxl.load_workbook(self.file_name, read_only=True)
+        existing_sheet = existing_workbook.active
+        self.sheet = self.workbook.create_sheet(title=existing_sheet.title)
+        for row in existing_sheet.iter_rows(values_only=True):
+            self.sheet.append(row)
+        existing_workbook.close()
+
+    def append(self, export_data: list[dict[str, Union[str, bool]]]):
+        for row in export_data:
+            self.sheet.append([row.get(header) for header in self.headers])
+
+    def close(self):
+        self.workbook.save(self.file_name)
+
+
+@contextmanager
+def open_file_writer(
+    temporary_file: Any, headers: list[str], file_type: str, delimiter: str
+) -> Iterator[Union[CSVFileWriter, XLSXFileWriter]]:
+    """Open a writer appending rows to the file until the context is exited."""
+    writer: Union[CSVFileWriter, XLSXFileWriter]
+    if file_type == FileTypes.CSV:
+        writer = CSVFileWriter(temporary_file, headers, delimiter)
+    else:
+        writer = XLSXFileWriter(temporary_file, headers)
+
+    try:
+        yield writer
+    finally:
+        writer.close()
+
+
 def append_to_file(
     export_data: list[dict[str, Union[str, bool]]],
     headers: list[str],
@@ -268,12 +341,8 @@ def append_to_file(
     file_type: str,
     delimiter: str,
 ):
-    table = etl.fromdicts(export_data, header=headers, missing="")
-
-    if file_type == FileTypes.CSV:
-        etl.io.csv.appendcsv(table, temporary_file.name, delimiter=delimiter)
-    else:
-        etl.io.xlsx.appendxlsx(table, temporary_file.name)
+    with open_file_writer(temporary_file, headers, file_type, delimiter) as writer:
+        writer.append(export_data)
 
 
 def save_csv_file_in_export_file(
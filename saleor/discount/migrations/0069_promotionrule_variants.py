@@ -0,0 +1,33 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("product", "0189_merge_20230929_0857"),
+        ("discount", "0068_merge_20231106_1013"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="promotionrule",
+            name="variants",
+            field=models.ManyToManyField(
+                blank=True,
+                related_name="promotion_rules",
+                to="product.ProductVariant",
+            ),
+        ),
+        migrations.AddField(
+            model_name="promotionrule",
+            name="variants_dirty",
+            field=models.BooleanField(default=True),
+        ),
+        migrations.RunSQL(
+            """
+                ALTER TABLE discount_promotionrule
+                ALTER COLUMN variants_dirty
+                SET DEFAULT true;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
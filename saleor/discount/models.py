@@ -372,6 +372,13 @@ class PromotionRule(models.Model):
         blank=True,
     )
     old_channel_listing_id = models.IntegerField(blank=True, null=True, unique=True)
+    # Variants matching the catalogue predicate, kept to avoid evaluating the
+    # predicate every time discounted prices are recalculated. The relations are
+    # rebuilt when the rule is marked as dirty.
+    variants = models.ManyToManyField(
+        "product.ProductVariant", blank=True, related_name="promotion_rules"
+    )
+    variants_dirty = models.BooleanField(default=True)
 
     class Meta:
         ordering = ("name", "pk")
@@ -1,10 +1,17 @@
 from datetime import timedelta
+from unittest.mock import patch
 
+import graphene
+import pytest
+from django.db import DatabaseError
 from django.utils import timezone
 
-from ....discount.models import Promotion
+from ....discount.models import Promotion, PromotionRule
 from ....product.models import ProductVariant
-from ...utils import fetch_active_promotion_rules
+from ...utils import (
+    fetch_active_promotion_rules,
+    update_active_rules_variants_for_products,
+)
 
 
 def test_fetch_active_promotion_rules(promotion, product, channel_USD):
@@ -108,3 +115,160 @@ def test_fetch_active_promotion_rules_no_matching_rules_for_given_date(
 
     # then
     assert not rules_per_promotion
+
+
+def test_fetch_active_promotion_rules_updates_dirty_rules_variants(promotion, product):
+    # given
+    variants = ProductVariant.objects.all()
+    fixed_rule, percentage_rule = promotion.rules.all().order_by("name")
+    assert percentage_rule.variants_dirty is True
+
+    # when
+    fetch_active_promotion_rules(variants)
+
+    # then
+    fixed_rule.refresh_from_db()
+    percentage_rule.refresh_from_db()
+    assert fixed_rule.variants_dirty is False
+    assert percentage_rule.variants_dirty is False
+    assert not fixed_rule.variants.exists()
+    assert set(percentage_rule.variants.all()) == set(variants)
+
+
+@patch(
+    "saleor.graphql.discount.utils.get_variants_for_predicate",
+    side_effect=DatabaseError,
+)
+def test_fetch_active_promotion_rules_keeps_rules_dirty_on_failure(
+    get_variants_for_predicate_mock, promotion, product
+):
+    # given
+    variants = ProductVariant.objects.all()
+
+    # when
+    with pytest.raises(DatabaseError):
+        fetch_active_promotion_rules(variants)
+
+    # then
+    assert all(rule.variants_dirty for rule in promotion.rules.all())
+
+
+def test_fetch_active_promotion_rules_skips_predicates_of_clean_rules(
+    promotion, product
+):
+    # given
+    variants = ProductVariant.objects.all()
+    fetch_active_promotion_rules(variants)
+
+    # when
+    with patch(
+        "saleor.graphql.discount.utils.get_variants_for_predicate"
+    ) as get_variants_for_predicate_mock:
+        rules_per_promotion = fetch_active_promotion_rules(variants)
+
+    # then
+    get_variants_for_predicate_mock.assert_not_called()
+    rules_info = sorted(
+        rules_per_promotion[promotion.id], key=lambda info: info.rule.name
+    )
+    assert rules_info[0].variant_ids == []
+    assert set(rules_info[1].variant_ids) == {variant.id for variant in variants}
+
+
+def test_fetch_active_promotion_rules_limits_variants_to_given_queryset(
+    promotion, product, product_with_single_variant
+):
+    # given
+    variants = ProductVariant.objects.filter(product=product)
+    promotion.rules.update(
+        catalogue_predicate={
+            "productPredicate": {
+                "ids": [
+                    graphene.Node.to_global_id("Product", product.id),
+                    graphene.Node.to_global_id(
+                        "Product", product_with_single_variant.id
+                    ),
+                ]
+            }
+        }
+    )
+
+    # when
+    rules_per_promotion = fetch_active_promotion_rules(variants)
+
+    # then
+    for rule_info in rules_per_promotion[promotion.id]:
+        assert set(rule_info.variant_ids) == {variant.id for variant in variants}
+        assert rule_info.rule.variants.count() == (ProductVariant.objects.count())
+
+
+def _get_clean_product_rule(promotion, product):
+    rule = promotion.rules.get(catalogue_predicate__has_key="productPredicate")
+    rule.catalogue_predicate = {
+        "productPredicate": {"ids": [graphene.Node.to_global_id("Product", product.id)]}
+    }
+    rule.variants_dirty = False
+    rule.save(update_fields=["catalogue_predicate", "variants_dirty"])
+    rule.variants.clear()
+    return rule
+
+
+def test_update_active_rules_variants_for_products(
+    promotion, product, product_with_single_variant
+):
+    # given
+    rule = _get_clean_product_rule(promotion, product)
+    other_variant = product_with_single_variant.variants.get()
+    rule.variants.set([other_variant])
+
+    # when
+    update_active_rules_variants_for_products(
+        [product.id, product_with_single_variant.id]
+    )
+
+    # then
+    assert set(rule.variants.all()) == set(product.variants.all())
+
+
+def test_update_active_rules_variants_for_products_keeps_other_products(
+    promotion, product, product_with_single_variant
+):
+    # given
+    rule = _get_clean_product_rule(promotion, product)
+    other_variant = product_with_single_variant.variants.get()
+    rule.variants.set([other_variant])
+
+    # when
+    update_active_rules_variants_for_products([product.id])
+
+    # then
+    assert set(rule.variants.all()) == {*product.variants.all(), other_variant}
+
+
+def test_update_active_rules_variants_for_products_skips_finished_promotions(
+    promotion, product
+):
+    # given
+    rule = _get_clean_product_rule(promotion, product)
+    promotion.end_date = timezone.now() - timedelta(days=1)
+    promotion.save(update_fields=["end_date"])
+
+    # when
+    update_active_rules_variants_for_products([product.id])
+
+    # then
+    assert not rule.variants.exists()
+
+
+@patch("saleor.graphql.discount.utils.get_variants_for_predicate")
+def test_update_active_rules_variants_for_products_skips_dirty_rules(
+    get_variants_for_predicate_mock, promotion, product
+):
+    # given
+    PromotionRule.objects.update(variants_dirty=True)
+
+    # when
+    update_active_rules_variants_for_products([product.id])
+
+    # then
+    get_variants_for_predicate_mock.assert_not_called()
@@ -1,6 +1,7 @@
 import datetime
 from collections import defaultdict
 from collections.abc import Iterable, Iterator
+from copy import deepcopy
 from decimal import ROUND_HALF_UP, Decimal
 from functools import partial
 from typing import (
@@ -13,7 +14,8 @@ from typing import (
 from uuid import UUID
 
 import graphene
-from django.db.models import Exists, F, OuterRef, QuerySet
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef, Q, QuerySet
 from django.utils import timezone
 from prices import Money, TaxedMoney, fixed_discount, percentage_discount
 
@@ -507,28 +509,119 @@ def fetch_active_promotion_rules(
     variant_qs: "ProductVariantQueryset",
     date: Optional[datetime.date] = None,
 ) -> dict[UUID, list[PromotionRuleInfo]]:
-    from ..graphql.discount.utils import get_variants_for_predicate
-
     rules_info_per_promotion_id = defaultdict(list)
 
     promotions = Promotion.objects.active(date)
     rules = PromotionRule.objects.filter(
         Exists(promotions.filter(id=OuterRef("promotion_id")))
-    ).prefetch_related("channels")
+    )
+    update_rules_variants(rules.filter(variants_dirty=True))
+
     rule_to_channel_ids_map = _get_rule_to_channel_ids_map(rules)
+    rule_to_variant_ids_map = _get_rule_to_variant_ids_map(rules, variant_qs)
     for rule in rules.iterator():
-        variants = get_variants_for_predicate(rule.catalogue_predicate, variant_qs)
+        variant_ids = rule_to_variant_ids_map.get(rule.id, [])
         rules_info_per_promotion_id[rule.promotion_id].append(
             PromotionRuleInfo(
                 rule=rule,
-                variants=variants,
-                variant_ids=list(variants.values_list("id", flat=True)),
+                variants=variant_qs.filter(id__in=variant_ids),
+                variant_ids=variant_ids,
                 channel_ids=rule_to_channel_ids_map.get(rule.id, []),
             )
         )
     return rules_info_per_promotion_id
 
 
+def update_rules_variants(rules: QuerySet[PromotionRule]):
+    """Rebuild the relations between rules and variants matching their predicates.
+
+    Each rule is locked while its relations are rewritten and the dirty flag is
+    cleared in the same transaction, so a rule marked as dirty in the meantime
+    waits for the rebuild and is rebuilt again on the next call.
+    """
+    from ..graphql.discount.utils import get_variants_for_predicate
+
+    PromotionRuleVariant = PromotionRule.variants.through
+    for rule_id in list(rules.values_list("id", flat=True)):
+        with transaction.atomic():
+            rule = (
+                PromotionRule.objects.select_for_update()
+                .filter(id=rule_id, variants_dirty=True)
+                .first()
+            )
+            if rule is None:
+                continue
+            variants = get_variants_for_predicate(deepcopy(rule.catalogue_predicate))
+            PromotionRuleVariant.objects.filter(promotionrule_id=rule.id).delete()
+            PromotionRuleVariant.objects.bulk_create(
+                [
+                    PromotionRuleVariant(
+                        promotionrule_id=rule.id, productvariant_id=variant_id
+                    )
+                    for variant_id in variants.values_list("id", flat=True)
+                ],
+                ignore_conflicts=True,
+            )
+            rule.variants_dirty = False
+            rule.save(update_fields=["variants_dirty"])
+
+
+def update_active_rules_variants_for_products(product_ids: Iterable[int]):
+    """Refresh variants of the given products assigned to not finished rules.
+
+    Called by the discounted price recalculation of the products, which follows
+    changes of the products, their variants, categories or collections that the
+    catalogue predicates can refer to. Only the relations of variants of the given
+    products are rewritten; dirty rules are skipped, as they are rebuilt as a whole
+    before the prices are recalculated.
+    """
+    from ..graphql.discount.utils import get_variants_for_predicate
+
+    product_ids = list(product_ids)
+    if not product_ids:
+        return
+    promotions = Promotion.objects.filter(
+        Q(end_date__isnull=True) | Q(end_date__gt=timezone.now())
+    )
+    rules = PromotionRule.objects.filter(
+        Exists(promotions.filter(id=OuterRef("promotion_id"))), variants_dirty=False
+    ).exclude(catalogue_predicate={})
+    PromotionRuleVariant = PromotionRule.variants.through
+    for rule in rules.iterator():
+        variant_ids = set(
+            get_variants_for_predicate(deepcopy(rule.catalogue_predicate))
+            .filter(product_id__in=product_ids)
+            .values_list("id", flat=True)
+        )
+        with transaction.atomic():
+            PromotionRuleVariant.objects.filter(
+                promotionrule_id=rule.id, productvariant__product_id__in=product_ids
+            ).exclude(productvariant_id__in=variant_ids).delete()
+            PromotionRuleVariant.objects.bulk_create(
+                [
+                    PromotionRuleVariant(
+                        promotionrule_id=rule.id, productvariant_id=variant_id
+                    )
+                    for variant_id in variant_ids
+                ],
+                ignore_conflicts=True,
+            )
+
+
+def _get_rule_to_variant_ids_map(
+    rules: QuerySet[PromotionRule], variant_qs: "ProductVariantQueryset"
+):
+    rule_to_variant_ids_map = defaultdict(list)
+    PromotionRuleVariant = PromotionRule.variants.through
+    promotion_rule_variants = PromotionRuleVariant.objects.filter(
+        Exists(rules.filter(id=OuterRef("promotionrule_id"))),
+        Exists(variant_qs.filter(id=OuterRef("productvariant_id"))),
+    ).values_list("promotionrule_id", "productvariant_id")
+    for rule_id, variant_id in promotion_rule_variants.iterator():
+        rule_to_variant_ids_map[rule_id].append(variant_id)
+    return rule_to_variant_ids_map
+
+
 def _get_rule_to_channel_ids_map(rules: QuerySet):
     rule_to_channel_ids_map = defaultdict(list)
     PromotionRuleChannel = PromotionRule.channels.through
@@ -12,6 +12,7 @@ from ..core.fields import BaseField, FilterConnectionField, PermissionsField
 from ..core.types import FilterInputObjectType
 from ..core.utils import from_global_id_or_error
 from ..core.validators import validate_one_of_args_is_in_query
+from ..utils.sorting import validate_rank_sorting
 from .bulk_mutations import (
     CustomerBulkDelete,
     CustomerBulkUpdate,
@@ -76,7 +77,7 @@ from .resolvers import (
     resolve_staff_users,
     resolve_user,
 )
-from .sorters import PermissionGroupSortingInput, UserSortingInput
+from .sorters import PermissionGroupSortingInput, UserSortField, UserSortingInput
 from .types import (
     Address,
     AddressValidationData,
@@ -212,6 +213,7 @@ class AccountQueries(graphene.ObjectType):
 
     @staticmethod
     def resolve_customers(_root, info: ResolveInfo, **kwargs):
+        validate_rank_sorting(kwargs, UserSortField)
         qs = resolve_customers(info)
         qs = filter_connection_queryset(qs, kwargs)
         return create_connection_slice(qs, info, kwargs, UserCountableConnection)
@@ -234,6 +236,7 @@ class AccountQueries(graphene.ObjectType):
 
     @staticmethod
     def resolve_staff_users(_root, info: ResolveInfo, **kwargs):
+        validate_rank_sorting(kwargs, UserSortField)
         qs = resolve_staff_users(info)
         qs = filter_connection_queryset(qs, kwargs)
         return create_connection_slice(qs, info, kwargs, UserCountableConnection)
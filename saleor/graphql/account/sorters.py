@@ -8,6 +8,7 @@ class UserSortField(BaseEnum):
     FIRST_NAME = ["first_name", "last_name", "pk"]
     LAST_NAME = ["last_name", "first_name", "pk"]
     EMAIL = ["email"]
+    RANK = ["search_rank", "id"]
     ORDER_COUNT = ["order_count", "email"]
     CREATED_AT = ["date_joined", "pk"]
     LAST_MODIFIED_AT = ["updated_at", "pk"]
@@ -17,6 +18,11 @@ class UserSortField(BaseEnum):
 
     @property
     def description(self):
+        if self.name == UserSortField.RANK.name:  # type: ignore[attr-defined] # graphene.Enum is not typed # noqa: E501
+            return (
+                "Sort users by rank. "
+                "Note: This option is available only with the `search` filter."
+            )
         if self.name in UserSortField.__enum__._member_names_:
             sort_name = self.name.lower().replace("_", " ")
             return f"Sort users by {sort_name}."
@@ -1,6 +1,7 @@
 import pytest
 
 from .....account.models import User
+from .....account.search import prepare_user_search_document_value
 from .....order.models import Order
 from ....tests.utils import get_graphql_content
 
@@ -171,3 +172,88 @@ def test_query_customers_pagination_with_sort(
     assert result_order[0] == nodes[0]["node"]["firstName"]
     assert result_order[1] == nodes[1]["node"]["firstName"]
     assert len(nodes) == page_size
+
+
+@pytest.fixture
+def customers_for_search(db):
+    users = [
+        User(
+            first_name="Johnathan",
+            last_name="Smith",
+            email="johnathan@example.com",
+            is_staff=False,
+            is_active=True,
+        ),
+        User(
+            first_name="John",
+            last_name="Smith",
+            email="john@example.com",
+            is_staff=False,
+            is_active=True,
+        ),
+        User(
+            first_name="Leslie",
+            last_name="Wade",
+            email="leslie@example.com",
+            is_staff=False,
+            is_active=True,
+        ),
+    ]
+    for user in users:
+        user.search_document = prepare_user_search_document_value(
+            user, attach_addresses_data=False
+        )
+    return User.objects.bulk_create(users)
+
+
+@pytest.mark.parametrize(
+    ("direction", "result_order"),
+    [("DESC", ["John", "Johnathan"]), ("ASC", ["Johnathan", "John"])],
+)
+def test_query_customers_with_sort_by_rank(
+    direction,
+    result_order,
+    staff_api_client,
+    permission_manage_users,
+    customers_for_search,
+):
+    # given
+    variables = {
+        "first": 1,
+        "sortBy": {"field": "RANK", "direction": direction},
+        "filter": {"search": "John"},
+    }
+    staff_api_client.user.user_permissions.add(permission_manage_users)
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_CUSTOMERS_WITH_PAGINATION, variables)
+    content = get_graphql_content(response)
+    first_page = content["data"]["customers"]
+    variables["after"] = first_page["pageInfo"]["endCursor"]
+    response = staff_api_client.post_graphql(QUERY_CUSTOMERS_WITH_PAGINATION, variables)
+    content = get_graphql_content(response)
+    second_page = content["data"]["customers"]
+
+    # then
+    assert [
+        edge["node"]["firstName"] for edge in first_page["edges"] + second_page["edges"]
+    ] == result_order
+    assert not second_page["pageInfo"]["hasNextPage"]
+
+
+def test_query_customers_with_sort_by_rank_without_search(
+    staff_api_client, permission_manage_users, customers_for_search
+):
+    # given
+    variables = {"first": 5, "sortBy": {"field": "RANK", "direction": "DESC"}}
+    staff_api_client.user.user_permissions.add(permission_manage_users)
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_CUSTOMERS_WITH_PAGINATION, variables)
+
+    # then
+    content = get_graphql_content(response, ignore_errors=True)
+    assert (
+        content["errors"][0]["message"]
+        == "Sorting by RANK is available only when using a search filter."
+    )
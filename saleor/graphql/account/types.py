@@ -42,6 +42,7 @@ from ..core.enums import LanguageCodeEnum
 from ..core.federation import federated_entity, resolve_federation_references
 from ..core.fields import ConnectionField, PermissionsField
 from ..core.scalars import UUID
+from ..core.total_count import EstimatedTotalCount
 from ..core.tracing import traced_resolver
 from ..core.types import (
     BaseInputObjectType,
@@ -716,6 +717,8 @@ class UserCountableConnection(CountableConnection):
         doc_category = DOC_CATEGORY_USERS
         node = User
 
+    total_count_strategy = EstimatedTotalCount()
+
 
 class ChoiceValue(graphene.ObjectType):
     raw = graphene.String(description="The raw name of the choice.")
@@ -2,11 +2,16 @@ from collections import defaultdict
 from functools import partial, wraps
 from typing import Optional
 
-from django.contrib.auth.hashers import check_password
+from django.db.models import Q
 from django.utils.functional import LazyObject
 from promise import Promise
 
 from ...app.models import App, AppExtension, AppToken
+from ...app.tokens import (
+    check_app_token,
+    get_token_lookup_hash,
+    set_missing_token_lookup_hash,
+)
 from ...core.auth import get_token_from_request
 from ...core.utils.lazyobjects import unwrap_lazy
 from ..core import SaleorContext
@@ -77,19 +82,35 @@ class AppByTokenLoader(DataLoader):
 
     def batch_load(self, keys):
         last_4s_to_raw_token_map = defaultdict(list)
+        hash_to_raw_token_map = {}
         for raw_token in keys:
             last_4s_to_raw_token_map[raw_token[-4:]].append(raw_token)
+            hash_to_raw_token_map[get_token_lookup_hash(raw_token)] = raw_token
 
+        # Tokens with a lookup hash are matched directly, only the legacy ones
+        # without it need to be narrowed down by the last four characters.
         tokens = (
             AppToken.objects.using(self.database_connection_name)
-            .filter(token_last_4__in=last_4s_to_raw_token_map.keys())
-            .values_list("auth_token", "token_last_4", "app_id")
+            .filter(
+                Q(token_hash__in=hash_to_raw_token_map.keys())
+                | Q(
+                    token_hash__isnull=True,
+                    token_last_4__in=last_4s_to_raw_token_map.keys(),
+                )
+            )
+            .values_list("id", "auth_token", "token_last_4", "token_hash", "app_id")
         )
         authed_apps = {}
-        for auth_token, token_last_4, app_id in tokens:
-            for raw_token in last_4s_to_raw_token_map[token_last_4]:
-                if check_password(raw_token, auth_token):
+        for token_id, auth_token, token_last_4, token_hash, app_id in tokens:
+            if token_hash:
+                raw_tokens = [hash_to_raw_token_map[token_hash]]
+            else:
+                raw_tokens = last_4s_to_raw_token_map[token_last_4]
+            for raw_token in raw_tokens:
+                if check_app_token(raw_token, auth_token, app_id):
                     authed_apps[raw_token] = app_id
+                    if not token_hash:
+                        set_missing_token_lookup_hash(token_id, raw_token)
 
         apps = (
             App.objects.using(self.database_connection_name)
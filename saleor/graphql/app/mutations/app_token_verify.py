@@ -1,7 +1,12 @@
 import graphene
-from django.contrib.auth.hashers import check_password
+from django.db.models import Q
 
 from ....app import models
+from ....app.tokens import (
+    check_app_token,
+    get_token_lookup_hash,
+    set_missing_token_lookup_hash,
+)
 from ...core.doc_category import DOC_CATEGORY_APPS
 from ...core.mutations import BaseMutation
 from ...core.types import AppError
@@ -26,7 +31,15 @@ class AppTokenVerify(BaseMutation):
     @classmethod
     def perform_mutation(cls, _root, _info, /, *, token: str):  # type: ignore[override]
         tokens = models.AppToken.objects.filter(
-            app__is_active=True, token_last_4=token[-4:]
-        ).values_list("auth_token", flat=True)
-        valid = any([check_password(token, auth_token) for auth_token in tokens])
+            Q(token_hash=get_token_lookup_hash(token))
+            | Q(token_hash__isnull=True, token_last_4=token[-4:]),
+            app__is_active=True,
+        ).values_list("id", "auth_token", "token_hash", "app_id")
+        valid = False
+        for token_id, auth_token, token_hash, app_id in tokens:
+            if check_app_token(token, auth_token, app_id):
+                valid = True
+                if not token_hash:
+                    set_missing_token_lookup_hash(token_id, token)
+                break
         return AppTokenVerify(valid=valid)
@@ -1,3 +1,4 @@
+from .....app.tokens import get_token_lookup_hash
 from ....tests.utils import get_graphql_content
 
 APP_TOKEN_VERIFY_MUTATION = """
@@ -28,3 +29,17 @@ def test_app_token_verify_invalid_token(app, api_client):
     response = api_client.post_graphql(query, variables=variables)
     content = get_graphql_content(response)
     assert not content["data"]["appTokenVerify"]["valid"]
+
+
+def test_app_token_verify_valid_token_without_lookup_hash(app, api_client):
+    app_token, token = app.tokens.create()
+    app_token.token_hash = None
+    app_token.save(update_fields=["token_hash"])
+    query = APP_TOKEN_VERIFY_MUTATION
+
+    variables = {"token": token}
+    response = api_client.post_graphql(query, variables=variables)
+    content = get_graphql_content(response)
+    assert content["data"]["appTokenVerify"]["valid"]
+    app_token.refresh_from_db()
+    assert app_token.token_hash == get_token_lookup_hash(token)
@@ -3,6 +3,7 @@ from django.core.exceptions import ObjectDoesNotExist, ValidationError
 
 from ....attribute import models as models
 from ....attribute.error_codes import AttributeErrorCode
+from ....attribute.sort_keys import schedule_attributes_sort_keys_update
 from ....core.tracing import traced_atomic_transaction
 from ....permission.enums import ProductTypePermissions
 from ....webhook.event_types import WebhookEventAsyncType
@@ -93,6 +94,7 @@ class AttributeReorderValues(BaseMutation):
 
         with traced_atomic_transaction():
             perform_reordering(values_m2m, operations)
+            schedule_attributes_sort_keys_update([attribute.pk])
         attribute.refresh_from_db(fields=["values"])
         manager = get_plugin_manager_promise(info.context).get()
         events_list = [v for v in values_m2m if v.id in operations.keys()]
@@ -1,23 +1,32 @@
 from django.db.models import Exists, OuterRef
 
 from ...channel.models import Channel
+from ...core.reference_data import channels as channels_reference_data
 from ...order.models import Order
-from ..core.dataloaders import DataLoader
+from ..core.dataloaders import DataLoader, ReferenceDataLoader
 from ..order.dataloaders import OrderByIdLoader, OrderLineByIdLoader
 
 
-class ChannelByIdLoader(DataLoader):
+class ChannelByIdLoader(ReferenceDataLoader):
     context_key = "channel_by_id"
+    reference_data = channels_reference_data
 
-    def batch_load(self, keys):
+    def batch_load_from_snapshot(self, snapshot, keys):
+        return snapshot.get_many("pk", keys)
+
+    def batch_load_from_database(self, keys):
         channels = Channel.objects.using(self.database_connection_name).in_bulk(keys)
         return [channels.get(channel_id) for channel_id in keys]
 
 
-class ChannelBySlugLoader(DataLoader):
+class ChannelBySlugLoader(ReferenceDataLoader):
     context_key = "channel_by_slug"
+    reference_data = channels_reference_data
 
-    def batch_load(self, keys):
+    def batch_load_from_snapshot(self, snapshot, keys):
+        return snapshot.get_many("slug", keys)
+
+    def batch_load_from_database(self, keys):
         channels = Channel.objects.using(self.database_connection_name).in_bulk(
             keys, field_name="slug"
         )
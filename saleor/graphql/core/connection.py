@@ -11,8 +11,9 @@ from typing import (
 
 import graphene
 from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Field, Q, QuerySet
 from django.db.models import Model as DjangoModel
-from django.db.models import Q, QuerySet
 from graphene.relay import Connection
 from graphql import GraphQLError
 from graphql.language.ast import FragmentSpread
@@ -21,11 +22,13 @@ from graphql_relay.connection.connectiontypes import Edge, PageInfo
 from graphql_relay.utils import base64, unbase64
 
 from ...channel.exceptions import ChannelNotDefined, NoDefaultChannel
+from ...core.postgres import RowValueComparison
 from ..channel import ChannelContext, ChannelQsContext
 from ..channel.utils import get_default_channel_slug_or_graphql_error
 from ..core.enums import OrderDirection
 from ..core.types import BaseConnection, NonNullList
 from ..utils.sorting import sort_queryset_for_connection
+from .total_count import ExactTotalCount
 
 if TYPE_CHECKING:
     from ..core import ResolveInfo
@@ -88,62 +91,156 @@ def _prepare_filter_by_rank_expression(
     )
 
 
-def _prepare_filter_expression(
+def _get_non_nullable_field(qs: QuerySet, field_name: str) -> Optional[Field]:
+    """Return the model field sorted by `field_name`, if its value can't be NULL."""
+    if field_name in qs.query.annotations:
+        return None
+    opts = qs.model._meta
+    field = None
+    for part in field_name.split("__"):
+        if opts is None:
+            return None
+        try:
+            field = opts.pk if part == "pk" else opts.get_field(part)
+        except FieldDoesNotExist:
+            return None
+        if field.null or field.one_to_many or field.many_to_many:
+            return None
+        if field.one_to_one and not field.concrete:
+            return None
+        opts = field.related_model._meta if field.is_relation else None
+    return field
+
+
+def _get_non_nullable_fields(
+    qs: QuerySet, cursor: list[Optional[str]], sorting_fields: list[str]
+) -> list[Optional[Field]]:
+    fields = []
+    for field_name, value in zip(sorting_fields, cursor):
+        field = _get_non_nullable_field(qs, field_name)
+        fields.append(field if value is not None else None)
+    return fields
+
+
+def _coerce_cursor_values(
+    cursor: list[Optional[str]], fields: list[Optional[Field]]
+) -> list[Any]:
+    """Convert cursor values of non-nullable fields before they reach SQL params."""
+    try:
+        return [
+            field.to_python(value) if field is not None else value
+            for field, value in zip(fields, cursor)
+        ]
+    except (ValidationError, ValueError, TypeError):
+        raise GraphQLError("Received cursor is invalid.")
+
+
+def _prepare_nullable_field_filter(
     field_name: str,
-    index: int,
-    cursor: list[str],
+    value: Any,
+    sorting_direction: str,
+    following_filter: Optional[Q],
+) -> Optional[Q]:
+    # PostgreSQL sorts NULLs last in ascending and first in descending order.
+    if value is None:
+        equal = Q(**{f"{field_name}__isnull": True})
+        after = None if sorting_direction == "gt" else ~equal
+    else:
+        equal = Q(**{field_name: value})
+        after = Q(**{f"{field_name}__{sorting_direction}": value})
+        if sorting_direction == "gt":
+            after |= Q(**{f"{field_name}__isnull": True})
+    if following_filter is not None:
+        equal_and_after = Q(equal, following_filter)
+        return equal_and_after if after is None else after | equal_and_after
+    return after
+
+
+def _prepare_keyset_filter(
+    cursor: list[Any],
     sorting_fields: list[str],
     sorting_direction: str,
-) -> tuple[Q, dict[str, Union[str, bool]]]:
-    field_expression: dict[str, Union[str, bool]] = {}
-    extra_expression = Q()
-    for cursor_id, cursor_value in enumerate(cursor[:index]):
-        field_expression[sorting_fields[cursor_id]] = cursor_value
+    fields: list[Optional[Field]],
+) -> Optional[Q]:
+    """Return a filter matching records sorted after the cursor.
+
+    Leading non-nullable fields are compared as a single row value, e.g.
+    `(created_at, status, id) > (%s, %s, %s)`, which PostgreSQL reads as a range
+    of a composite index. The first nullable field splits the comparison, as NULL
+    values are placed at one of the ends of the ordering.
+    Return None when no records can follow the cursor.
+    """
+    if not sorting_fields:
+        return None
+    prefix_length = next(
+        (index for index, field in enumerate(fields) if field is None),
+        len(fields),
+    )
+    if not prefix_length:
+        following_filter = _prepare_keyset_filter(
+            cursor[1:], sorting_fields[1:], sorting_direction, fields[1:]
+        )
+        return _prepare_nullable_field_filter(
+            sorting_fields[0], cursor[0], sorting_direction, following_filter
+        )
 
-    if sorting_direction == "gt":
-        extra_expression |= Q(**{f"{field_name}__{sorting_direction}": cursor[index]})
-        extra_expression |= Q(**{f"{field_name}__isnull": True})
-    elif cursor[index] is not None:
-        field_expression[f"{field_name}__{sorting_direction}"] = cursor[index]
+    prefix_fields = sorting_fields[:prefix_length]
+    prefix_values = cursor[:prefix_length]
+    if prefix_length == 1:
+        after = Q(**{f"{prefix_fields[0]}__{sorting_direction}": prefix_values[0]})
     else:
-        field_expression[f"{field_name}__isnull"] = False
-
-    return extra_expression, field_expression
+        operator = ">" if sorting_direction == "gt" else "<"
+        after = Q(RowValueComparison(prefix_fields, operator, prefix_values))
+    following_filter = _prepare_keyset_filter(
+        cursor[prefix_length:],
+        sorting_fields[prefix_length:],
+        sorting_direction,
+        fields[prefix_length:],
+    )
+    if following_filter is None:
+        return after
+    return after | Q(following_filter, **dict(zip(prefix_fields, prefix_values)))
 
 
 def _prepare_filter(
-    cursor: list[str],
+    qs: QuerySet,
+    cursor: list[Optional[str]],
     sorting_fields: list[str],
     sorting_direction: str,
-    coerce_id: Callable[[str], Any],
 ) -> Q:
     """Create filter arguments based on sorting fields.
 
+    :param qs: sorted queryset, used to check which sorting fields can be NULL.
     :param cursor: list of values that are passed from page_info, used for filtering.
     :param sorting_fields: list of fields that were used for sorting.
     :param sorting_direction: keyword direction ('lt', gt').
-    :return: Q() in following format
+    :return: Q() in following format, when `second_field` can be NULL
         (OR: ('first_field__gt', 'first_value_form_cursor'),
-            (AND: ('second_field__gt', 'second_value_form_cursor'),
-                ('first_field', 'first_value_form_cursor')),
-            (AND: ('third_field__gt', 'third_value_form_cursor'),
-                ('second_field', 'second_value_form_cursor'),
-                ('first_field', 'first_value_form_cursor'))
+            (AND: ('first_field', 'first_value_form_cursor'),
+                (OR: ('second_field__gt', 'second_value_form_cursor'),
+                    ('second_field__isnull', True),
+                    (AND: ('second_field', 'second_value_form_cursor'),
+                        RowValueComparison(
+                            (third_field, fourth_field) > (third_value, fourth_value)
+                        )
+                    )
+                )
+            )
         )
     """
     if sorting_fields == ["search_rank", "id"]:
         # Fast path for filtering by rank
-        return _prepare_filter_by_rank_expression(cursor, sorting_direction, coerce_id)
-    filter_kwargs = Q()
-    for index, field_name in enumerate(sorting_fields):
-        if cursor[index] is None and sorting_direction == "gt":
-            continue
-
-        extra_expression, field_expression = _prepare_filter_expression(
-            field_name, index, cursor, sorting_fields, sorting_direction
+        return _prepare_filter_by_rank_expression(
+            cursor, sorting_direction, _get_id_coercion(qs)
         )
-        filter_kwargs |= Q(extra_expression, **field_expression)
-
+    fields = _get_non_nullable_fields(qs, cursor, sorting_fields)
+    values = _coerce_cursor_values(cursor, fields)
+    filter_kwargs = _prepare_keyset_filter(
+        values, sorting_fields, sorting_direction, fields
+    )
+    if filter_kwargs is None:
+        # No records are sorted after the last possible cursor.
+        return Q(pk__in=[])
     return filter_kwargs
 
 
@@ -279,12 +376,7 @@ def connection_from_queryset_slice(
     if cursor and len(cursor) != len(sorting_fields):
         raise GraphQLError("Received cursor is invalid.")
     filter_kwargs = (
-        _prepare_filter(
-            cursor,
-            sorting_fields,
-            sorting_direction,
-            _get_id_coercion(qs),
-        )
+        _prepare_filter(qs, cursor, sorting_fields, sorting_direction)
         if cursor
         else Q()
     )
@@ -300,7 +392,7 @@ def connection_from_queryset_slice(
     if "total_count" in connection_type._meta.fields:
 
         def get_total_count():
-            return qs.count()
+            return connection_type.total_count_strategy.get_total_count(qs)
 
         return connection_type(
             edges=edges,
@@ -654,6 +746,9 @@ class CountableConnection(NonNullConnection):
 
     total_count = graphene.Int(description="A total count of items in the collection.")
 
+    # Decides how `total_count` of a queryset is resolved.
+    total_count_strategy: ExactTotalCount = ExactTotalCount()
+
     @staticmethod
     def resolve_total_count(root, _info):
         try:
@@ -17,6 +17,8 @@ class SaleorContext(HttpRequest):
     decoded_auth_token: Optional[dict[str, Any]]
     allow_replica: bool = True
     dataloaders: dict[str, "DataLoader"]
+    # Data loaders of subscription queries, shared by apps with the same permissions.
+    dataloaders_by_permissions: dict[frozenset[str], dict[str, "DataLoader"]]
     app: Optional[App]
     user: Optional[User]  # type: ignore[assignment]
     requestor: Union[App, User, None]
@@ -4,9 +4,11 @@ from typing import Generic, Optional, TypeVar, Union
 
 import opentracing
 import opentracing.tags
+from django.conf import settings
 from promise import Promise
 from promise.dataloader import DataLoader as BaseLoader
 
+from ...core.reference_data import ReferenceData, ReferenceDataSnapshot
 from ...thumbnail.models import Thumbnail
 from ...thumbnail.utils import get_thumbnail_format
 from . import SaleorContext
@@ -56,6 +58,35 @@ class DataLoader(BaseLoader, Generic[K, R]):
         raise NotImplementedError()
 
 
+class ReferenceDataLoader(DataLoader[K, R]):
+    """Data loader that can serve its results from a process-wide snapshot.
+
+    The snapshot is used when `REFERENCE_DATA_CACHE_ENABLED` is set, only for
+    requests allowed to use the read replica. Other requests, e.g. mutations,
+    keep reading from the database they write to.
+    """
+
+    reference_data: ReferenceData
+
+    def batch_load(self, keys: Iterable[K]) -> Union[Promise[list[R]], list[R]]:
+        if settings.REFERENCE_DATA_CACHE_ENABLED and getattr(
+            self.context, "allow_replica", True
+        ):
+            snapshot = self.reference_data.get_snapshot()
+            return self.batch_load_from_snapshot(snapshot, keys)
+        return self.batch_load_from_database(keys)
+
+    def batch_load_from_snapshot(
+        self, snapshot: ReferenceDataSnapshot, keys: Iterable[K]
+    ) -> list[R]:
+        raise NotImplementedError()
+
+    def batch_load_from_database(
+        self, keys: Iterable[K]
+    ) -> Union[Promise[list[R]], list[R]]:
+        raise NotImplementedError()
+
+
 class BaseThumbnailBySizeAndFormatLoader(
     DataLoader[tuple[int, int, Optional[str]], Thumbnail]
 ):
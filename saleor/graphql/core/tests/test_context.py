@@ -1,5 +1,6 @@
 from django.urls import reverse
 
+from ....app.tokens import get_token_lookup_hash
 from ...context import set_app_on_context
 
 
@@ -17,6 +18,23 @@ def test_app_middleware_accepts_app_requests(app, rf):
     assert request.app == app
 
 
+def test_app_middleware_sets_lookup_hash_of_legacy_token(app, rf):
+    # given
+    request = rf.get(reverse("api"))
+    app_token, token = app.tokens.create()
+    app_token.token_hash = None
+    app_token.save(update_fields=["token_hash"])
+    request.META = {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+
+    # when
+    set_app_on_context(request)
+
+    # then
+    assert request.app == app
+    app_token.refresh_from_db()
+    assert app_token.token_hash == get_token_lookup_hash(token)
+
+
 def test_app_middleware_accepts_saleors_header(app, rf):
     # given
     request = rf.get(reverse("api"))
@@ -0,0 +1,173 @@
+import statistics
+import time
+from unittest.mock import patch
+
+import pytest
+from graphql import get_default_backend
+
+from ...api import schema
+from ...document_cache import (
+    get_cost_variables,
+    get_document,
+    get_document_cache_stats,
+    get_query_cost,
+    parsed_documents,
+    query_costs,
+)
+from ...query_cost_map import COST_MAP
+from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+
+PRODUCTS_QUERY = """
+    query Products($first: Int, $channel: String) {
+        products(first: $first, channel: $channel) {
+            edges {
+                node {
+                    name
+                }
+            }
+        }
+    }
+"""
+
+
+def test_get_document_reuses_parsed_document():
+    # given
+    backend = get_default_backend()
+
+    # when
+    first = get_document(backend, schema, PRODUCTS_QUERY, COST_MAP)
+    second = get_document(backend, schema, PRODUCTS_QUERY, COST_MAP)
+
+    # then
+    assert first is second
+    assert first.validation_errors is None
+    assert first.query_identifier == "products"
+    assert first.query_fingerprint.startswith("query:Products:")
+    stats = get_document_cache_stats()
+    assert stats["documents"]["hits"] == 1
+    assert stats["documents"]["misses"] == 1
+
+
+def test_get_document_caches_validation_errors():
+    # when
+    cached_document = get_document(
+        get_default_backend(), schema, "query { invalid }", COST_MAP
+    )
+
+    # then
+    assert len(cached_document.validation_errors) == 1
+    assert len(parsed_documents) == 1
+
+
+def test_get_cost_variables_returns_only_multiplier_variables():
+    # given
+    document = get_default_backend().document_from_string(schema, PRODUCTS_QUERY)
+
+    # when
+    cost_variables = get_cost_variables(document, COST_MAP)
+
+    # then
+    assert cost_variables == ("first",)
+
+
+def test_get_query_cost_recomputed_only_for_new_multiplier_values():
+    # given
+    cached_document = get_document(
+        get_default_backend(), schema, PRODUCTS_QUERY, COST_MAP
+    )
+
+    # when
+    first_cost, _ = get_query_cost(
+        schema, cached_document, {"first": 10, "channel": "a"}, COST_MAP, 50000
+    )
+    same_cost, _ = get_query_cost(
+        schema, cached_document, {"first": 10, "channel": "b"}, COST_MAP, 50000
+    )
+    other_cost, _ = get_query_cost(
+        schema, cached_document, {"first": 20, "channel": "a"}, COST_MAP, 50000
+    )
+
+    # then
+    assert first_cost == same_cost == 10
+    assert other_cost == 20
+    assert len(query_costs) == 2
+    assert query_costs.hits == 1
+
+
+@patch("saleor.graphql.document_cache.validate_query_cost")
+def test_get_query_cost_not_cached_for_invalid_variables(mocked_validate_query_cost):
+    # given
+    mocked_validate_query_cost.return_value = (0, None)
+    cached_document = get_document(
+        get_default_backend(), schema, PRODUCTS_QUERY, COST_MAP
+    )
+
+    # when
+    get_query_cost(schema, cached_document, "not-a-dict", COST_MAP, 50000)
+    get_query_cost(schema, cached_document, "not-a-dict", COST_MAP, 50000)
+
+    # then
+    assert mocked_validate_query_cost.call_count == 2
+    assert len(query_costs) == 0
+
+
+def test_repeated_query_is_not_validated_again(api_client, product, channel_USD):
+    # given
+    variables = {"first": 1, "channel": channel_USD.slug}
+    api_client.post_graphql(PRODUCTS_QUERY, variables)
+
+    # when
+    with patch("graphql.backend.core.validate") as mocked_validate:
+        response = api_client.post_graphql(PRODUCTS_QUERY, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["edges"][0]["node"]["name"] == product.name
+    mocked_validate.assert_not_called()
+
+
+def test_repeated_invalid_query_returns_validation_errors(api_client):
+    # given
+    api_client.post_graphql("query { invalid }", check_no_permissions=False)
+
+    # when
+    response = api_client.post_graphql("query { invalid }", check_no_permissions=False)
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert "invalid" in content["errors"][0]["message"]
+    assert content["extensions"]["cost"]["requestedQueryCost"] == 0
+
+
+def _get_latencies(api_client, query, variables, repeat):
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        get_graphql_content(api_client.post_graphql(query, variables))
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+@pytest.mark.parametrize("cache_size", [0, 1000])
+def test_document_cache_latency(cache_size, api_client, record_property):
+    # given
+    # A query large enough for parsing and validation to matter.
+    query = "query Shop {%s}" % " ".join(
+        f"shop{i}: shop {{ name description domain {{ host url }} }}" for i in range(50)
+    )
+    previous_size = parsed_documents.maxsize
+    parsed_documents.maxsize = query_costs.maxsize = cache_size
+
+    # when
+    try:
+        latencies = _get_latencies(api_client, query, None, repeat=50)
+    finally:
+        parsed_documents.maxsize = query_costs.maxsize = previous_size
+
+    # then
+    percentiles = statistics.quantiles(latencies, n=100)
+    p50, p99 = statistics.median(latencies), percentiles[98]
+    record_property("p50_ms", round(p50 * 1000, 2))
+    record_property("p99_ms", round(p99 * 1000, 2))
+    assert len(parsed_documents) == (1 if cache_size else 0)
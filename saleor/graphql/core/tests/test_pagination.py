@@ -1,11 +1,23 @@
 import base64
 import math
+import time
 
 import graphene
 import pytest
+from django.db import connection
+from django.db.models import Value
+from django.db.models.functions import NullIf
+from django.test.utils import CaptureQueriesContext
+from graphql import GraphQLError
 
 from ....tests.models import Book
-from ..connection import CountableConnection, create_connection_slice
+from ..connection import (
+    CountableConnection,
+    connection_from_queryset_slice,
+    create_connection_slice,
+    to_global_cursor,
+)
+from ..enums import OrderDirection
 from ..fields import ConnectionField
 
 
@@ -310,3 +322,96 @@ def test_query_with_pagination_and_fragments_no_first_or_last_raises_an_error(bo
         "the `books` connection."
     )
     assert str(result.errors[0]) == expected_err_msg
+
+
+def _paginate_books(qs, sorting_fields, direction, page_size):
+    sort_by = {"field": sorting_fields, "direction": direction}
+    names = []
+    after = None
+    while True:
+        args = {"first": page_size, "after": after, "sort_by": sort_by}
+        books = connection_from_queryset_slice(qs, args)
+        names.extend(edge.node.name for edge in books.edges)
+        if not books.page_info.has_next_page:
+            return names
+        after = books.page_info.end_cursor
+
+
+def test_pagination_filters_non_nullable_fields_with_row_value(books):
+    # given
+    qs = Book.objects.order_by("name", "pk")
+    book = qs[5]
+    args = {
+        "first": 3,
+        "after": to_global_cursor([book.name, book.pk]),
+        "sort_by": {"field": ["name", "pk"], "direction": OrderDirection.ASC},
+    }
+
+    # when
+    with CaptureQueriesContext(connection) as queries:
+        result = connection_from_queryset_slice(qs, args)
+
+    # then
+    expected_names = list(qs.values_list("name", flat=True)[6:9])
+    assert [edge.node.name for edge in result.edges] == expected_names
+    assert len(queries) == 1
+    assert '("tests_book"."name", "tests_book"."id") >' in queries[0]["sql"]
+
+
+@pytest.mark.parametrize("direction", [OrderDirection.ASC, OrderDirection.DESC])
+def test_pagination_over_nullable_field(direction, books):
+    # given
+    Book.objects.filter(pk__in=[book.pk for book in books[::3]]).update(name="")
+    qs = Book.objects.annotate(nullable_name=NullIf("name", Value("")))
+    prefix = "-" if direction == OrderDirection.DESC else ""
+    qs = qs.order_by(f"{prefix}nullable_name", f"{prefix}pk")
+    expected_names = list(qs.values_list("name", flat=True))
+
+    # when
+    names = _paginate_books(qs, ["nullable_name", "pk"], direction, page_size=5)
+
+    # then
+    assert names == expected_names
+
+
+def test_pagination_invalid_cursor_value(books):
+    # given
+    args = {
+        "first": 3,
+        "after": to_global_cursor(["Book1", "not-an-id"]),
+        "sort_by": {"field": ["name", "pk"], "direction": OrderDirection.ASC},
+    }
+
+    # when & then
+    with pytest.raises(GraphQLError, match="Received cursor is invalid."):
+        connection_from_queryset_slice(Book.objects.order_by("name", "pk"), args)
+
+
+@pytest.mark.parametrize("page", [1, 1000])
+def test_pagination_page_benchmark(page, db, record_property):
+    # given
+    page_size = 10
+    Book.objects.bulk_create(
+        [Book(name=f"Book{index:05}") for index in range(page * page_size + 1)]
+    )
+    qs = Book.objects.order_by("name", "pk")
+    args = {
+        "first": page_size,
+        "sort_by": {"field": ["name", "pk"], "direction": OrderDirection.ASC},
+    }
+    if page > 1:
+        book = qs[(page - 1) * page_size - 1]
+        args["after"] = to_global_cursor([book.name, book.pk])
+
+    # when
+    with CaptureQueriesContext(connection) as queries:
+        start = time.perf_counter()
+        result = connection_from_queryset_slice(qs, args)
+        duration = time.perf_counter() - start
+
+    # then
+    record_property("duration_ms", duration * 1000)
+    assert len(result.edges) == page_size
+    assert result.edges[0].node.name == f"Book{(page - 1) * page_size:05}"
+    assert len(queries) == 1
+    assert "OFFSET" not in queries[0]["sql"]
@@ -0,0 +1,141 @@
+import hashlib
+import json
+
+from django.core.cache import cache
+
+from ...persisted_queries import get_persisted_query_cache_key
+from ...tests.fixtures import API_PATH
+from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+
+
+def _get_hash(query):
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def _get_extensions(query, version=1):
+    return {"persistedQuery": {"version": version, "sha256Hash": _get_hash(query)}}
+
+
+def test_persisted_query_not_found(client):
+    # given
+    query = "query PersistedQueryNotFound { shop { name } }"
+
+    # when
+    response = client.post(
+        API_PATH,
+        {"extensions": _get_extensions(query)},
+        content_type="application/json",
+    )
+
+    # then
+    content = get_graphql_content_from_response(response)
+    error = content["errors"][0]
+    assert error["message"] == "PersistedQueryNotFound"
+    assert error["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+
+def test_persisted_query_registered_and_resolved_by_hash(client, site_settings):
+    # given
+    query = "query PersistedQueryRegister { shop { name } }"
+    extensions = _get_extensions(query)
+    client.post(
+        API_PATH,
+        {"query": query, "extensions": extensions},
+        content_type="application/json",
+    )
+
+    # when
+    response = client.post(
+        API_PATH, {"extensions": extensions}, content_type="application/json"
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_persisted_query_hash_mismatch(client):
+    # given
+    query = "query PersistedQueryMismatch { shop { name } }"
+    extensions = _get_extensions("query Other { shop { name } }")
+
+    # when
+    response = client.post(
+        API_PATH,
+        {"query": query, "extensions": extensions},
+        content_type="application/json",
+    )
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["code"] == (
+        "PERSISTED_QUERY_HASH_MISMATCH"
+    )
+    assert cache.get(get_persisted_query_cache_key(_get_hash(query))) is None
+
+
+def test_persisted_query_unsupported_version(client):
+    # given
+    query = "query PersistedQueryVersion { shop { name } }"
+
+    # when
+    response = client.post(
+        API_PATH,
+        {"extensions": _get_extensions(query, version=2)},
+        content_type="application/json",
+    )
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "PersistedQueryNotSupported"
+
+
+def test_persisted_query_over_get(client, site_settings):
+    # given
+    query = "query PersistedQueryGet { shop { name } }"
+    extensions = _get_extensions(query)
+    cache.set(get_persisted_query_cache_key(_get_hash(query)), query)
+
+    # when
+    response = client.get(
+        API_PATH,
+        {
+            "operationName": "PersistedQueryGet",
+            "variables": json.dumps({}),
+            "extensions": json.dumps(extensions),
+        },
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_persisted_mutation_over_get_not_allowed(client):
+    # given
+    query = "mutation PersistedMutationGet { tokenRefresh { token } }"
+    extensions = _get_extensions(query)
+    cache.set(get_persisted_query_cache_key(_get_hash(query)), query)
+
+    # when
+    response = client.get(API_PATH, {"extensions": json.dumps(extensions)})
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "Can only perform a mutation operation from a POST request."
+    )
+
+
+def test_persisted_query_over_get_disabled(client, settings):
+    # given
+    settings.PERSISTED_QUERIES_ENABLED = False
+    settings.PLAYGROUND_ENABLED = False
+    query = "query PersistedQueryDisabled { shop { name } }"
+
+    # when
+    response = client.get(API_PATH, {"extensions": json.dumps(_get_extensions(query))})
+
+    # then
+    assert response.status_code == 405
@@ -0,0 +1,182 @@
+import time
+from datetime import datetime
+from unittest import mock
+
+import pytest
+import pytz
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ....product.models import Product
+from ....tests.models import Book
+from ..total_count import (
+    EstimatedTotalCount,
+    ExactTotalCount,
+    get_estimated_count,
+    get_total_count_cache_key,
+)
+
+
+@pytest.fixture
+def books(db):
+    return Book.objects.bulk_create([Book(name=f"Book{index}") for index in range(24)])
+
+
+@pytest.fixture
+def _total_count_estimates(settings):
+    settings.TOTAL_COUNT_ESTIMATES_ENABLED = True
+    yield
+    cache.clear()
+
+
+def test_exact_total_count(books):
+    # when
+    total_count = ExactTotalCount().get_total_count(Book.objects.all())
+
+    # then
+    assert total_count == len(books)
+
+
+@mock.patch("saleor.graphql.core.total_count.get_estimated_count")
+def test_estimated_total_count_disabled(mocked_get_estimated_count, books):
+    # when
+    total_count = EstimatedTotalCount().get_total_count(Book.objects.all())
+
+    # then
+    assert total_count == len(books)
+    mocked_get_estimated_count.assert_not_called()
+
+
+@pytest.mark.usefixtures("_total_count_estimates")
+def test_estimated_total_count_below_threshold_is_exact(books):
+    # given
+    qs = Book.objects.all()
+    strategy = EstimatedTotalCount(exact_count_threshold=get_estimated_count(qs) + 1)
+
+    # when
+    with CaptureQueriesContext(connection) as queries:
+        total_count = strategy.get_total_count(qs)
+
+    # then
+    assert total_count == len(books)
+    assert [query["sql"].split()[0] for query in queries] == ["EXPLAIN", "SELECT"]
+
+
+@pytest.mark.usefixtures("_total_count_estimates")
+@mock.patch(
+    "saleor.graphql.core.total_count.get_estimated_count", return_value=2_000_000
+)
+def test_estimated_total_count_above_threshold(mocked_get_estimated_count, books):
+    # given
+    qs = Book.objects.all()
+
+    # when
+    with CaptureQueriesContext(connection) as queries:
+        total_count = EstimatedTotalCount(exact_count_threshold=1000).get_total_count(
+            qs
+        )
+
+    # then
+    assert total_count == 2_000_000
+    assert len(queries) == 0
+    mocked_get_estimated_count.assert_called_once_with(qs)
+
+
+@pytest.mark.usefixtures("_total_count_estimates")
+@mock.patch(
+    "saleor.graphql.core.total_count.get_estimated_count", return_value=2_000_000
+)
+def test_estimated_total_count_filtered_below_margin_is_exact(
+    mocked_get_estimated_count, books, settings
+):
+    # given
+    settings.TOTAL_COUNT_FILTERED_ESTIMATE_MARGIN = 10
+    qs = Book.objects.filter(name__startswith="Book1")
+
+    # when
+    total_count = EstimatedTotalCount(exact_count_threshold=1_000_000).get_total_count(
+        qs
+    )
+
+    # then
+    assert total_count == qs.count()
+    mocked_get_estimated_count.assert_called_once_with(qs)
+
+
+@pytest.mark.usefixtures("_total_count_estimates")
+@mock.patch(
+    "saleor.graphql.core.total_count.get_estimated_count", return_value=2_000_000
+)
+def test_estimated_total_count_filtered_above_margin(
+    mocked_get_estimated_count, books, settings
+):
+    # given
+    settings.TOTAL_COUNT_FILTERED_ESTIMATE_MARGIN = 10
+    qs = Book.objects.filter(name__startswith="Book1")
+
+    # when
+    with CaptureQueriesContext(connection) as queries:
+        total_count = EstimatedTotalCount(exact_count_threshold=1000).get_total_count(
+            qs
+        )
+
+    # then
+    assert total_count == 2_000_000
+    assert len(queries) == 0
+
+
+@pytest.mark.usefixtures("_total_count_estimates")
+def test_estimated_total_count_is_cached_per_query(books):
+    # given
+    strategy = EstimatedTotalCount(exact_count_threshold=1_000_000)
+    strategy.get_total_count(Book.objects.all())
+    filtered_qs = Book.objects.filter(name="Book1")
+
+    # when
+    with CaptureQueriesContext(connection) as queries:
+        total_count = strategy.get_total_count(Book.objects.order_by("-name"))
+        filtered_total_count = strategy.get_total_count(filtered_qs)
+
+    # then
+    assert total_count == len(books)
+    assert filtered_total_count == 1
+    assert len(queries) == 2
+    assert get_total_count_cache_key(filtered_qs) != get_total_count_cache_key(
+        Book.objects.filter(name="Book2")
+    )
+
+
+def test_total_count_cache_key_truncates_datetime_params(settings):
+    # given
+    settings.TOTAL_COUNT_CACHE_TIMEOUT = 60
+
+    def get_cache_key(now):
+        return get_total_count_cache_key(Product.objects.filter(updated_at__lte=now))
+
+    # when
+    cache_key = get_cache_key(datetime(2024, 1, 1, 12, 0, 5, tzinfo=pytz.UTC))
+
+    # then
+    assert cache_key == get_cache_key(datetime(2024, 1, 1, 12, 0, 50, tzinfo=pytz.UTC))
+    assert cache_key != get_cache_key(datetime(2024, 1, 1, 12, 1, 5, tzinfo=pytz.UTC))
+
+
+@pytest.mark.parametrize(
+    "strategy", [ExactTotalCount(), EstimatedTotalCount(exact_count_threshold=0)]
+)
+def test_total_count_benchmark(strategy, db, settings, record_property):
+    # given
+    settings.TOTAL_COUNT_ESTIMATES_ENABLED = True
+    Book.objects.bulk_create([Book(name=f"Book{index}") for index in range(20000)])
+    qs = Book.objects.filter(name__startswith="Book")
+
+    # when
+    start = time.perf_counter()
+    total_count = strategy.get_total_count(qs)
+    duration = time.perf_counter() - start
+
+    # then
+    record_property("duration_ms", duration * 1000)
+    assert total_count > 0
+    cache.clear()
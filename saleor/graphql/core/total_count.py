@@ -0,0 +1,103 @@
+"""Strategies counting all records of a countable connection.
+
+`CountableConnection.total_count_strategy` decides how `totalCount` is resolved.
+Counting all rows matching the filters of a large table takes longer than reading
+a page of them, so connections over such tables can use `EstimatedTotalCount`.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import QuerySet
+
+TOTAL_COUNT_CACHE_KEY_PREFIX = "graphql_total_count"
+
+
+class ExactTotalCount:
+    """Count all records with `SELECT COUNT(*)`."""
+
+    def get_total_count(self, qs: QuerySet) -> int:
+        return qs.count()
+
+
+def _normalize_cache_key_param(param):
+    # visibility filters compare with the current time, which would make every key
+    # unique, so times are truncated to the cache timeout
+    if isinstance(param, datetime):
+        timeout = max(int(settings.TOTAL_COUNT_CACHE_TIMEOUT), 1)
+        return int(param.timestamp()) // timeout
+    return param
+
+
+def get_total_count_cache_key(qs: QuerySet) -> str:
+    """Return a cache key of the count of the queryset.
+
+    The key is built from the SQL of the unordered query with its params, so it
+    covers the filters and the visibility restrictions applied to the queryset
+    for the requestor's permissions. Datetime params are truncated to
+    `TOTAL_COUNT_CACHE_TIMEOUT` seconds.
+    """
+    sql, params = qs.order_by().query.sql_with_params()
+    params = tuple(_normalize_cache_key_param(param) for param in params)
+    query_hash = hashlib.sha256(f"{qs.db}:{sql}:{params!r}".encode()).hexdigest()
+    return f"{TOTAL_COUNT_CACHE_KEY_PREFIX}:{query_hash}"
+
+
+def get_estimated_count(qs: QuerySet) -> int:
+    """Return the number of rows estimated by the PostgreSQL query planner."""
+    sql, params = qs.order_by().query.sql_with_params()
+    with connections[qs.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def is_filtered(qs: QuerySet) -> bool:
+    """Return whether the queryset reads only a subset of the table's rows."""
+    return bool(qs.query.where) or bool(qs.query.distinct)
+
+
+class EstimatedTotalCount(ExactTotalCount):
+    """Read large counts from the query planner's estimate.
+
+    Enabled with `TOTAL_COUNT_ESTIMATES_ENABLED`. The estimate of a query without
+    filters is based on the table statistics and is returned when it is at least
+    `exact_count_threshold`. Estimates of filtered queries, including visibility
+    restrictions, can be off by orders of magnitude, so they are returned only
+    above `TOTAL_COUNT_FILTERED_ESTIMATE_MARGIN` times the threshold. Otherwise
+    records are counted exactly. Counts are cached for `TOTAL_COUNT_CACHE_TIMEOUT`
+    seconds.
+    """
+
+    def __init__(self, exact_count_threshold: Optional[int] = None):
+        self.exact_count_threshold = exact_count_threshold
+
+    def get_exact_count_threshold(self, qs: QuerySet) -> int:
+        threshold = self.exact_count_threshold
+        if threshold is None:
+            threshold = settings.TOTAL_COUNT_EXACT_THRESHOLD
+        if is_filtered(qs):
+            threshold *= settings.TOTAL_COUNT_FILTERED_ESTIMATE_MARGIN
+        return threshold
+
+    def get_total_count(self, qs: QuerySet) -> int:
+        if not settings.TOTAL_COUNT_ESTIMATES_ENABLED:
+            return super().get_total_count(qs)
+
+        cache_key = get_total_count_cache_key(qs)
+        total_count = cache.get(cache_key)
+        if total_count is not None:
+            return total_count
+
+        total_count = get_estimated_count(qs)
+        if total_count < self.get_exact_count_threshold(qs):
+            total_count = super().get_total_count(qs)
+        cache.set(cache_key, total_count, settings.TOTAL_COUNT_CACHE_TIMEOUT)
+        return total_count
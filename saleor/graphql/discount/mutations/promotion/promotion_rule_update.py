@@ -78,6 +78,8 @@ class PromotionRuleUpdate(ModelMutation):
         data = data.get("input")
         cleaned_input = cls.clean_input(info, instance, data)
         instance = cls.construct_instance(instance, cleaned_input)
+        if "catalogue_predicate" in cleaned_input:
+            instance.variants_dirty = True
 
         previous_products = get_products_for_rule(instance)
         previous_product_ids = set(previous_products.values_list("id", flat=True))
@@ -109,6 +109,8 @@ class PromotionUpdate(ModelMutation):
         # update the product undiscounted prices for promotion only when
         # start or end date has changed
         if "start_date" in cleaned_input or "end_date" in cleaned_input:
+            # variants of rules of finished promotions are not kept up to date
+            instance.rules.update(variants_dirty=True)
             update_products_discounted_prices_of_promotion_task.delay(instance.pk)
 
     @classmethod
@@ -98,7 +98,10 @@ class SaleAddCatalogues(SaleBaseCatalogueMutation):
             new_predicate = convert_catalogue_info_into_predicate(new_catalogue)
             for rule in rules:
                 rule.catalogue_predicate = new_predicate
-            PromotionRule.objects.bulk_update(rules, ["catalogue_predicate"])
+                rule.variants_dirty = True
+            PromotionRule.objects.bulk_update(
+                rules, ["catalogue_predicate", "variants_dirty"]
+            )
             return new_catalogue
 
         return previous_catalogue_info
@@ -147,6 +147,7 @@ class SaleUpdate(ModelMutation):
             predicate = cls.create_predicate(input)
             for rule in rules:
                 rule.catalogue_predicate = predicate
+                rule.variants_dirty = True
 
     @staticmethod
     def create_predicate(input):
@@ -753,3 +753,38 @@ def test_promotion_rule_update_events(
     assert PromotionEvents.RULE_UPDATED.upper() == events[0]["type"]
 
     assert events[0]["ruleId"] == rule_id
+
+
+@patch(
+    "saleor.product.tasks.update_products_discounted_prices_for_promotion_task.delay"
+)
+def test_promotion_rule_update_catalogue_predicate_marks_variants_as_dirty(
+    update_products_discounted_prices_for_promotion_task_mock,
+    staff_api_client,
+    permission_group_manage_discounts,
+    promotion,
+    product_list,
+):
+    # given
+    permission_group_manage_discounts.user_set.add(staff_api_client.user)
+    rule = promotion.rules.first()
+    rule.variants_dirty = False
+    rule.save(update_fields=["variants_dirty"])
+    catalogue_predicate = {
+        "productPredicate": {
+            "ids": [graphene.Node.to_global_id("Product", product_list[0].id)]
+        }
+    }
+    variables = {
+        "id": graphene.Node.to_global_id("PromotionRule", rule.id),
+        "input": {"cataloguePredicate": catalogue_predicate},
+    }
+
+    # when
+    response = staff_api_client.post_graphql(PROMOTION_RULE_UPDATE_MUTATION, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["promotionRuleUpdate"]["errors"]
+    rule.refresh_from_db()
+    assert rule.variants_dirty is True
@@ -8,6 +8,8 @@ from freezegun import freeze_time
 from .....discount import PromotionEvents
 from .....discount.error_codes import PromotionCreateErrorCode
 from .....discount.models import PromotionEvent
+from .....discount.utils import fetch_active_promotion_rules
+from .....product.models import ProductVariant
 from ....tests.utils import assert_no_permission, get_graphql_content
 
 PROMOTION_UPDATE_MUTATION = """
@@ -365,3 +367,43 @@ def test_promotion_update_events(
     assert PromotionEvent.objects.count() == event_count + 2
     assert PromotionEvents.PROMOTION_UPDATED.upper() in event_types
     assert PromotionEvents.PROMOTION_STARTED.upper() in event_types
+
+
+@patch("saleor.product.tasks.update_products_discounted_prices_of_promotion_task.delay")
+def test_promotion_update_extends_finished_promotion_rebuilds_rule_variants(
+    update_products_discounted_prices_of_promotion_task_mock,
+    staff_api_client,
+    permission_group_manage_discounts,
+    promotion,
+    product,
+):
+    # given
+    permission_group_manage_discounts.user_set.add(staff_api_client.user)
+    promotion.start_date = timezone.now() - timedelta(days=10)
+    promotion.end_date = timezone.now() - timedelta(days=1)
+    promotion.save(update_fields=["start_date", "end_date"])
+    # the products of the rules changed after the promotion finished
+    promotion.rules.update(variants_dirty=False)
+    for rule in promotion.rules.all():
+        rule.variants.clear()
+    variants = ProductVariant.objects.filter(product=product)
+
+    variables = {
+        "id": graphene.Node.to_global_id("Promotion", promotion.id),
+        "input": {"endDate": (timezone.now() + timedelta(days=10)).isoformat()},
+    }
+
+    # when
+    response = staff_api_client.post_graphql(PROMOTION_UPDATE_MUTATION, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["promotionUpdate"]["errors"]
+    assert all(rule.variants_dirty for rule in promotion.rules.all())
+    rules_info = fetch_active_promotion_rules(variants)[promotion.id]
+    product_rule_info = next(
+        info
+        for info in rules_info
+        if "productPredicate" in info.rule.catalogue_predicate
+    )
+    assert set(product_rule_info.variant_ids) == {variant.id for variant in variants}
@@ -0,0 +1,162 @@
+"""Per-process cache of parsed and validated GraphQL documents.
+
+Storefronts send the same query strings over and over again, yet every request
+parses the query, validates it against the schema and walks the AST once more to
+compute its cost. Documents are cached by the hash of the query string together
+with the result of schema validation, so a repeated query is neither parsed nor
+validated again.
+
+The query cost depends on variables only through the arguments used as cost
+multipliers (e.g. `first` and `last`), so the cost analysis is cached per query
+and the values of just those variables.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from django.conf import settings
+from graphql import GraphQLDocument
+from graphql.error import GraphQLError
+from graphql.language.visitor import Visitor, visit
+from graphql.validation import validate
+
+from ..core.utils.lru_cache import LRUCache
+from .core.validators.query_cost import validate_query_cost
+from .utils import query_fingerprint, query_identifier
+
+
+@dataclass(frozen=True)
+class CachedDocument:
+    """Parsed document with data that depends only on the query string."""
+
+    key: tuple
+    document: GraphQLDocument
+    validation_errors: Optional[list[GraphQLError]]
+    query_identifier: str
+    query_fingerprint: str
+    # Variables whose values can change the query cost.
+    cost_variables: tuple[str, ...]
+
+
+parsed_documents = LRUCache(maxsize=settings.GRAPHQL_DOCUMENT_CACHE_SIZE)
+query_costs = LRUCache(maxsize=settings.GRAPHQL_DOCUMENT_CACHE_SIZE)
+
+
+class CostVariablesVisitor(Visitor):
+    def __init__(self, argument_names: set[str]):
+        self.argument_names = argument_names
+        self.variable_names: set[str] = set()
+        self.cost_argument_depth = 0
+
+    def enter_Argument(self, node, *_args):
+        if node.name.value in self.argument_names:
+            self.cost_argument_depth += 1
+
+    def leave_Argument(self, node, *_args):
+        if node.name.value in self.argument_names:
+            self.cost_argument_depth -= 1
+
+    def enter_Variable(self, node, *_args):
+        if self.cost_argument_depth:
+            self.variable_names.add(node.name.value)
+
+
+def get_query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def get_multiplier_argument_names(cost_map: dict[str, dict[str, Any]]) -> set[str]:
+    return {
+        multiplier.split(".")[0]
+        for type_costs in cost_map.values()
+        for field_cost in type_costs.values()
+        for multiplier in field_cost.get("multipliers", [])
+    }
+
+
+def get_cost_variables(document: GraphQLDocument, cost_map) -> tuple[str, ...]:
+    visitor = CostVariablesVisitor(get_multiplier_argument_names(cost_map))
+    visit(document.document_ast, visitor)
+    return tuple(sorted(visitor.variable_names))
+
+
+def get_document(backend, schema, query: str, cost_map) -> CachedDocument:
+    """Return the parsed and validated document for the query string.
+
+    Raises the same exceptions as `backend.document_from_string` for queries that
+    can't be parsed; those are never cached.
+    """
+    key = (id(schema), id(backend), get_query_hash(query))
+    cached_document = parsed_documents.get(key)
+    if cached_document is None:
+        document = backend.document_from_string(schema, query)
+        cached_document = CachedDocument(
+            key=key,
+            document=document,
+            validation_errors=validate(schema, document.document_ast) or None,
+            query_identifier=query_identifier(document),
+            query_fingerprint=query_fingerprint(document),
+            cost_variables=get_cost_variables(document, cost_map),
+        )
+        parsed_documents.set(key, cached_document)
+    return cached_document
+
+
+def _get_cost_variables_key(
+    cached_document: CachedDocument, variables
+) -> Optional[str]:
+    if variables is None:
+        variables = {}
+    if not isinstance(variables, dict):
+        return None
+    try:
+        # Missing variables and variables set to null are resolved differently.
+        return json.dumps(
+            [
+                (name in variables, variables.get(name))
+                for name in cached_document.cost_variables
+            ]
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def get_query_cost(
+    schema, cached_document: CachedDocument, variables, cost_map, maximum_cost
+):
+    """Return the query cost and cost errors like `validate_query_cost` does."""
+    variables_key = _get_cost_variables_key(cached_document, variables)
+    if variables_key is None:
+        return validate_query_cost(
+            schema, cached_document.document, variables, cost_map, maximum_cost
+        )
+    key = (cached_document.key, maximum_cost, variables_key)
+    cost = query_costs.get(key)
+    if cost is None:
+        cost = validate_query_cost(
+            schema, cached_document.document, variables, cost_map, maximum_cost
+        )
+        query_costs.set(key, cost)
+    return cost
+
+
+def get_document_cache_stats() -> dict[str, dict[str, int]]:
+    return {
+        "documents": {
+            "size": len(parsed_documents),
+            "hits": parsed_documents.hits,
+            "misses": parsed_documents.misses,
+        },
+        "costs": {
+            "size": len(query_costs),
+            "hits": query_costs.hits,
+            "misses": query_costs.misses,
+        },
+    }
+
+
+def clear_document_cache():
+    parsed_documents.clear()
+    query_costs.clear()
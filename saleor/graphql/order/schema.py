@@ -1,8 +1,5 @@
-from typing import Optional
-
 import graphene
 from django.core.exceptions import ValidationError
-from graphql import GraphQLError
 
 from ...order import models
 from ...permission.enums import OrderPermissions
@@ -21,6 +18,11 @@ from ..core.scalars import UUID
 from ..core.types import FilterInputObjectType, TaxedMoney
 from ..core.utils import ext_ref_to_global_id_or_error, from_global_id_or_error
 from ..core.validators import validate_one_of_args_is_in_query
+from ..utils.sorting import (
+    search_string_in_kwargs,
+    sort_field_from_kwargs,
+    validate_rank_sorting,
+)
 from .bulk_mutations.draft_orders import DraftOrderBulkDelete, DraftOrderLinesBulkDelete
 from .bulk_mutations.order_bulk_cancel import OrderBulkCancel
 from .bulk_mutations.order_bulk_create import OrderBulkCreate
@@ -67,15 +69,6 @@ from .sorters import OrderSortField, OrderSortingInput
 from .types import Order, OrderCountableConnection, OrderEventCountableConnection
 
 
-def search_string_in_kwargs(kwargs: dict) -> bool:
-    filter_search = kwargs.get("filter", {}).get("search", "") or ""
-    return bool(filter_search.strip())
-
-
-def sort_field_from_kwargs(kwargs: dict) -> Optional[list[str]]:
-    return kwargs.get("sort_by", {}).get("field") or None
-
-
 class OrderFilterInput(FilterInputObjectType):
     class Meta:
         doc_category = DOC_CATEGORY_ORDERS
@@ -172,12 +165,7 @@ class OrderQueries(graphene.ObjectType):
 
     @staticmethod
     def resolve_orders(_root, info: ResolveInfo, *, channel=None, **kwargs):
-        if sort_field_from_kwargs(kwargs) == OrderSortField.RANK:
-            # sort by RANK can be used only with search filter
-            if not search_string_in_kwargs(kwargs):
-                raise GraphQLError(
-                    "Sorting by RANK is available only when using a search filter."
-                )
+        validate_rank_sorting(kwargs, OrderSortField)
         if search_string_in_kwargs(kwargs) and not sort_field_from_kwargs(kwargs):
             # default to sorting by RANK if search is used
             # and no explicit sorting is requested
@@ -191,12 +179,7 @@ class OrderQueries(graphene.ObjectType):
 
     @staticmethod
     def resolve_draft_orders(_root, info: ResolveInfo, **kwargs):
-        if sort_field_from_kwargs(kwargs) == OrderSortField.RANK:
-            # sort by RANK can be used only with search filter
-            if not search_string_in_kwargs(kwargs):
-                raise GraphQLError(
-                    "Sorting by RANK is available only when using a search filter."
-                )
+        validate_rank_sorting(kwargs, OrderSortField)
         if search_string_in_kwargs(kwargs) and not sort_field_from_kwargs(kwargs):
             # default to sorting by RANK if search is used
             # and no explicit sorting is requested
@@ -0,0 +1,94 @@
+"""Automatic persisted queries.
+
+Clients following the persisted-query protocol send only the SHA-256 hash of the
+query in `extensions.persistedQuery.sha256Hash`. When the hash is unknown, the API
+replies with `PersistedQueryNotFound` and the client repeats the request with both
+the query and its hash, which registers the query for subsequent requests.
+"""
+
+import hashlib
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql.error import GraphQLError
+
+PERSISTED_QUERY_CACHE_KEY_PREFIX = "persisted_query"
+PERSISTED_QUERY_VERSION = 1
+
+
+class PersistedQueryError(GraphQLError):
+    code: str
+
+    def __init__(self, message: str):
+        super().__init__(message, extensions={"code": self.code})
+
+
+class PersistedQueryNotFound(PersistedQueryError):
+    code = "PERSISTED_QUERY_NOT_FOUND"
+
+    def __init__(self):
+        super().__init__("PersistedQueryNotFound")
+
+
+class PersistedQueryNotSupported(PersistedQueryError):
+    code = "PERSISTED_QUERY_NOT_SUPPORTED"
+
+    def __init__(self):
+        super().__init__("PersistedQueryNotSupported")
+
+
+class PersistedQueryHashMismatch(PersistedQueryError):
+    code = "PERSISTED_QUERY_HASH_MISMATCH"
+
+    def __init__(self):
+        super().__init__("Provided sha does not match query.")
+
+
+def get_persisted_query_hash(extensions) -> Optional[str]:
+    """Return the query hash sent in the `persistedQuery` extension, if any."""
+    if not isinstance(extensions, dict):
+        return None
+    persisted_query = extensions.get("persistedQuery")
+    if not isinstance(persisted_query, dict):
+        return None
+    if persisted_query.get("version") != PERSISTED_QUERY_VERSION:
+        raise PersistedQueryNotSupported()
+    query_hash = persisted_query.get("sha256Hash")
+    if not isinstance(query_hash, str):
+        raise PersistedQueryNotFound()
+    return query_hash.lower()
+
+
+def get_persisted_query_cache_key(query_hash: str) -> str:
+    return f"{PERSISTED_QUERY_CACHE_KEY_PREFIX}:{query_hash}"
+
+
+def resolve_persisted_query(query: Optional[str], extensions) -> Optional[str]:
+    """Return the query to execute for a request with the given extensions.
+
+    Requests sending only the hash get the registered query or raise
+    `PersistedQueryNotFound`. Requests sending both the query and its hash register
+    the query under that hash.
+    """
+    query_hash = get_persisted_query_hash(extensions)
+    if query_hash is None:
+        return query
+    if not settings.PERSISTED_QUERIES_ENABLED:
+        if not query:
+            raise PersistedQueryNotSupported()
+        return query
+
+    cache_key = get_persisted_query_cache_key(query_hash)
+    if not query:
+        persisted_query = cache.get(cache_key)
+        if persisted_query is None:
+            raise PersistedQueryNotFound()
+        return persisted_query
+
+    if not isinstance(query, str):
+        return query
+    if hashlib.sha256(query.encode("utf-8")).hexdigest() != query_hash:
+        raise PersistedQueryHashMismatch()
+    cache.set(cache_key, query, settings.PERSISTED_QUERIES_TTL)
+    return query
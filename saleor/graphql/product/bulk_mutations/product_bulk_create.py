@@ -10,6 +10,7 @@ from django.utils.text import slugify
 from graphene.utils.str_converters import to_camel_case
 from text_unidecode import unidecode
 
+from ....attribute.sort_keys import schedule_products_attribute_sort_keys_update
 from ....core.http_client import HTTPClient
 from ....core.tracing import traced_atomic_transaction
 from ....core.utils import prepare_unique_slug
@@ -754,6 +755,9 @@ class ProductBulkCreate(BaseMutation):
         models.ProductMedia.objects.bulk_create(media_to_create)
         models.ProductChannelListing.objects.bulk_create(listings_to_create)
 
+        schedule_products_attribute_sort_keys_update(
+            [product.pk for product in products_to_create]
+        )
         for product, attributes in attributes_to_save:
             ProductAttributeAssignmentMixin.save(product, attributes)
 
@@ -0,0 +1,108 @@
+import re
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from .....core.reference_data import clear_reference_data_snapshots
+from .....plugins.registry import clear_plugins_snapshots
+from ....tests.utils import get_graphql_content
+
+PRODUCTS_WITH_PRICING_QUERY = """
+    query Products($channel: String) {
+        products(first: 10, channel: $channel) {
+            edges {
+                node {
+                    name
+                    pricing {
+                        priceRange {
+                            start {
+                                gross {
+                                    amount
+                                }
+                            }
+                        }
+                    }
+                    variants {
+                        pricing {
+                            price {
+                                gross {
+                                    amount
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
+REFERENCE_DATA_TABLES = [
+    '"channel_channel"',
+    '"tax_taxconfiguration"',
+    '"tax_taxconfigurationpercountry"',
+    '"tax_taxclasscountryrate"',
+    '"django_site"',
+]
+
+
+@pytest.fixture
+def _reference_data_cache(settings):
+    settings.REFERENCE_DATA_CACHE_ENABLED = True
+    # The plugins manager loads channels on its own.
+    settings.PLUGINS_REGISTRY_CACHE_ENABLED = True
+    clear_reference_data_snapshots()
+    clear_plugins_snapshots()
+    yield
+    clear_reference_data_snapshots()
+    clear_plugins_snapshots()
+
+
+def _get_reference_data_queries(captured_queries):
+    # Only the main table of a query matters, e.g. product queries filter by
+    # channel slug in a subquery.
+    main_tables = [
+        (query["sql"], re.search(r'FROM ("\w+")', query["sql"]))
+        for query in captured_queries
+    ]
+    return [
+        sql
+        for sql, match in main_tables
+        if match and match.group(1) in REFERENCE_DATA_TABLES
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_reference_data_cache")
+def test_product_list_pricing_skips_reference_data_queries_after_warm_up(
+    product_list, api_client, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    get_graphql_content(api_client.post_graphql(PRODUCTS_WITH_PRICING_QUERY, variables))
+
+    # when
+    with CaptureQueriesContext(connection) as captured:
+        response = api_client.post_graphql(PRODUCTS_WITH_PRICING_QUERY, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert len(content["data"]["products"]["edges"]) == len(product_list)
+    assert _get_reference_data_queries(captured.captured_queries) == []
+
+
+@pytest.mark.django_db
+def test_product_list_pricing_reference_data_queries_without_cache(
+    product_list, api_client, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    get_graphql_content(api_client.post_graphql(PRODUCTS_WITH_PRICING_QUERY, variables))
+
+    # when
+    with CaptureQueriesContext(connection) as captured:
+        api_client.post_graphql(PRODUCTS_WITH_PRICING_QUERY, variables)
+
+    # then
+    assert _get_reference_data_queries(captured.captured_queries)
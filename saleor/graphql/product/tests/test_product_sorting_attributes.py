@@ -3,6 +3,7 @@ from decimal import Decimal
 
 import graphene
 import pytest
+from django.core.management import call_command
 
 from ....attribute import AttributeInputType, AttributeType
 from ....attribute import models as attribute_models
@@ -546,6 +547,32 @@ def test_sort_product_by_attribute_multiple_values(
         assert products == list(reversed(EXPECTED_SORTED_DATA_MULTIPLE_VALUES_ASC))
 
 
+@pytest.mark.parametrize("ascending", [True, False])
+def test_sort_product_by_attribute_multiple_values_using_sort_keys(
+    api_client, products_structures, ascending, channel_USD, settings
+):
+    # given
+    attribute, _, _ = products_structures
+    call_command("update_product_attribute_sort_keys")
+    settings.PRODUCT_ATTRIBUTE_SORT_KEYS_ENABLED = True
+    variables = {
+        "attributeId": graphene.Node.to_global_id("Attribute", attribute.pk),
+        "direction": "ASC" if ascending else "DESC",
+        "channel": channel_USD.slug,
+    }
+
+    # when
+    response = api_client.post_graphql(QUERY_SORT_PRODUCTS_BY_ATTRIBUTE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    products = content["data"]["products"]["edges"]
+    if ascending:
+        assert products == EXPECTED_SORTED_DATA_MULTIPLE_VALUES_ASC
+    else:
+        assert products == list(reversed(EXPECTED_SORTED_DATA_MULTIPLE_VALUES_ASC))
+
+
 def test_sort_product_not_having_attribute_data(api_client, category, count_queries):
     """Test sorting when an attribute exists but does not have a value.
 
@@ -72,6 +72,7 @@ from ...core.fields import (
     PermissionsField,
 )
 from ...core.scalars import Date
+from ...core.total_count import EstimatedTotalCount
 from ...core.tracing import traced_resolver
 from ...core.types import (
     BaseObjectType,
@@ -1580,6 +1581,8 @@ class ProductCountableConnection(CountableConnection):
         doc_category = DOC_CATEGORY_PRODUCTS
         node = Product
 
+    total_count_strategy = EstimatedTotalCount()
+
 
 @federated_entity("id")
 class ProductType(ModelObjectType[models.ProductType]):
@@ -2,7 +2,9 @@ import graphene
 from django.core.exceptions import ValidationError
 
 from ....channel import models as channel_models
+from ....core.reference_data import channels as channels_reference_data
 from ....permission.enums import OrderPermissions
+from ....plugins.registry import invalidate_plugins_configuration
 from ....site.error_codes import OrderSettingsErrorCode
 from ...channel.types import OrderSettings
 from ...core import ResolveInfo
@@ -74,6 +76,10 @@ class OrderSettingsUpdate(BaseMutation):
 
         if update_fields:
             channel_models.Channel.objects.update(**update_fields)
+            # `update()` doesn't send model signals, the plugins registry and
+            # channels reference data need to be invalidated explicitly.
+            invalidate_plugins_configuration()
+            channels_reference_data.invalidate()
 
         channel.refresh_from_db()
 
@@ -8,13 +8,18 @@ from django.db.models import Q
 from django.http.request import split_domain_port
 from promise import Promise
 
-from ..core.dataloaders import DataLoader
+from ...core.reference_data import sites
+from ..core.dataloaders import DataLoader, ReferenceDataLoader
 
 
-class SiteByIdLoader(DataLoader[int, Site]):
+class SiteByIdLoader(ReferenceDataLoader[int, Site]):
     context_key = "site_by_id"
+    reference_data = sites
 
-    def batch_load(self, keys):
+    def batch_load_from_snapshot(self, snapshot, keys):
+        return snapshot.get_many("pk", keys)
+
+    def batch_load_from_database(self, keys):
         sites_mapped = Site.objects.using(self.database_connection_name).in_bulk(keys)
         return [sites_mapped.get(site_id) for site_id in keys]
 
@@ -4,13 +4,18 @@ from decimal import Decimal
 from django.db.models import Exists, OuterRef
 from promise import Promise
 
+from ...core.reference_data import (
+    tax_class_country_rates,
+    tax_configurations,
+    tax_configurations_per_country,
+)
 from ...tax.models import (
     TaxClass,
     TaxClassCountryRate,
     TaxConfiguration,
     TaxConfigurationPerCountry,
 )
-from ..core.dataloaders import DataLoader
+from ..core.dataloaders import DataLoader, ReferenceDataLoader
 from ..product.dataloaders import (
     ProductByIdLoader,
     ProductByVariantIdLoader,
@@ -19,10 +24,14 @@ from ..product.dataloaders import (
 )
 
 
-class TaxConfigurationPerCountryByTaxConfigurationIDLoader(DataLoader):
+class TaxConfigurationPerCountryByTaxConfigurationIDLoader(ReferenceDataLoader):
     context_key = "tax_configuration_per_country_by_tax_configuration_id"
+    reference_data = tax_configurations_per_country
 
-    def batch_load(self, keys):
+    def batch_load_from_snapshot(self, snapshot, keys):
+        return snapshot.get_grouped("tax_configuration_id", keys)
+
+    def batch_load_from_database(self, keys):
         tax_configs_per_country = TaxConfigurationPerCountry.objects.using(
             self.database_connection_name
         ).filter(tax_configuration_id__in=keys)
@@ -34,20 +43,30 @@ class TaxConfigurationPerCountryByTaxConfigurationIDLoader(DataLoader):
         return [one_to_many[key] for key in keys]
 
 
-class TaxConfigurationByChannelId(DataLoader[int, TaxConfiguration]):
+class TaxConfigurationByChannelId(ReferenceDataLoader[int, TaxConfiguration]):
     context_key = "tax_configuration_by_channel_id"
+    reference_data = tax_configurations
 
-    def batch_load(self, keys):
+    def batch_load_from_snapshot(self, snapshot, keys):
+        return snapshot.get_many("channel_id", keys)
+
+    def batch_load_from_database(self, keys):
         tax_configs = TaxConfiguration.objects.using(
             self.database_connection_name
         ).in_bulk(keys, field_name="channel_id")
         return [tax_configs[key] for key in keys]
 
 
-class TaxClassCountryRateByTaxClassIDLoader(DataLoader[int, list[TaxClassCountryRate]]):
+class TaxClassCountryRateByTaxClassIDLoader(
+    ReferenceDataLoader[int, list[TaxClassCountryRate]]
+):
     context_key = "tax_class_country_rate_by_tax_class_id"
+    reference_data = tax_class_country_rates
 
-    def batch_load(self, keys):
+    def batch_load_from_snapshot(self, snapshot, keys):
+        return snapshot.get_grouped("tax_class_id", keys)
+
+    def batch_load_from_database(self, keys):
         tax_rates = TaxClassCountryRate.objects.using(
             self.database_connection_name
         ).filter(tax_class_id__in=keys)
@@ -59,10 +78,16 @@ class TaxClassCountryRateByTaxClassIDLoader(DataLoader[int, list[TaxClassCountry
         return [one_to_many[key] for key in keys]
 
 
-class TaxClassDefaultRateByCountryLoader(DataLoader):
+class TaxClassDefaultRateByCountryLoader(ReferenceDataLoader):
     context_key = "tax_class_default_rate_by_country"
+    reference_data = tax_class_country_rates
 
-    def batch_load(self, keys):
+    def batch_load_from_snapshot(self, snapshot, keys):
+        [default_rates] = snapshot.get_grouped("tax_class_id", [None])
+        tax_rates_map = {rate.country.code: rate for rate in default_rates}
+        return [tax_rates_map.get(key) for key in keys]
+
+    def batch_load_from_database(self, keys):
         tax_rates = TaxClassCountryRate.objects.using(
             self.database_connection_name
         ).filter(tax_class=None, country__in=keys)
@@ -1,5 +1,6 @@
 import graphene
 
+from ....core.reference_data import tax_class_country_rates
 from ....permission.enums import CheckoutPermissions
 from ....tax import error_codes, models
 from ...account.enums import CountryCodeEnum
@@ -74,6 +75,8 @@ class TaxClassCreate(ModelMutation):
             for item in country_rates
         ]
         models.TaxClassCountryRate.objects.bulk_create(to_create)
+        # `bulk_create` doesn't send model signals.
+        tax_class_country_rates.invalidate()
 
     @classmethod
     def save(cls, _info, instance, cleaned_input):
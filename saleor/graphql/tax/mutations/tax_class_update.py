@@ -1,6 +1,7 @@
 import graphene
 from django.core.exceptions import ValidationError
 
+from ....core.reference_data import tax_class_country_rates
 from ....permission.enums import CheckoutPermissions
 from ....tax import error_codes, models
 from ...account.enums import CountryCodeEnum
@@ -124,6 +125,8 @@ class TaxClassUpdate(ModelMutation):
             and item.get("rate") is not None
         ]
         models.TaxClassCountryRate.objects.bulk_create(to_create)
+        # `bulk_update` and `bulk_create` don't send model signals.
+        tax_class_country_rates.invalidate()
 
         # Delete instances where null rates were provided.
         to_delete = [
@@ -1,6 +1,7 @@
 import graphene
 from django.core.exceptions import ValidationError
 
+from ....core.reference_data import tax_configurations_per_country
 from ....permission.enums import CheckoutPermissions
 from ....tax import error_codes, models
 from ...account.enums import CountryCodeEnum
@@ -172,6 +173,8 @@ class TaxConfigurationUpdate(ModelMutation):
             if item["country_code"] not in updated_countries
         ]
         models.TaxConfigurationPerCountry.objects.bulk_create(to_create)
+        # `bulk_update` and `bulk_create` don't send model signals.
+        tax_configurations_per_country.invalidate()
 
     @classmethod
     def remove_countries_configuration(cls, country_codes):
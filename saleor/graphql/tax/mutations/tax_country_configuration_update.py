@@ -6,6 +6,7 @@ from django.db.models import Q
 from django_countries.fields import Country
 from graphql import GraphQLError
 
+from ....core.reference_data import tax_class_country_rates
 from ....permission.enums import CheckoutPermissions
 from ....tax import error_codes, models
 from ...account.enums import CountryCodeEnum
@@ -217,6 +218,8 @@ class TaxCountryConfigurationUpdate(BaseMutation):
                 )
                 to_create.append(obj)
         models.TaxClassCountryRate.objects.bulk_create(to_create)
+        # `bulk_update` and `bulk_create` don't send model signals.
+        tax_class_country_rates.invalidate()
 
         # Delete instances where null rates were provided.
         models.TaxClassCountryRate.objects.filter(
@@ -14,6 +14,25 @@ REVERSED_DIRECTION = {
 }
 
 
+def search_string_in_kwargs(kwargs: dict) -> bool:
+    filter_search = kwargs.get("filter", {}).get("search", "") or ""
+    return bool(filter_search.strip())
+
+
+def sort_field_from_kwargs(kwargs: dict) -> Optional[list[str]]:
+    return kwargs.get("sort_by", {}).get("field") or None
+
+
+def validate_rank_sorting(kwargs: dict, sort_enum):
+    """Raise an error when the `RANK` field of the sort enum is used without search."""
+    if sort_field_from_kwargs(kwargs) == sort_enum.RANK:
+        # sort by RANK can be used only with search filter
+        if not search_string_in_kwargs(kwargs):
+            raise GraphQLError(
+                "Sorting by RANK is available only when using a search filter."
+            )
+
+
 def _sort_queryset_by_attribute(queryset, sorting_attribute, sorting_direction):
     if sorting_attribute != "":
         graphene_type, sorting_attribute = from_global_id_or_error(
@@ -63,6 +82,7 @@ def sort_queryset(
         queryset: queryset to be sorted
         reversed: if True, sorting direction will be reversed
         sort_by: dictionary with sorting field and direction
+
     """
     sorting_direction = sort_by.direction
     if reversed:
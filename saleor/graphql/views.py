@@ -23,11 +23,13 @@ from .. import __version__ as saleor_version
 from ..core.exceptions import PermissionDenied, ReadOnlyException
 from ..core.utils import is_valid_ipv4, is_valid_ipv6
 from ..webhook import observability
+from ..webhook.transport.asynchronous.transport import webhook_deliveries_batch
 from .api import API_PATH, schema
 from .context import get_context_value
-from .core.validators.query_cost import validate_query_cost
+from .document_cache import CachedDocument, get_document, get_query_cost
+from .persisted_queries import resolve_persisted_query
 from .query_cost_map import COST_MAP
-from .utils import format_error, query_fingerprint, query_identifier
+from .utils import format_error
 
 INT_ERROR_MSG = "Int cannot represent non 32-bit signed integer value"
 
@@ -107,6 +109,8 @@ class GraphQLView(View):
     def dispatch(self, request, *args, **kwargs):
         # Handle options method the GraphQlView restricts it.
         if request.method == "GET":
+            if self.is_persisted_query_request(request):
+                return self.handle_query(request)
             if settings.PLAYGROUND_ENABLED:
                 return self.render_playground(request)
             return HttpResponseNotAllowed(["OPTIONS", "POST"])
@@ -118,6 +122,12 @@ class GraphQLView(View):
             else:
                 return HttpResponseNotAllowed(["OPTIONS", "POST"])
 
+    @staticmethod
+    def is_persisted_query_request(request: HttpRequest) -> bool:
+        # Persisted queries can be sent over GET, which allows caching anonymous
+        # responses by CDNs.
+        return settings.PERSISTED_QUERIES_ENABLED and "extensions" in request.GET
+
     def render_playground(self, request):
         return render(
             request,
@@ -202,7 +212,8 @@ class GraphQLView(View):
         self, request: HttpRequest, data: dict
     ) -> tuple[Optional[dict[str, list[Any]]], int]:
         with observability.report_gql_operation() as operation:
-            execution_result = self.execute_graphql_request(request, data)
+            with webhook_deliveries_batch():
+                execution_result = self.execute_graphql_request(request, data)
             status_code = 200
             if execution_result:
                 response = {}
@@ -228,12 +239,13 @@ class GraphQLView(View):
 
     def parse_query(
         self, query: Optional[str]
-    ) -> tuple[Optional[GraphQLDocument], Optional[ExecutionResult]]:
+    ) -> tuple[Optional[CachedDocument], Optional[ExecutionResult]]:
         """Attempt to parse a query (mandatory) to a gql document object.
 
         If no query was given or query is not a string, it returns an error.
         If the query is invalid, it returns an error as well.
-        Otherwise, it returns the parsed gql document.
+        Otherwise, it returns the parsed gql document together with the result
+        of its validation, both reused for subsequent requests with the same query.
         """
         if not query or not isinstance(query, str):
             return (
@@ -246,7 +258,7 @@ class GraphQLView(View):
         # Attempt to parse the query, if it fails, return the error
         try:
             return (
-                self.backend.document_from_string(self.schema, query),
+                get_document(self.backend, self.schema, query, COST_MAP),
                 None,
             )
         except (ValueError, GraphQLSyntaxError) as e:
@@ -266,6 +278,15 @@ class GraphQLView(View):
                         raise GraphQLError(msg)
         return query_with_schema
 
+    def check_if_query_is_read_only(
+        self, document: GraphQLDocument, operation_name: Optional[str]
+    ):
+        operation_type = document.get_operation_type(operation_name)
+        if operation_type and operation_type != "query":
+            raise GraphQLError(
+                f"Can only perform a {operation_type} operation from a POST request."
+            )
+
     def execute_graphql_request(self, request: HttpRequest, data: dict):
         with opentracing.global_tracer().start_active_span("graphql_query") as scope:
             span = scope.span
@@ -276,29 +297,36 @@ class GraphQLView(View):
             )
 
             query, variables, operation_name = self.get_graphql_params(request, data)
+            try:
+                query = resolve_persisted_query(query, data.get("extensions"))
+            except GraphQLError as e:
+                return ExecutionResult(errors=[e], invalid=True)
 
-            document, error = self.parse_query(query)
+            cached_document, error = self.parse_query(query)
+            document = cached_document.document if cached_document else None
             with observability.report_gql_operation() as operation:
                 operation.query = document
                 operation.name = operation_name
                 operation.variables = variables
-            if error or document is None:
+            if error or cached_document is None or document is None:
                 return error
 
             raw_query_string = document.document_string
             span.set_tag("graphql.query", raw_query_string)
-            span.set_tag("graphql.query_identifier", query_identifier(document))
-            span.set_tag("graphql.query_fingerprint", query_fingerprint(document))
+            span.set_tag("graphql.query_identifier", cached_document.query_identifier)
+            span.set_tag("graphql.query_fingerprint", cached_document.query_fingerprint)
             try:
+                if request.method == "GET":
+                    self.check_if_query_is_read_only(document, operation_name)
                 query_contains_schema = self.check_if_query_contains_only_schema(
                     document
                 )
             except GraphQLError as e:
                 return ExecutionResult(errors=[e], invalid=True)
 
-            query_cost, cost_errors = validate_query_cost(
+            query_cost, cost_errors = get_query_cost(
                 schema,
-                document,
+                cached_document,
                 variables,
                 COST_MAP,
                 settings.GRAPHQL_QUERY_MAX_COMPLEXITY,
@@ -330,13 +358,19 @@ class GraphQLView(View):
                         key = generate_cache_key(raw_query_string)
                         response = cache.get(key)
 
-                    if not response:
+                    if not response and cached_document.validation_errors:
+                        response = ExecutionResult(
+                            errors=cached_document.validation_errors, invalid=True
+                        )
+                    elif not response:
+                        # The document was already validated when it was parsed.
                         response = document.execute(
                             root=self.get_root_value(),
                             variables=variables,
                             operation_name=operation_name,
                             context=context,
                             middleware=self.middleware,
+                            validate=False,
                             **extra_options,
                         )
                         if should_use_cache_for_scheme:
@@ -355,6 +389,12 @@ class GraphQLView(View):
 
     @staticmethod
     def parse_body(request: HttpRequest):
+        if request.method == "GET":
+            data: dict[str, Any] = request.GET.dict()
+            for key in ["variables", "extensions"]:
+                if key in data:
+                    data[key] = json.loads(data[key])
+            return data
         content_type = request.content_type
         if content_type == "application/graphql":
             return {"query": request.body.decode("utf-8")}
@@ -17,6 +17,7 @@ from django.utils import timezone
 from django_stubs_ext import WithAnnotations
 
 from ...channel.models import Channel
+from ...core.reference_data import warehouses as warehouses_reference_data
 from ...product.models import ProductVariantChannelListing
 from ...warehouse import WarehouseClickAndCollectOption
 from ...warehouse.models import (
@@ -28,7 +29,7 @@ from ...warehouse.models import (
     Warehouse,
 )
 from ...warehouse.reservations import is_reservation_enabled
-from ..core.dataloaders import DataLoader
+from ..core.dataloaders import DataLoader, ReferenceDataLoader
 from ..site.dataloaders import get_site_promise
 
 if TYPE_CHECKING:
@@ -544,10 +545,16 @@ class PreorderQuantityReservedByVariantChannelListingIdLoader(DataLoader[int, in
         return [reservations_by_listing_id[key] for key in keys]
 
 
-class WarehouseByIdLoader(DataLoader):
+class WarehouseByIdLoader(ReferenceDataLoader):
     context_key = "warehouse_by_id"
+    reference_data = warehouses_reference_data
 
-    def batch_load(self, keys: Iterable[UUID]) -> list[Optional[Warehouse]]:
+    def batch_load_from_snapshot(self, snapshot, keys: Iterable[UUID]):
+        return snapshot.get_many("pk", [UUID(str(key)) for key in keys])
+
+    def batch_load_from_database(
+        self, keys: Iterable[UUID]
+    ) -> list[Optional[Warehouse]]:
         warehouses = (
             Warehouse.objects.all().using(self.database_connection_name).in_bulk(keys)
         )
@@ -4,14 +4,17 @@ from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.utils import timezone
 from django.utils.functional import SimpleLazyObject
-from graphql import get_default_backend, parse
+from graphql import get_default_backend
 from graphql.error import GraphQLError
+from graphql.execution import ExecutionResult
 from promise import Promise
 
 from ...app.models import App
 from ...core.exceptions import PermissionDenied
 from ...core.utils import get_domain
 from ..core import SaleorContext
+from ..document_cache import get_document
+from ..query_cost_map import COST_MAP
 from ..utils import format_error
 
 logger = get_task_logger(__name__)
@@ -49,6 +52,27 @@ def initialize_request(
     return request
 
 
+def get_subscription_context(
+    request: SaleorContext, app: Optional[App]
+) -> SaleorContext:
+    """Prepare the request to execute a subscription query on behalf of the app.
+
+    The same request can be used to generate payloads of one event for multiple
+    webhooks. Data loaders are then shared by all apps with the same permissions, as
+    loaders limit their results only based on the requestor's permissions.
+    """
+    from ..context import get_context_value
+
+    request.app = app
+    if not hasattr(request, "dataloaders_by_permissions"):
+        get_context_value(request)
+        request.dataloaders_by_permissions = {}
+
+    permissions = frozenset(app.get_permissions()) if app else frozenset()
+    request.dataloaders = request.dataloaders_by_permissions.setdefault(permissions, {})
+    return request
+
+
 def get_event_payload(event):
     # Queries that use dataloaders return Promise object for the "event" field. In that
     # case, we need to resolve them first.
@@ -73,7 +97,7 @@ def generate_payload_from_subscription(
     subscribable_object: is an object which have a dedicated own type in Subscription
     definition.
     subscription_query: query used to prepare a payload via graphql engine.
-    context: A dummy request used to share context between apps in order to use
+    request: A dummy request used to share context between apps in order to use
     dataloaders benefits.
     app: the owner of the given payload. Required in case when webhook contains
     protected fields.
@@ -81,21 +105,26 @@ def generate_payload_from_subscription(
     generate a payload
     """
     from ..api import schema
-    from ..context import get_context_value
 
-    graphql_backend = get_default_backend()
-    ast = parse(subscription_query)  # type: ignore
-    document = graphql_backend.document_from_string(
+    # Subscription queries are parsed and validated once per process.
+    cached_document = get_document(
+        get_default_backend(),
         schema,
-        ast,
+        subscription_query,  # type: ignore[arg-type]
+        COST_MAP,
     )
     app_id = app.pk if app else None
-    request.app = app
-    results = document.execute(
-        allow_subscriptions=True,
-        root=(event_type, subscribable_object),
-        context=get_context_value(request),
-    )
+    if cached_document.validation_errors:
+        results = ExecutionResult(
+            errors=cached_document.validation_errors, invalid=True
+        )
+    else:
+        results = cached_document.document.execute(
+            allow_subscriptions=True,
+            root=(event_type, subscribable_object),
+            context=get_subscription_context(request, app),
+            validate=False,
+        )
     if hasattr(results, "errors"):
         logger.warning(
             "Unable to build a payload for subscription. \n"
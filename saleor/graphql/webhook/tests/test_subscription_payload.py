@@ -0,0 +1,118 @@
+import json
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ....app.models import App
+from ....webhook.event_types import WebhookEventAsyncType
+from ....webhook.models import Webhook
+from ....webhook.transport.asynchronous.transport import (
+    create_deliveries_for_subscriptions,
+)
+from ...order.dataloaders import OrderByIdLoader
+from ..subscription_payload import get_subscription_context, initialize_request
+
+ORDER_UPDATED_WITH_DETAILS = """
+    subscription{
+      event{
+        ...on OrderUpdated{
+          order{
+            id
+            channel{
+              slug
+            }
+            user{
+              email
+            }
+            lines{
+              productName
+              variant{
+                sku
+              }
+            }
+          }
+        }
+      }
+    }
+"""
+
+
+def _create_apps_with_webhooks(count, permissions, query, event_type):
+    webhooks = []
+    for index in range(count):
+        app = App.objects.create(name=f"App {index}", is_active=True)
+        app.permissions.add(*permissions)
+        webhook = Webhook.objects.create(
+            name=f"Webhook {index}",
+            app=app,
+            target_url="http://www.example.com/any",
+            subscription_query=query,
+        )
+        webhook.events.create(event_type=event_type)
+        webhooks.append(webhook)
+    return webhooks
+
+
+def test_get_subscription_context_shares_dataloaders_for_same_permissions(
+    permission_manage_orders,
+):
+    # given
+    app_a, app_b = App.objects.bulk_create([App(name="A"), App(name="B")])
+    app_a.permissions.add(permission_manage_orders)
+    app_b.permissions.add(permission_manage_orders)
+    request = initialize_request()
+    loader = OrderByIdLoader(get_subscription_context(request, app_a))
+
+    # when
+    context = get_subscription_context(request, app_b)
+
+    # then
+    assert context.app == app_b
+    assert OrderByIdLoader(context) is loader
+
+
+def test_get_subscription_context_separates_dataloaders_for_different_permissions(
+    permission_manage_orders,
+):
+    # given
+    app_a, app_b = App.objects.bulk_create([App(name="A"), App(name="B")])
+    app_a.permissions.add(permission_manage_orders)
+    request = initialize_request()
+    loader = OrderByIdLoader(get_subscription_context(request, app_a))
+
+    # when
+    context = get_subscription_context(request, app_b)
+
+    # then
+    assert OrderByIdLoader(context) is not loader
+
+
+def test_create_deliveries_for_subscriptions_loads_data_once_for_all_apps(
+    order_with_lines, permission_manage_orders
+):
+    # given
+    event_type = WebhookEventAsyncType.ORDER_UPDATED
+    query = ORDER_UPDATED_WITH_DETAILS
+    [single_webhook] = _create_apps_with_webhooks(
+        1, [permission_manage_orders], query, event_type
+    )
+    webhooks = _create_apps_with_webhooks(
+        4, [permission_manage_orders], query, event_type
+    )
+
+    with CaptureQueriesContext(connection) as single_webhook_queries:
+        create_deliveries_for_subscriptions(
+            event_type, order_with_lines, [single_webhook]
+        )
+
+    # when
+    with CaptureQueriesContext(connection) as queries:
+        deliveries = create_deliveries_for_subscriptions(
+            event_type, order_with_lines, webhooks
+        )
+
+    # then
+    payloads = [json.loads(delivery.payload.payload) for delivery in deliveries]
+    assert all(payload == payloads[0] for payload in payloads)
+    # Only the permissions of every additional app are fetched.
+    assert len(queries) <= len(single_webhook_queries) + len(webhooks) - 1
@@ -0,0 +1,30 @@
+# Generated by Django 3.2.22 on 2023-11-06 10:12
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("order", "0178_merge_20231030_1055"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="order",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                fields=["created_at", "status", "id"],
+                name="order_created_at_status_id_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="order",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                fields=["updated_at", "status", "id"],
+                name="order_updated_at_status_id_idx",
+            ),
+        ),
+    ]
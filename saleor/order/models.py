@@ -353,6 +353,15 @@ class Order(ModelWithMetadata, ModelWithExternalReference):
             ),
             models.Index(fields=["created_at"], name="idx_order_created_at"),
             GinIndex(fields=["voucher_code"], name="order_voucher_code_idx"),
+            # Keyset pagination indexes matching the `OrderSortField` orderings
+            BTreeIndex(
+                fields=["created_at", "status", "id"],
+                name="order_created_at_status_id_idx",
+            ),
+            BTreeIndex(
+                fields=["updated_at", "status", "id"],
+                name="order_updated_at_status_id_idx",
+            ),
         ]
 
     def is_fully_paid(self):
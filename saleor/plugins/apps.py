@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 from django.apps import AppConfig
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.db.models.signals import post_delete, post_save
 from django.utils.module_loading import import_string
 
 if TYPE_CHECKING:
@@ -19,6 +20,27 @@ class PluginConfig(AppConfig):
         for plugin_path in plugins:
             self.load_and_check_plugin(plugin_path)
 
+        self.connect_registry_signals()
+
+    def connect_registry_signals(self):
+        from ..channel.models import Channel
+        from .models import PluginConfiguration
+        from .registry import handle_plugins_configuration_change
+
+        # preventing duplicate signals
+        for model in [PluginConfiguration, Channel]:
+            model_name = model._meta.model_name
+            post_save.connect(
+                handle_plugins_configuration_change,
+                sender=model,
+                dispatch_uid=f"invalidate_plugins_registry_on_{model_name}_save",
+            )
+            post_delete.connect(
+                handle_plugins_configuration_change,
+                sender=model,
+                dispatch_uid=f"invalidate_plugins_registry_on_{model_name}_delete",
+            )
+
     def load_and_check_plugin(self, plugin_path: str):
         try:
             plugin = import_string(plugin_path)
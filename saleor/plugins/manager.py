@@ -12,7 +12,6 @@ from typing import (
 import opentracing
 from django.conf import settings
 from django.http import HttpResponse, HttpResponseNotFound
-from django.utils.module_loading import import_string
 from graphene import Mutation
 from graphql import GraphQLError
 from graphql.execution import ExecutionResult
@@ -53,6 +52,12 @@ from ..payment.interface import (
 from ..tax.utils import calculate_tax_rate
 from .base_plugin import ExcludedShippingMethod, ExternalAccessTokens
 from .models import PluginConfiguration
+from .registry import (
+    get_channel_map,
+    get_db_plugin_configs,
+    get_plugins_snapshot,
+    load_plugins_snapshot,
+)
 
 if TYPE_CHECKING:
     from ..account.models import Address, Group, User
@@ -138,14 +143,17 @@ class PluginsManager(PaymentInterface):
             self.global_plugins = []
             self.plugins_per_channel = defaultdict(list)
 
-            channel_map = self._get_channel_map()
-            global_db_configs, channel_db_configs = self._get_db_plugin_configs(
-                channel_map
-            )
-
-            for plugin_path in plugins:
-                with opentracing.global_tracer().start_active_span(f"{plugin_path}"):
-                    PluginClass = import_string(plugin_path)
+            if settings.PLUGINS_REGISTRY_CACHE_ENABLED:
+                snapshot = get_plugins_snapshot(plugins, self.database)
+            else:
+                snapshot = load_plugins_snapshot(plugins, self.database)
+            channel_map = snapshot.channel_map
+            global_db_configs = snapshot.global_configs
+            channel_db_configs = snapshot.channel_configs
+
+            for PluginClass in snapshot.plugin_classes:
+                plugin_path = f"{PluginClass.__module__}.{PluginClass.__name__}"
+                with opentracing.global_tracer().start_active_span(plugin_path):
                     if not getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
                         plugin = self._load_plugin(
                             PluginClass,
@@ -173,22 +181,7 @@ class PluginsManager(PaymentInterface):
 
     def _get_db_plugin_configs(self, channel_map):
         with opentracing.global_tracer().start_active_span("_get_db_plugin_configs"):
-            plugin_manager_configs = PluginConfiguration.objects.using(
-                self.database
-            ).all()
-            channel_configs: defaultdict[Channel, dict] = defaultdict(dict)
-            global_configs = {}
-            for db_plugin_config in plugin_manager_configs.iterator():
-                channel = channel_map.get(db_plugin_config.channel_id)
-                if channel is None:
-                    global_configs[db_plugin_config.identifier] = db_plugin_config
-                else:
-                    db_plugin_config.channel = channel
-                    channel_configs[channel][
-                        db_plugin_config.identifier
-                    ] = db_plugin_config
-
-            return global_configs, channel_configs
+            return get_db_plugin_configs(channel_map, self.database)
 
     def __run_method_on_plugins(
         self,
@@ -2112,10 +2105,7 @@ class PluginsManager(PaymentInterface):
         return any([plugin.is_event_active(event) for plugin in only_active_plugins])
 
     def _get_channel_map(self):
-        return {
-            channel.pk: channel
-            for channel in Channel.objects.using(self.database).all().iterator()
-        }
+        return get_channel_map(self.database)
 
 
 def get_plugins_manager(
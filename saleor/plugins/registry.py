@@ -0,0 +1,136 @@
+"""Process-wide registry of plugin configuration snapshots.
+
+Building a `PluginsManager` requires importing every plugin class listed in
+`settings.PLUGINS` and fetching all channels and plugin configurations from the
+database. That data changes rarely, so it is kept per process as an immutable
+snapshot and shared by all managers built in that process.
+
+Snapshots are tagged with a version number stored in the Django cache. Saving or
+deleting `PluginConfiguration` and `Channel` objects bumps the version, so the next
+manager built in any process rebuilds its snapshot from the database.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from ..channel.models import Channel
+from .models import PluginConfiguration
+
+if TYPE_CHECKING:
+    from .base_plugin import BasePlugin
+
+PLUGINS_CONFIGURATION_VERSION_CACHE_KEY = "plugins_configuration_version"
+
+
+@dataclass(frozen=True)
+class PluginsSnapshot:
+    """Immutable data required to instantiate plugins for a single manager."""
+
+    version: Optional[int]
+    plugin_classes: tuple[type["BasePlugin"], ...]
+    channel_map: dict[int, Channel]
+    global_configs: dict[str, PluginConfiguration]
+    channel_configs: dict[Channel, dict[str, PluginConfiguration]]
+
+
+_snapshots: dict[tuple[tuple[str, ...], str], PluginsSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def get_channel_map(database: str) -> dict[int, Channel]:
+    return {
+        channel.pk: channel
+        for channel in Channel.objects.using(database).all().iterator()
+    }
+
+
+def get_db_plugin_configs(channel_map: dict[int, Channel], database: str):
+    plugin_manager_configs = PluginConfiguration.objects.using(database).all()
+    channel_configs: defaultdict[Channel, dict] = defaultdict(dict)
+    global_configs = {}
+    for db_plugin_config in plugin_manager_configs.iterator():
+        channel = channel_map.get(db_plugin_config.channel_id)
+        if channel is None:
+            global_configs[db_plugin_config.identifier] = db_plugin_config
+        else:
+            db_plugin_config.channel = channel
+            channel_configs[channel][db_plugin_config.identifier] = db_plugin_config
+    return global_configs, dict(channel_configs)
+
+
+def load_plugins_snapshot(
+    plugins: Iterable[str], database: str, version: Optional[int] = None
+) -> PluginsSnapshot:
+    """Build a snapshot of plugin classes and configurations from the database."""
+    plugin_classes = tuple(import_string(plugin_path) for plugin_path in plugins)
+    channel_map = get_channel_map(database)
+    global_configs, channel_configs = get_db_plugin_configs(channel_map, database)
+    return PluginsSnapshot(
+        version=version,
+        plugin_classes=plugin_classes,
+        channel_map=channel_map,
+        global_configs=global_configs,
+        channel_configs=channel_configs,
+    )
+
+
+def get_plugins_configuration_version() -> int:
+    version = cache.get(PLUGINS_CONFIGURATION_VERSION_CACHE_KEY)
+    if version is None:
+        # The key is seeded with a timestamp rather than zero so that a version
+        # lost on cache eviction is never reused by snapshots built before it.
+        cache.add(PLUGINS_CONFIGURATION_VERSION_CACHE_KEY, time.time_ns(), None)
+        version = cache.get(PLUGINS_CONFIGURATION_VERSION_CACHE_KEY)
+    return version
+
+
+def bump_plugins_configuration_version():
+    try:
+        cache.incr(PLUGINS_CONFIGURATION_VERSION_CACHE_KEY)
+    except ValueError:
+        cache.set(PLUGINS_CONFIGURATION_VERSION_CACHE_KEY, time.time_ns(), None)
+
+
+def invalidate_plugins_configuration():
+    """Mark all cached plugin snapshots as outdated.
+
+    The version is bumped immediately, so the current process sees its own
+    uncommitted changes, and once again after commit, so other processes don't keep
+    a snapshot built from the data that was visible before the commit.
+    """
+    bump_plugins_configuration_version()
+    transaction.on_commit(bump_plugins_configuration_version)
+
+
+def handle_plugins_configuration_change(sender, **kwargs):
+    invalidate_plugins_configuration()
+
+
+def get_plugins_snapshot(plugins: Iterable[str], database: str) -> PluginsSnapshot:
+    """Return the cached snapshot for given plugins, rebuilding it when outdated."""
+    plugins = tuple(plugins)
+    key = (plugins, database)
+    version = get_plugins_configuration_version()
+    snapshot = _snapshots.get(key)
+    if snapshot is not None and snapshot.version == version:
+        return snapshot
+
+    with _snapshots_lock:
+        snapshot = _snapshots.get(key)
+        if snapshot is None or snapshot.version != version:
+            snapshot = load_plugins_snapshot(plugins, database, version)
+            _snapshots[key] = snapshot
+    return snapshot
+
+
+def clear_plugins_snapshots():
+    with _snapshots_lock:
+        _snapshots.clear()
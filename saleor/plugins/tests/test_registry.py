@@ -0,0 +1,126 @@
+import pytest
+
+from ...channel.models import Channel
+from ..manager import get_plugins_manager
+from ..models import PluginConfiguration
+from ..registry import (
+    clear_plugins_snapshots,
+    get_plugins_configuration_version,
+    get_plugins_snapshot,
+    invalidate_plugins_configuration,
+)
+from .sample_plugins import ChannelPluginSample, PluginSample
+
+PLUGINS = [
+    "saleor.plugins.tests.sample_plugins.PluginSample",
+    "saleor.plugins.tests.sample_plugins.ChannelPluginSample",
+]
+
+
+@pytest.fixture(autouse=True)
+def _plugins_registry(settings):
+    settings.PLUGINS = PLUGINS
+    settings.PLUGINS_REGISTRY_CACHE_ENABLED = True
+    clear_plugins_snapshots()
+    yield
+    clear_plugins_snapshots()
+
+
+def test_get_plugins_snapshot_is_reused(channel_USD, settings):
+    # given
+    database = settings.DATABASE_CONNECTION_DEFAULT_NAME
+    snapshot = get_plugins_snapshot(PLUGINS, database)
+
+    # when
+    cached_snapshot = get_plugins_snapshot(PLUGINS, database)
+
+    # then
+    assert cached_snapshot is snapshot
+    assert snapshot.plugin_classes == (PluginSample, ChannelPluginSample)
+    assert snapshot.channel_map == {channel_USD.pk: channel_USD}
+
+
+def test_get_plugins_snapshot_rebuilt_after_invalidation(settings):
+    # given
+    database = settings.DATABASE_CONNECTION_DEFAULT_NAME
+    snapshot = get_plugins_snapshot(PLUGINS, database)
+    version = get_plugins_configuration_version()
+
+    # when
+    invalidate_plugins_configuration()
+
+    # then
+    assert get_plugins_configuration_version() != version
+    assert get_plugins_snapshot(PLUGINS, database) is not snapshot
+
+
+def test_channel_save_invalidates_plugins_registry(channel_USD):
+    # given
+    manager = get_plugins_manager()
+    assert set(manager.plugins_per_channel.keys()) == {channel_USD.slug}
+
+    # when
+    new_channel = Channel.objects.create(
+        name="New channel", slug="new-channel", currency_code="USD"
+    )
+
+    # then
+    manager = get_plugins_manager()
+    assert set(manager.plugins_per_channel.keys()) == {
+        channel_USD.slug,
+        new_channel.slug,
+    }
+
+
+def test_plugin_configuration_save_invalidates_plugins_registry(channel_USD):
+    # given
+    manager = get_plugins_manager()
+    assert manager.get_plugin(PluginSample.PLUGIN_ID).active is True
+
+    # when
+    PluginConfiguration.objects.create(
+        identifier=PluginSample.PLUGIN_ID,
+        active=False,
+        configuration=PluginSample.DEFAULT_CONFIGURATION,
+    )
+
+    # then
+    manager = get_plugins_manager()
+    assert manager.get_plugin(PluginSample.PLUGIN_ID).active is False
+
+
+def test_plugins_registry_builds_new_plugin_instances(channel_USD):
+    # given
+    first_manager = get_plugins_manager(lambda: "first")
+
+    # when
+    second_manager = get_plugins_manager(lambda: "second")
+
+    # then
+    first_plugin = first_manager.get_plugin(PluginSample.PLUGIN_ID)
+    second_plugin = second_manager.get_plugin(PluginSample.PLUGIN_ID)
+    assert first_plugin is not second_plugin
+    assert first_plugin.requestor == "first"
+    assert second_plugin.requestor == "second"
+
+
+@pytest.mark.parametrize("channel_count", [1, 10, 40])
+def test_plugins_manager_construction_queries(channel_count, django_assert_num_queries):
+    # given
+    Channel.objects.bulk_create(
+        [
+            Channel(name=f"Channel {i}", slug=f"channel-{i}", currency_code="USD")
+            for i in range(channel_count)
+        ]
+    )
+    invalidate_plugins_configuration()
+
+    # when
+    with django_assert_num_queries(2):
+        cold_manager = get_plugins_manager()
+    with django_assert_num_queries(0):
+        warm_manager = get_plugins_manager()
+
+    # then
+    assert len(cold_manager.plugins_per_channel) == channel_count
+    assert len(warm_manager.all_plugins) == channel_count + 1
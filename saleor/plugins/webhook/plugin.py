@@ -2256,9 +2256,10 @@ class WebhookPlugin(BasePlugin):
             return previous_value
 
         event_type = WebhookEventSyncType.STORED_PAYMENT_METHOD_DELETE_REQUESTED
-        webhook = get_webhooks_for_event(
+        webhooks = get_webhooks_for_event(
             event_type, apps_identifier=[app_data.app_identifier]
-        ).first()
+        )
+        webhook = webhooks[0] if webhooks else None
 
         if not webhook:
             return previous_value
@@ -2366,9 +2367,10 @@ class WebhookPlugin(BasePlugin):
         event_type = (
             WebhookEventSyncType.PAYMENT_GATEWAY_INITIALIZE_TOKENIZATION_SESSION
         )
-        webhook = get_webhooks_for_event(
+        webhooks = get_webhooks_for_event(
             event_type, apps_identifier=[request_data.app_identifier]
-        ).first()
+        )
+        webhook = webhooks[0] if webhooks else None
 
         if not webhook:
             return previous_value
@@ -2386,9 +2388,8 @@ class WebhookPlugin(BasePlugin):
         previous_value: "PaymentMethodTokenizationResponseData",
         additional_legacy_payload_data: Optional[dict] = None,
     ):
-        webhook = get_webhooks_for_event(
-            event_type, apps_identifier=[app_identifier]
-        ).first()
+        webhooks = get_webhooks_for_event(event_type, apps_identifier=[app_identifier])
+        webhook = webhooks[0] if webhooks else None
 
         if not webhook:
             return previous_value
@@ -2679,12 +2680,13 @@ class WebhookPlugin(BasePlugin):
                 app_identifier=transaction_session_data.payment_gateway_data.app_identifier,
                 error=error,
             )
-        webhook = get_webhooks_for_event(
+        webhooks = get_webhooks_for_event(
             webhook_event,
             apps_identifier=[
                 transaction_session_data.payment_gateway_data.app_identifier
             ],
-        ).first()
+        )
+        webhook = webhooks[0] if webhooks else None
         if not webhook:
             error = (
                 "Unable to find an active webhook for "
@@ -0,0 +1,169 @@
+import json
+from unittest import mock
+
+import graphene
+import pytest
+
+from .....core.models import EventDelivery, EventDeliveryPendingPayload
+from .....webhook.event_types import WebhookEventAsyncType
+from .....webhook.transport.asynchronous.transport import (
+    send_webhook_request_async,
+    trigger_webhooks_async,
+)
+
+PRODUCT_UPDATED_WITH_REQUESTOR = """
+    subscription{
+      event{
+        issuingPrincipal{
+          ...on User{
+            email
+          }
+        }
+        ...on ProductUpdated{
+          product{
+            id
+            name
+          }
+        }
+      }
+    }
+"""
+
+PRODUCT_DELETED = """
+    subscription{
+      event{
+        ...on ProductDeleted{
+          product{
+            id
+          }
+        }
+      }
+    }
+"""
+
+
+@pytest.fixture
+def _deferred_subscription_payloads(settings):
+    settings.WEBHOOK_DEFERRED_SUBSCRIPTION_PAYLOADS_ENABLED = True
+
+
+@pytest.mark.usefixtures("_deferred_subscription_payloads")
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.generate_payload_from_subscription"
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.delay"
+)
+def test_trigger_webhooks_async_defers_subscription_payloads(
+    mocked_send_webhook_request,
+    mocked_generate_payload,
+    subscription_webhook,
+    product,
+    staff_user,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    event_type = WebhookEventAsyncType.PRODUCT_UPDATED
+    webhook = subscription_webhook(PRODUCT_UPDATED_WITH_REQUESTOR, event_type)
+
+    # when
+    with django_capture_on_commit_callbacks() as callbacks:
+        trigger_webhooks_async(None, event_type, [webhook], product, staff_user)
+
+    # then
+    mocked_generate_payload.assert_not_called()
+    mocked_send_webhook_request.assert_not_called()
+    delivery = EventDelivery.objects.get()
+    assert delivery.payload is None
+    pending_payload = delivery.pending_payload
+    assert pending_payload.object_model == "product.Product"
+    assert pending_payload.object_id == str(product.pk)
+    assert pending_payload.requestor_model == "account.User"
+    assert pending_payload.requestor_id == str(staff_user.pk)
+
+    for callback in callbacks:
+        callback()
+    mocked_send_webhook_request.assert_called_once_with(delivery.pk)
+
+
+@pytest.mark.usefixtures("_deferred_subscription_payloads")
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.delay"
+)
+def test_trigger_webhooks_async_renders_deletion_events_in_request(
+    mocked_send_webhook_request, subscription_webhook, product
+):
+    # given
+    event_type = WebhookEventAsyncType.PRODUCT_DELETED
+    webhook = subscription_webhook(PRODUCT_DELETED, event_type)
+
+    # when
+    trigger_webhooks_async(None, event_type, [webhook], product)
+
+    # then
+    delivery = EventDelivery.objects.get()
+    assert delivery.payload
+    assert not EventDeliveryPendingPayload.objects.exists()
+    mocked_send_webhook_request.assert_called_once_with(delivery.pk)
+
+
+@pytest.mark.usefixtures("_deferred_subscription_payloads")
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhook_request_async_generates_deferred_payload(
+    mocked_send_response,
+    subscription_webhook,
+    product,
+    staff_user,
+    webhook_response,
+):
+    # given
+    mocked_send_response.return_value = webhook_response
+    event_type = WebhookEventAsyncType.PRODUCT_UPDATED
+    webhook = subscription_webhook(PRODUCT_UPDATED_WITH_REQUESTOR, event_type)
+    trigger_webhooks_async(None, event_type, [webhook], product, staff_user)
+    delivery = EventDelivery.objects.get()
+
+    # The payload is generated from the data visible to the worker.
+    product.name = "Updated name"
+    product.save(update_fields=["name"])
+
+    # when
+    send_webhook_request_async(delivery.pk)
+
+    # then
+    delivery.refresh_from_db()
+    payload = json.loads(delivery.payload.payload)
+    assert payload == {
+        "issuingPrincipal": {"email": staff_user.email},
+        "product": {
+            "id": graphene.Node.to_global_id("Product", product.pk),
+            "name": "Updated name",
+        },
+    }
+    assert not EventDeliveryPendingPayload.objects.exists()
+    mocked_send_response.assert_called_once()
+    assert mocked_send_response.call_args[0][4] == delivery.payload.payload
+
+
+@pytest.mark.usefixtures("_deferred_subscription_payloads")
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhook_request_async_deferred_payload_object_not_found(
+    mocked_send_response, subscription_webhook, product
+):
+    # given
+    event_type = WebhookEventAsyncType.PRODUCT_UPDATED
+    webhook = subscription_webhook(PRODUCT_UPDATED_WITH_REQUESTOR, event_type)
+    trigger_webhooks_async(None, event_type, [webhook], product)
+    delivery = EventDelivery.objects.get()
+    product.delete()
+
+    # when
+    send_webhook_request_async(delivery.pk)
+
+    # then
+    mocked_send_response.assert_not_called()
+    assert not EventDelivery.objects.exists()
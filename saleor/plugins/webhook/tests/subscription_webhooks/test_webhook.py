@@ -5,7 +5,7 @@ from unittest import mock
 
 import graphene
 
-from .....core.models import EventDelivery
+from .....core.models import EventDelivery, EventPayload
 from .....graphql.discount.enums import DiscountValueTypeEnum
 from .....graphql.order.tests.mutations.test_order_discount import ORDER_DISCOUNT_ADD
 from .....graphql.product.tests.mutations.test_product_create import (
@@ -13,8 +13,12 @@ from .....graphql.product.tests.mutations.test_product_create import (
 )
 from .....webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from .....webhook.models import Webhook
-from .....webhook.transport.asynchronous.transport import trigger_webhooks_async
+from .....webhook.transport.asynchronous.transport import (
+    create_deliveries_for_subscriptions,
+    trigger_webhooks_async,
+)
 from .....webhook.transport.synchronous.transport import trigger_webhook_sync
+from . import subscription_queries as queries
 from .payloads import generate_payment_payload
 
 TEST_ID = "test_id"
@@ -66,6 +70,28 @@ def test_trigger_webhooks_async_no_subscription_webhooks(
     mocked_create_deliveries_for_subscriptions.assert_not_called()
 
 
+def test_create_deliveries_for_subscriptions_share_identical_payloads(
+    subscription_webhook, order
+):
+    # given
+    event_type = WebhookEventAsyncType.ORDER_CREATED
+    webhooks = [
+        subscription_webhook(queries.ORDER_CREATED, event_type, name=f"Webhook {index}")
+        for index in range(3)
+    ]
+
+    # when
+    deliveries = create_deliveries_for_subscriptions(event_type, order, webhooks)
+
+    # then
+    assert len(deliveries) == 3
+    payload = EventPayload.objects.get()
+    assert {delivery.payload_id for delivery in deliveries} == {payload.pk}
+    assert json.loads(payload.payload)["order"]["id"] == graphene.Node.to_global_id(
+        "Order", order.id
+    )
+
+
 @mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
 def test_trigger_webhook_sync_with_subscription(
     mock_request, payment_app_with_subscription_webhooks, payment
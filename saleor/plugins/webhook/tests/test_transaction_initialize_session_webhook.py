@@ -16,6 +16,7 @@ from ....payment.interface import (
 )
 from ....webhook.event_types import WebhookEventSyncType
 from ....webhook.models import Webhook
+from ....webhook.registry import webhook_registry
 
 TRANSACTION_INITIALIZE_SESSION = """
 subscription {
@@ -732,3 +733,75 @@ def test_transaction_initialize_order_with_request_data(
         response,
         mock_request,
     )
+
+
+@freeze_time()
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_transaction_initialize_session_with_webhook_registry(
+    mock_request,
+    webhook_plugin,
+    webhook_app,
+    checkout,
+    permission_manage_payments,
+    transaction_session_response,
+    transaction_item_generator,
+    settings,
+):
+    # given
+    settings.WEBHOOK_REGISTRY_CACHE_ENABLED = True
+    webhook_registry.clear()
+    expected_response_data = transaction_session_response
+    mock_request.return_value = expected_response_data
+    plugin = webhook_plugin()
+
+    webhook_app.identifier = "app.identifier"
+    webhook_app.save()
+    webhook_app.permissions.add(permission_manage_payments)
+    webhook = Webhook.objects.create(
+        name="Webhook",
+        app=webhook_app,
+    )
+    event_type = WebhookEventSyncType.TRANSACTION_INITIALIZE_SESSION
+    webhook.events.create(event_type=event_type)
+    amount = Decimal("10.00")
+
+    transaction = transaction_item_generator(
+        checkout_id=checkout.pk,
+        app=webhook_app,
+        psp_reference=None,
+        name=None,
+        message=None,
+    )
+    action_type = TransactionFlowStrategy.CHARGE
+
+    # when
+    response = plugin.transaction_initialize_session(
+        transaction_session_data=TransactionSessionData(
+            transaction=transaction,
+            source_object=checkout,
+            action=TransactionProcessActionData(
+                amount=amount,
+                currency=transaction.currency,
+                action_type=action_type,
+            ),
+            customer_ip_address="127.0.0.1",
+            payment_gateway_data=PaymentGatewayData(
+                app_identifier=webhook_app.identifier, data=None, error=None
+            ),
+        ),
+        previous_value=None,
+    )
+
+    # then
+    _assert_with_static_payload(
+        checkout,
+        transaction,
+        None,
+        amount,
+        action_type,
+        webhook,
+        expected_response_data,
+        response,
+        mock_request,
+    )
+    webhook_registry.clear()
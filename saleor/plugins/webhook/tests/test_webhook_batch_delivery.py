@@ -0,0 +1,385 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import pytest
+from celery.exceptions import MaxRetriesExceededError
+from celery.exceptions import Retry as CeleryTaskRetryError
+
+from ....core import EventDeliveryStatus
+from ....core.models import EventDelivery, EventDeliveryAttempt, EventPayload
+from ....webhook.event_types import WebhookEventAsyncType
+from ....webhook.models import Webhook
+from ....webhook.transport.asynchronous.transport import (
+    send_webhook_requests_async,
+    send_webhook_requests_by_host,
+    trigger_webhooks_async,
+    webhook_deliveries_batch,
+)
+from ....webhook.transport.utils import WebhookResponse
+
+
+@pytest.fixture
+def _webhook_batch_delivery(settings):
+    settings.WEBHOOK_BATCH_DELIVERY_ENABLED = True
+
+
+@pytest.fixture
+def webhooks_with_hosts(app):
+    def factory(target_urls):
+        webhooks = Webhook.objects.bulk_create(
+            [
+                Webhook(name=f"Webhook {index}", app=app, target_url=target_url)
+                for index, target_url in enumerate(target_urls)
+            ]
+        )
+        for webhook in webhooks:
+            webhook.events.create(event_type=WebhookEventAsyncType.ORDER_CREATED)
+        return webhooks
+
+    return factory
+
+
+def _create_deliveries(webhooks, deliveries_per_webhook=1):
+    payload = EventPayload.objects.create(payload='{"id": 1}')
+    return EventDelivery.objects.bulk_create(
+        [
+            EventDelivery(
+                status=EventDeliveryStatus.PENDING,
+                event_type=WebhookEventAsyncType.ORDER_CREATED,
+                payload=payload,
+                webhook=webhook,
+            )
+            for webhook in webhooks
+            for _ in range(deliveries_per_webhook)
+        ]
+    )
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.lock:
+            self.server.clients.add(self.client_address)
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stand_in_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    server.lock = threading.Lock()
+    server.clients = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.usefixtures("_webhook_batch_delivery")
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.delay"
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async.delay"
+)
+def test_trigger_webhooks_async_sends_deliveries_in_batches(
+    mocked_send_webhook_requests,
+    mocked_send_webhook_request,
+    settings,
+    webhooks_with_hosts,
+):
+    # given
+    settings.WEBHOOK_BATCH_DELIVERY_SIZE = 2
+    webhooks = webhooks_with_hosts(["http://www.example.com/test"] * 3)
+
+    # when
+    trigger_webhooks_async(
+        '{"id": 1}', WebhookEventAsyncType.ORDER_CREATED, webhooks=webhooks
+    )
+
+    # then
+    mocked_send_webhook_request.assert_not_called()
+    delivery_ids = list(
+        EventDelivery.objects.order_by("pk").values_list("pk", flat=True)
+    )
+    assert mocked_send_webhook_requests.call_args_list == [
+        mock.call(delivery_ids[:2]),
+        mock.call(delivery_ids[2:]),
+    ]
+
+
+@pytest.mark.usefixtures("_webhook_batch_delivery")
+@pytest.mark.parametrize("events_count", [10, 100])
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async.delay"
+)
+def test_webhook_deliveries_batch_publishes_deliveries_of_all_events(
+    mocked_send_webhook_requests,
+    events_count,
+    settings,
+    webhooks_with_hosts,
+    django_capture_on_commit_callbacks,
+    record_property,
+):
+    # given
+    settings.WEBHOOK_BATCH_DELIVERY_SIZE = 100
+    webhooks = webhooks_with_hosts(["http://www.example.com/test"] * 5)
+
+    # when
+    start = time.perf_counter()
+    with django_capture_on_commit_callbacks(execute=True):
+        with webhook_deliveries_batch():
+            for _ in range(events_count):
+                trigger_webhooks_async(
+                    '{"id": 1}', WebhookEventAsyncType.ORDER_CREATED, webhooks=webhooks
+                )
+            mocked_send_webhook_requests.assert_not_called()
+    duration = time.perf_counter() - start
+
+    # then
+    record_property("duration_ms", duration * 1000)
+    record_property("published_messages", mocked_send_webhook_requests.call_count)
+    delivery_ids = list(
+        EventDelivery.objects.order_by("pk").values_list("pk", flat=True)
+    )
+    assert len(delivery_ids) == events_count * len(webhooks)
+    published_ids = [
+        delivery_id
+        for call in mocked_send_webhook_requests.call_args_list
+        for delivery_id in call.args[0]
+    ]
+    assert published_ids == delivery_ids
+    assert mocked_send_webhook_requests.call_count == -(-len(delivery_ids) // 100)
+
+
+@pytest.mark.usefixtures("_webhook_batch_delivery")
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async.delay"
+)
+def test_webhook_deliveries_batch_publishes_on_commit(
+    mocked_send_webhook_requests,
+    webhooks_with_hosts,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    webhooks = webhooks_with_hosts(["http://www.example.com/test"])
+
+    # when
+    with django_capture_on_commit_callbacks() as callbacks:
+        with webhook_deliveries_batch():
+            trigger_webhooks_async(
+                '{"id": 1}', WebhookEventAsyncType.ORDER_CREATED, webhooks=webhooks
+            )
+
+    # then
+    mocked_send_webhook_requests.assert_not_called()
+    for callback in callbacks:
+        callback()
+    delivery = EventDelivery.objects.get()
+    mocked_send_webhook_requests.assert_called_once_with([delivery.pk])
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.delay"
+)
+def test_webhook_deliveries_batch_without_batch_delivery(
+    mocked_send_webhook_request, webhooks_with_hosts
+):
+    # given
+    webhooks = webhooks_with_hosts(["http://www.example.com/test"] * 2)
+
+    # when
+    with webhook_deliveries_batch():
+        trigger_webhooks_async(
+            '{"id": 1}', WebhookEventAsyncType.ORDER_CREATED, webhooks=webhooks
+        )
+
+    # then
+    assert mocked_send_webhook_request.call_count == 2
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhook_requests_async(
+    mocked_send_response, webhooks_with_hosts, webhook_response
+):
+    # given
+    rejected_response = WebhookResponse(
+        content="Bad request",
+        response_status_code=400,
+        status=EventDeliveryStatus.FAILED,
+    )
+    webhooks = webhooks_with_hosts(
+        ["http://a.example.com/test", "http://b.example.com/test"]
+    )
+    mocked_send_response.side_effect = lambda target_url, *args, **kwargs: (
+        webhook_response if target_url.startswith("http://a.") else rejected_response
+    )
+    sent_delivery, rejected_delivery = _create_deliveries(webhooks)
+
+    # when
+    send_webhook_requests_async([sent_delivery.pk, rejected_delivery.pk])
+
+    # then
+    assert mocked_send_response.call_count == 2
+    assert not EventDelivery.objects.filter(pk=sent_delivery.pk).exists()
+    rejected_delivery.refresh_from_db()
+    assert rejected_delivery.status == EventDeliveryStatus.FAILED
+    attempt = EventDeliveryAttempt.objects.get(delivery=rejected_delivery)
+    assert attempt.status == EventDeliveryStatus.FAILED
+    assert attempt.response_status_code == 400
+    assert EventPayload.objects.filter(pk=rejected_delivery.payload_id).exists()
+
+
+def test_send_webhook_requests_async_inactive_webhook(webhooks_with_hosts):
+    # given
+    [webhook] = webhooks_with_hosts(["http://www.example.com/test"])
+    webhook.is_active = False
+    webhook.save(update_fields=["is_active"])
+    [delivery] = _create_deliveries([webhook])
+
+    # when
+    send_webhook_requests_async([delivery.pk])
+
+    # then
+    delivery.refresh_from_db()
+    assert delivery.status == EventDeliveryStatus.FAILED
+    assert not EventDeliveryAttempt.objects.exists()
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async.retry"
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhook_requests_async_retries_failed_deliveries(
+    mocked_send_response,
+    mocked_task_retry,
+    webhooks_with_hosts,
+    webhook_response,
+    webhook_response_failed,
+):
+    # given
+    mocked_task_retry.side_effect = CeleryTaskRetryError()
+    webhooks = webhooks_with_hosts(
+        ["http://a.example.com/test", "http://b.example.com/test"]
+    )
+    mocked_send_response.side_effect = lambda target_url, *args, **kwargs: (
+        webhook_response
+        if target_url.startswith("http://a.")
+        else webhook_response_failed
+    )
+    sent_delivery, failed_delivery = _create_deliveries(webhooks)
+
+    # when
+    with pytest.raises(CeleryTaskRetryError):
+        send_webhook_requests_async([sent_delivery.pk, failed_delivery.pk])
+
+    # then
+    assert mocked_task_retry.call_args.kwargs["args"] == ([failed_delivery.pk],)
+    assert not EventDelivery.objects.filter(pk=sent_delivery.pk).exists()
+    failed_delivery.refresh_from_db()
+    assert failed_delivery.status == EventDeliveryStatus.PENDING
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_requests_async.retry"
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhook_requests_async_when_max_retries_exceeded(
+    mocked_send_response,
+    mocked_task_retry,
+    webhooks_with_hosts,
+    webhook_response_failed,
+):
+    # given
+    mocked_task_retry.side_effect = MaxRetriesExceededError()
+    mocked_send_response.return_value = webhook_response_failed
+    webhooks = webhooks_with_hosts(["http://www.example.com/test"])
+    [delivery] = _create_deliveries(webhooks)
+
+    # when
+    send_webhook_requests_async([delivery.pk])
+
+    # then
+    delivery.refresh_from_db()
+    assert delivery.status == EventDeliveryStatus.FAILED
+
+
+def test_send_webhook_requests_by_host_limits_concurrency(
+    settings, webhooks_with_hosts, webhook_response
+):
+    # given
+    settings.WEBHOOK_BATCH_DELIVERY_HOST_CONCURRENCY = 2
+    settings.WEBHOOK_BATCH_DELIVERY_CONCURRENCY = 3
+    webhooks = webhooks_with_hosts(
+        [f"http://host{index}.example.com/webhook" for index in range(3)]
+    )
+    deliveries = _create_deliveries(webhooks, 4)
+    lock = threading.Lock()
+    active_by_host = {webhook.target_url: 0 for webhook in webhooks}
+    max_active = {"total": 0, "host": 0}
+
+    def send_webhook_request(delivery, domain, session):
+        with lock:
+            active_by_host[delivery.webhook.target_url] += 1
+            max_active["total"] = max(max_active["total"], sum(active_by_host.values()))
+            max_active["host"] = max(max_active["host"], *active_by_host.values())
+        time.sleep(0.01)
+        with lock:
+            active_by_host[delivery.webhook.target_url] -= 1
+        return webhook_response, delivery.pk
+
+    # when
+    with mock.patch(
+        "saleor.webhook.transport.asynchronous.transport.send_webhook_request",
+        side_effect=send_webhook_request,
+    ):
+        results = send_webhook_requests_by_host(deliveries, "example.com")
+
+    # then
+    assert [delivery_id for _, delivery_id in results] == [
+        delivery.pk for delivery in deliveries
+    ]
+    assert max_active["total"] <= 3
+    assert max_active["host"] <= 2
+
+
+@pytest.mark.enable_socket
+@pytest.mark.allow_hosts(["127.0.0.1"])
+@pytest.mark.parametrize("deliveries_count", [10, 100])
+def test_send_webhook_requests_async_reuses_connections(
+    deliveries_count,
+    settings,
+    webhooks_with_hosts,
+    stand_in_server,
+    record_property,
+):
+    # given
+    settings.WEBHOOK_BATCH_DELIVERY_HOST_CONCURRENCY = 4
+    host, port = stand_in_server.server_address
+    webhooks = webhooks_with_hosts([f"http://{host}:{port}/webhook"])
+    deliveries = _create_deliveries(webhooks, deliveries_count)
+
+    # when
+    start = time.perf_counter()
+    send_webhook_requests_async([delivery.pk for delivery in deliveries])
+    duration = time.perf_counter() - start
+
+    # then
+    record_property("deliveries_per_second", deliveries_count / duration)
+    assert not EventDelivery.objects.exists()
+    assert len(stand_in_server.clients) <= 4
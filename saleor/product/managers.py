@@ -2,6 +2,7 @@ import datetime
 from typing import Union
 
 import pytz
+from django.conf import settings
 from django.contrib.postgres.aggregates import StringAgg
 from django.db import models
 from django.db.models import (
@@ -12,6 +13,7 @@ from django.db.models import (
     Exists,
     ExpressionWrapper,
     F,
+    FilteredRelation,
     OuterRef,
     Q,
     Subquery,
@@ -147,6 +149,9 @@ class ProductsQueryset(models.QuerySet):
                 concatenated_values=Value(None, output_field=models.CharField()),
             )
 
+        if settings.PRODUCT_ATTRIBUTE_SORT_KEYS_ENABLED:
+            return qs._sort_by_attribute_sort_key(attribute_pk, descending)
+
         qs = qs.annotate(
             # Implicit `GROUP BY` required for the `StringAgg` aggregation
             grouped_ids=Count("id"),
@@ -205,6 +210,35 @@ class ProductsQueryset(models.QuerySet):
             f"{ordering}name",
         )
 
+    def _sort_by_attribute_sort_key(self, attribute_pk: Union[int, str], descending):
+        """Sort a query set by the precomputed sort keys of the given attribute.
+
+        Produces the same annotations and order as `sort_by_attribute`, from
+        a single joined `ProductAttributeSortKey` row instead of an aggregation.
+        """
+        from ..attribute.sort_keys import BUCKET_NOT_ASSIGNED
+
+        qs = self.annotate(
+            attribute_sort_key=FilteredRelation(
+                "attribute_sort_keys",
+                condition=Q(attribute_sort_keys__attribute_id=attribute_pk),
+            )
+        ).annotate(
+            concatenated_values=F("attribute_sort_key__sort_key"),
+            # Products without the attribute have no sort key row.
+            concatenated_values_order=Coalesce(
+                F("attribute_sort_key__bucket"),
+                Value(BUCKET_NOT_ASSIGNED),
+                output_field=models.IntegerField(),
+            ),
+        )
+        ordering = "-" if descending else ""
+        return qs.order_by(
+            f"{ordering}concatenated_values_order",
+            f"{ordering}concatenated_values",
+            f"{ordering}name",
+        )
+
     def prefetched_for_webhook(self, single_object=True):
         common_fields = (
             "media",
@@ -0,0 +1,36 @@
+# Generated by Django 3.2.22 on 2023-11-06 10:12
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("product", "0189_merge_20230929_0857"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="product",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                fields=["name", "slug"], name="product_name_slug_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="product",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                fields=["updated_at", "name", "slug"],
+                name="product_updated_name_slug_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="product",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                fields=["created_at", "name", "slug"],
+                name="product_created_name_slug_idx",
+            ),
+        ),
+    ]
@@ -232,6 +232,16 @@ class Product(SeoModel, ModelWithMetadata, ModelWithExternalReference):
                 fields=["name", "slug"],
                 opclasses=["gin_trgm_ops"] * 2,
             ),
+            # Keyset pagination indexes matching the `ProductOrderField` orderings
+            BTreeIndex(fields=["name", "slug"], name="product_name_slug_idx"),
+            BTreeIndex(
+                fields=["updated_at", "name", "slug"],
+                name="product_updated_name_slug_idx",
+            ),
+            BTreeIndex(
+                fields=["created_at", "name", "slug"],
+                name="product_created_name_slug_idx",
+            ),
         ]
         indexes.extend(ModelWithMetadata.Meta.indexes)
 
@@ -4,14 +4,9 @@ from typing import TYPE_CHECKING, Union
 from django.conf import settings
 from django.contrib.postgres.search import SearchQuery, SearchRank
 from django.db.models import F, Q, Value, prefetch_related_objects
-from django.db.models.expressions import Exists, OuterRef
 
 from ..attribute import AttributeInputType
-from ..attribute.models import (
-    AssignedProductAttributeValue,
-    Attribute,
-    AttributeProduct,
-)
+from ..attribute.models import Attribute
 from ..core.postgres import FlatConcatSearchVector, NoValidationSearchVector
 from ..core.utils.editorjs import clean_editor_js
 from .models import Product
@@ -20,9 +15,12 @@ if TYPE_CHECKING:
     from django.db.models import QuerySet
 
 PRODUCT_SEARCH_FIELDS = ["name", "description_plaintext"]
+# All data used by `prepare_product_search_vector_value` has to be listed here,
+# so search vectors of a whole batch of products are built in a constant number
+# of queries.
 PRODUCT_FIELDS_TO_PREFETCH = [
     "variants__attributes__values",
-    "variants__attributes",
+    "variants__attributes__assignment__attribute",
     "attributevalues__value",
     "product_type__attributeproduct__attribute",
 ]
@@ -82,7 +80,8 @@ def prepare_product_search_vector_value(
 def generate_variants_search_vector_value(
     product: "Product",
 ) -> list[NoValidationSearchVector]:
-    variants = list(product.variants.all()[: settings.PRODUCT_MAX_INDEXED_VARIANTS])
+    # Slicing the queryset would skip prefetched objects and query the database.
+    variants = list(product.variants.all())[: settings.PRODUCT_MAX_INDEXED_VARIANTS]
 
     search_vectors = [
         NoValidationSearchVector(
@@ -96,7 +95,9 @@ def generate_variants_search_vector_value(
     if search_vectors:
         for variant in variants:
             search_vectors += generate_attributes_search_vector_value_with_assignment(
-                variant.attributes.all()[: settings.PRODUCT_MAX_INDEXED_ATTRIBUTES]
+                list(variant.attributes.all())[
+                    : settings.PRODUCT_MAX_INDEXED_ATTRIBUTES
+                ]
             )
     return search_vectors
 
@@ -106,29 +107,21 @@ def generate_attributes_search_vector_value(
 ) -> list[NoValidationSearchVector]:
     """Prepare `search_vector` value for assigned attributes.
 
-    Method should receive assigned attributes with prefetched `values`
+    Method should receive product with prefetched `attributevalues__value`
+    and `product_type__attributeproduct__attribute`.
     """
-    product_attributes = AttributeProduct.objects.filter(
-        product_type_id=product.product_type_id
-    )
-    attributes = Attribute.objects.filter(
-        Exists(product_attributes.filter(attribute_id=OuterRef("id")))
-    ).order_by("attributeproduct__sort_order")[
+    attribute_products = list(product.product_type.attributeproduct.all())[
         : settings.PRODUCT_MAX_INDEXED_ATTRIBUTES
     ]
 
-    assigned_values = AssignedProductAttributeValue.objects.filter(
-        product_id=product.pk
-    )
-    prefetch_related_objects(assigned_values, "value")
-
     search_vectors = []
 
     values_map = defaultdict(list)
-    for av in assigned_values:
+    for av in product.attributevalues.all():
         values_map[av.value.attribute_id].append(av.value)
 
-    for attribute in attributes:
+    for attribute_product in attribute_products:
+        attribute = attribute_product.attribute
         values = values_map[attribute.pk][
             : settings.PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES
         ]
@@ -138,7 +131,7 @@ def generate_attributes_search_vector_value(
 
 
 def generate_attributes_search_vector_value_with_assignment(
-    assigned_attributes: "QuerySet",
+    assigned_attributes: Union[list, "QuerySet"],
 ) -> list[NoValidationSearchVector]:
     """Prepare `search_vector` value for assigned attributes.
 
@@ -148,7 +141,7 @@ def generate_attributes_search_vector_value_with_assignment(
     search_vectors = []
     for assigned_attribute in assigned_attributes:
         attribute = assigned_attribute.assignment.attribute
-        values = assigned_attribute.values.all()[
+        values = list(assigned_attribute.values.all())[
             : settings.PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES
         ]
         search_vectors += get_search_vectors_for_values(attribute, values)
@@ -11,6 +11,7 @@ from ..attribute.models import Attribute
 from ..celeryconf import app
 from ..core.exceptions import PreorderAllocationError
 from ..discount.models import Promotion
+from ..discount.utils import update_active_rules_variants_for_products
 from ..warehouse.management import deactivate_preorder_for_variant
 from .models import Product, ProductType, ProductVariant
 from .search import PRODUCTS_BATCH_SIZE, update_products_search_vector
@@ -91,10 +92,15 @@ def update_products_discounted_prices_of_promotion_task(promotion_pk: UUID):
 
 @app.task
 def update_products_discounted_prices_for_promotion_task(product_ids: Iterable[int]):
-    """Update the product discounted prices for given product ids."""
+    """Update the product discounted prices for given product ids.
+
+    Variants of the products assigned to promotion rules are refreshed first, as
+    the products could be changed in a way affecting the rules they match.
+    """
     ids = sorted(product_ids)[:DISCOUNTED_PRODUCT_BATCH]
     qs = Product.objects.filter(pk__in=ids)
     if ids:
+        update_active_rules_variants_for_products(ids)
         update_discounted_prices_for_promotion(qs)
         remaining_ids = list(set(product_ids) - set(ids))
         update_products_discounted_prices_for_promotion_task.delay(remaining_ids)
@@ -1,4 +1,11 @@
-from ..models import Product
+import time
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ...attribute.utils import associate_attribute_values_to_instance
+from ..models import Product, ProductVariant
 from ..search import update_products_search_vector
 
 
@@ -15,3 +22,61 @@ def test_update_products_search_vector(product_list):
     for product in product_list:
         product.refresh_from_db()
         assert product.search_vector
+
+
+def _create_products_with_attributes(product, count):
+    variant_attribute = product.product_type.variant_attributes.first()
+    variant_value = variant_attribute.values.first()
+    product_attribute = product.product_type.product_attributes.first()
+    product_value = product_attribute.values.first()
+    products = Product.objects.bulk_create(
+        [
+            Product(
+                name=f"Product {index}",
+                slug=f"product-{index}",
+                product_type=product.product_type,
+                category=product.category,
+            )
+            for index in range(count)
+        ]
+    )
+    variants = ProductVariant.objects.bulk_create(
+        [
+            ProductVariant(product=new_product, sku=f"sku-{new_product.pk}")
+            for new_product in products
+        ]
+    )
+    for new_product, variant in zip(products, variants):
+        associate_attribute_values_to_instance(
+            new_product, product_attribute, product_value
+        )
+        associate_attribute_values_to_instance(
+            variant, variant_attribute, variant_value
+        )
+    return products
+
+
+@pytest.mark.parametrize("products_count", [10, 100])
+def test_update_products_search_vector_queries_do_not_depend_on_products_count(
+    products_count, product, record_property
+):
+    # given
+    with CaptureQueriesContext(connection) as single_product_queries:
+        update_products_search_vector(Product.objects.filter(pk=product.pk))
+
+    products = _create_products_with_attributes(product, products_count)
+
+    # when
+    with CaptureQueriesContext(connection) as queries:
+        start = time.perf_counter()
+        update_products_search_vector(
+            Product.objects.filter(pk__in=[p.pk for p in products])
+        )
+        duration = time.perf_counter() - start
+
+    # then
+    record_property("products_per_second", products_count / duration)
+    assert len(queries) == len(single_product_queries)
+    assert not Product.objects.filter(
+        pk__in=[p.pk for p in products], search_vector=None
+    ).exists()
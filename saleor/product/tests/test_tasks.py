@@ -87,6 +87,23 @@ def test_update_products_discounted_prices_for_promotion_task(
     update_products_discounted_prices_mock.call_count == len(ids)
 
 
+@patch("saleor.product.tasks.update_discounted_prices_for_promotion")
+def test_update_products_discounted_prices_for_promotion_task_updates_rule_variants(
+    update_discounted_prices_for_promotion_mock, promotion, product
+):
+    # given
+    rule = promotion.rules.get(catalogue_predicate__has_key="productPredicate")
+    promotion.rules.update(variants_dirty=False)
+    rule.variants.clear()
+
+    # when
+    update_products_discounted_prices_for_promotion_task([product.id])
+
+    # then
+    assert set(rule.variants.all()) == set(product.variants.all())
+    update_discounted_prices_for_promotion_mock.assert_called_once()
+
+
 @patch("saleor.product.tasks._update_variants_names")
 def test_update_variants_names(
     update_variants_names_mock, product_type, size_attribute
@@ -167,6 +167,18 @@ DEFAULT_FROM_EMAIL: str = os.environ.get(
 MEDIA_ROOT: str = os.path.join(PROJECT_ROOT, "media")
 MEDIA_URL: str = os.environ.get("MEDIA_URL", "/media/")
 
+# Sizes of product media thumbnails created by a Celery task once an image is
+# uploaded, instead of on the first request for each size, e.g. "256,512,1024".
+PRODUCT_MEDIA_THUMBNAIL_SIZES: list[int] = [
+    int(size)
+    for size in get_list(os.environ.get("PRODUCT_MEDIA_THUMBNAIL_SIZES", ""))
+    if size
+]
+# Formats of the thumbnails created on upload: "original", "webp" or "avif".
+PRODUCT_MEDIA_THUMBNAIL_FORMATS: list[str] = get_list(
+    os.environ.get("PRODUCT_MEDIA_THUMBNAIL_FORMATS", "original")
+)
+
 STATIC_ROOT: str = os.path.join(PROJECT_ROOT, "static")
 STATIC_URL: str = os.environ.get("STATIC_URL", "/static/")
 STATICFILES_DIRS = [
@@ -440,6 +452,17 @@ ALLOWED_GRAPHQL_ORIGINS: list[str] = get_list(
 
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 
+# Compression of responses served by the ASGI application. Response bodies shorter
+# than the minimum size are sent uncompressed, and chunks of at least the thread
+# minimum size are compressed in a worker thread instead of the event loop.
+RESPONSE_COMPRESSION_LEVEL = int(os.environ.get("RESPONSE_COMPRESSION_LEVEL", 9))
+RESPONSE_COMPRESSION_MINIMUM_SIZE = int(
+    os.environ.get("RESPONSE_COMPRESSION_MINIMUM_SIZE", 500)
+)
+RESPONSE_COMPRESSION_THREAD_MINIMUM_SIZE = int(
+    os.environ.get("RESPONSE_COMPRESSION_THREAD_MINIMUM_SIZE", 64 * 1024)
+)
+
 # Amazon S3 configuration
 # See https://django-storages.readthedocs.io/en/latest/backends/amazon-S3.html
 AWS_ACCESS_KEY_ID = os.environ.get("AWS_ACCESS_KEY_ID")
@@ -629,6 +652,11 @@ CELERY_BEAT_MAX_LOOP_INTERVAL = 300  # 5 minutes
 EVENT_PAYLOAD_DELETE_PERIOD = timedelta(
     seconds=parse(os.environ.get("EVENT_PAYLOAD_DELETE_PERIOD", "14 days"))
 )
+# Number of days for which partitions of event tables converted with the
+# `partition_event_tables` command are created ahead.
+EVENT_PARTITIONS_CREATED_AHEAD_DAYS = int(
+    os.environ.get("EVENT_PARTITIONS_CREATED_AHEAD_DAYS", 7)
+)
 
 # Observability settings
 OBSERVABILITY_BROKER_URL = os.environ.get("OBSERVABILITY_BROKER_URL")
@@ -704,6 +732,15 @@ GRAPHQL_QUERY_MAX_COMPLEXITY = int(
     os.environ.get("GRAPHQL_QUERY_MAX_COMPLEXITY", 50000)
 )
 
+# Parsed and validated GraphQL documents are kept in memory of each process, keyed
+# by the hash of the query string. Set the size to 0 to disable it.
+GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.environ.get("GRAPHQL_DOCUMENT_CACHE_SIZE", 1000))
+
+# Automatic persisted queries let clients send only the hash of a previously
+# registered query, also over GET. Queries are stored in the Django cache.
+PERSISTED_QUERIES_ENABLED = get_bool_from_env("PERSISTED_QUERIES_ENABLED", True)
+PERSISTED_QUERIES_TTL = parse(os.environ.get("PERSISTED_QUERIES_TTL", "1 day"))
+
 # Max number entities that can be requested in single query by Apollo Federation
 # Federation protocol implements no securities on its own part - malicious actor
 # may build a query that requests for potentially few thousands of entities.
@@ -741,6 +778,88 @@ for entry_point in installed_plugins:
 
 PLUGINS = BUILTIN_PLUGINS + EXTERNAL_PLUGINS
 
+# When `True`, plugin classes, channels and plugin configurations are kept in
+# a per-process registry instead of being loaded for every `PluginsManager`.
+# The registry is invalidated through a version key stored in the cache, so
+# it requires a cache shared by all processes (e.g. Redis).
+PLUGINS_REGISTRY_CACHE_ENABLED: bool = get_bool_from_env(
+    "PLUGINS_REGISTRY_CACHE_ENABLED", False
+)
+
+# When `True`, channels, tax configurations, tax rates, sites and warehouses are
+# served to GraphQL queries from per-process snapshots. Like the plugins registry,
+# snapshots are invalidated through version keys stored in the cache.
+REFERENCE_DATA_CACHE_ENABLED: bool = get_bool_from_env(
+    "REFERENCE_DATA_CACHE_ENABLED", False
+)
+
+# When `True`, webhooks subscribed to events are looked up in a per-process
+# registry instead of being queried every time an event is triggered.
+WEBHOOK_REGISTRY_CACHE_ENABLED: bool = get_bool_from_env(
+    "WEBHOOK_REGISTRY_CACHE_ENABLED", False
+)
+
+# When `True`, postal code rules of shipping methods are compiled into a per-process
+# index instead of being queried every time available shipping methods are listed.
+SHIPPING_POSTAL_CODE_RULES_CACHE_ENABLED: bool = get_bool_from_env(
+    "SHIPPING_POSTAL_CODE_RULES_CACHE_ENABLED", False
+)
+
+# When `True`, shipping methods applicable for checkouts and orders are looked up in
+# a per-process registry instead of being queried every time they are listed.
+SHIPPING_METHODS_CACHE_ENABLED: bool = get_bool_from_env(
+    "SHIPPING_METHODS_CACHE_ENABLED", False
+)
+
+# When `True`, products sorted by an attribute are ordered by sort keys precomputed
+# when attribute values change, instead of aggregating values of all products.
+# Populate the keys with `update_product_attribute_sort_keys` before enabling it.
+PRODUCT_ATTRIBUTE_SORT_KEYS_ENABLED: bool = get_bool_from_env(
+    "PRODUCT_ATTRIBUTE_SORT_KEYS_ENABLED", False
+)
+
+# When `True`, subscription payloads of async webhooks triggered for model instances
+# are generated by the Celery worker sending the delivery instead of the request
+# that triggered the event.
+WEBHOOK_DEFERRED_SUBSCRIPTION_PAYLOADS_ENABLED: bool = get_bool_from_env(
+    "WEBHOOK_DEFERRED_SUBSCRIPTION_PAYLOADS_ENABLED", False
+)
+
+# When `True`, deliveries of async webhooks are sent in batches by a single Celery
+# task, which groups them by the host of the target URL and sends them concurrently
+# over keep-alive connections reused by the worker process. Deliveries of all events
+# triggered by an API request are published together once the request is handled.
+WEBHOOK_BATCH_DELIVERY_ENABLED: bool = get_bool_from_env(
+    "WEBHOOK_BATCH_DELIVERY_ENABLED", False
+)
+# Maximum number of deliveries sent by a single batch task.
+WEBHOOK_BATCH_DELIVERY_SIZE = int(os.environ.get("WEBHOOK_BATCH_DELIVERY_SIZE", 100))
+# Maximum number of concurrent requests sent to a single host by a batch task.
+WEBHOOK_BATCH_DELIVERY_HOST_CONCURRENCY = int(
+    os.environ.get("WEBHOOK_BATCH_DELIVERY_HOST_CONCURRENCY", 4)
+)
+# Maximum number of concurrent requests sent by a batch task to all hosts.
+WEBHOOK_BATCH_DELIVERY_CONCURRENCY = int(
+    os.environ.get("WEBHOOK_BATCH_DELIVERY_CONCURRENCY", 16)
+)
+
+# When `True`, `totalCount` of large connections, such as orders, products and
+# customers, returns the query planner's estimate when it is above
+# `TOTAL_COUNT_EXACT_THRESHOLD` records, instead of counting them all.
+TOTAL_COUNT_ESTIMATES_ENABLED: bool = get_bool_from_env(
+    "TOTAL_COUNT_ESTIMATES_ENABLED", False
+)
+TOTAL_COUNT_EXACT_THRESHOLD = int(os.environ.get("TOTAL_COUNT_EXACT_THRESHOLD", 10000))
+# Planner estimates of filtered queries are unreliable, so they are returned only
+# when they are this many times above `TOTAL_COUNT_EXACT_THRESHOLD`.
+TOTAL_COUNT_FILTERED_ESTIMATE_MARGIN = int(
+    os.environ.get("TOTAL_COUNT_FILTERED_ESTIMATE_MARGIN", 10)
+)
+# Time (sec) for which estimated and exact counts of the same query are cached.
+TOTAL_COUNT_CACHE_TIMEOUT = parse(
+    os.environ.get("TOTAL_COUNT_CACHE_TIMEOUT", "1 minute")
+)
+
 # Default timeout (sec) for establishing a connection when performing external requests.
 REQUESTS_CONN_EST_TIMEOUT = 2
 
@@ -811,6 +930,15 @@ JWT_TTL_REQUEST_EMAIL_CHANGE = timedelta(
     seconds=parse(os.environ.get("JWT_TTL_REQUEST_EMAIL_CHANGE", "1 hour")),
 )
 
+# Successful app token verifications are kept in memory of each process to avoid
+# computing the password hash on every request. Set the size to 0 to disable it.
+APP_TOKEN_VERIFICATION_CACHE_SIZE = int(
+    os.environ.get("APP_TOKEN_VERIFICATION_CACHE_SIZE", 1000)
+)
+APP_TOKEN_VERIFICATION_CACHE_TTL = parse(
+    os.environ.get("APP_TOKEN_VERIFICATION_CACHE_TTL", "5 minutes")
+)
+
 CHECKOUT_PRICES_TTL = timedelta(
     seconds=parse(os.environ.get("CHECKOUT_PRICES_TTL", "1 hour"))
 )
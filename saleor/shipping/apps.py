@@ -0,0 +1,19 @@
+from django.apps import AppConfig
+
+
+class ShippingAppConfig(AppConfig):
+    name = "saleor.shipping"
+
+    def ready(self):
+        self.connect_postal_code_rules_signals()
+        self.connect_registry_signals()
+
+    def connect_postal_code_rules_signals(self):
+        from .postal_code_rules import postal_code_rules
+
+        postal_code_rules.connect_signals()
+
+    def connect_registry_signals(self):
+        from .registry import shipping_methods_registry
+
+        shipping_methods_registry.connect_signals()
@@ -158,6 +158,11 @@ class ShippingMethodQueryset(models.QuerySet["ShippingMethod"]):
             Iterable["CheckoutLineInfo"], Iterable["OrderLineInfo"], None
         ] = None,
     ):
+        """Return shipping methods applicable for the checkout or order.
+
+        When `SHIPPING_METHODS_CACHE_ENABLED` is set, a list of methods from
+        the per-process registry is returned instead of a queryset.
+        """
         if not instance.shipping_address:
             return None
         if not country_code:
@@ -169,13 +174,27 @@ class ShippingMethodQueryset(models.QuerySet["ShippingMethod"]):
         instance_product_ids = {
             line.variant.product_id for line in lines if line.variant
         }
-        applicable_methods = self.applicable_shipping_methods(
-            price=price,
-            channel_id=channel_id,
-            weight=instance.get_total_weight(lines),
-            country_code=country_code or instance.shipping_address.country.code,
-            product_ids=instance_product_ids,
-        ).prefetch_related("postal_code_rules")
+        weight = instance.get_total_weight(lines)
+        applicable_methods: Union["ShippingMethodQueryset", list["ShippingMethod"]]
+        if settings.SHIPPING_METHODS_CACHE_ENABLED:
+            from .registry import shipping_methods_registry
+
+            snapshot = shipping_methods_registry.get_snapshot()
+            applicable_methods = snapshot.get_applicable_shipping_methods(
+                price=price,
+                channel_id=channel_id,
+                weight=weight,
+                country_code=country_code,
+                product_ids=instance_product_ids,
+            )
+        else:
+            applicable_methods = self.applicable_shipping_methods(
+                price=price,
+                channel_id=channel_id,
+                weight=weight,
+                country_code=country_code,
+                product_ids=instance_product_ids,
+            )
 
         return filter_shipping_methods_by_postal_code_rules(
             applicable_methods, instance.shipping_address
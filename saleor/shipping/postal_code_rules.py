@@ -0,0 +1,66 @@
+"""Process-wide index of shipping method postal code rules.
+
+Zones covering countries such as the UK or Ireland can have thousands of postal
+code ranges, which were compared with the customer's postal code one by one every
+time available shipping methods were listed. When
+`SHIPPING_POSTAL_CODE_RULES_CACHE_ENABLED` is set, all rules are kept in
+a snapshot invalidated like the reference data snapshots: saving or deleting a rule
+bumps the version once the transaction is committed.
+"""
+
+from collections.abc import Iterable
+from typing import Optional, Union
+
+from django.conf import settings
+from django.db.models import QuerySet
+
+from ..core.reference_data import ReferenceData, ReferenceDataSnapshot
+from .models import ShippingMethod, ShippingMethodPostalCodeRule
+from .postal_codes import PostalCodeRuleIndex
+
+
+class PostalCodeRulesSnapshot(ReferenceDataSnapshot):
+    def __init__(
+        self,
+        version: Optional[int],
+        rules: Iterable[ShippingMethodPostalCodeRule],
+    ):
+        super().__init__(version, rules)
+        self.rule_index = PostalCodeRuleIndex(self.objects)  # type: ignore[arg-type]
+
+
+class PostalCodeRules(ReferenceData):
+    def load_snapshot(self, version: Optional[int] = None) -> PostalCodeRulesSnapshot:
+        queryset = self.get_queryset().using(settings.DATABASE_CONNECTION_DEFAULT_NAME)
+        return PostalCodeRulesSnapshot(version, queryset.iterator())
+
+    def get_snapshot(self) -> PostalCodeRulesSnapshot:
+        return super().get_snapshot()  # type: ignore[return-value]
+
+
+def get_postal_code_rule_index(
+    shipping_methods: Union[QuerySet, list[ShippingMethod]],
+) -> PostalCodeRuleIndex:
+    """Return postal code rules of the given shipping methods compiled for lookups.
+
+    Without the cache, rules are loaded with a single query. The cached index holds
+    rules of all shipping methods.
+    """
+    if settings.SHIPPING_POSTAL_CODE_RULES_CACHE_ENABLED:
+        return postal_code_rules.get_snapshot().rule_index
+    if isinstance(shipping_methods, QuerySet):
+        rules = ShippingMethodPostalCodeRule.objects.using(shipping_methods.db).filter(
+            shipping_method_id__in=shipping_methods.order_by().values("pk")
+        )
+    else:
+        rules = ShippingMethodPostalCodeRule.objects.filter(
+            shipping_method_id__in=[method.pk for method in shipping_methods]
+        )
+    return PostalCodeRuleIndex(rules)
+
+
+postal_code_rules = PostalCodeRules(
+    "shipping_postal_code_rules",
+    ShippingMethodPostalCodeRule.objects.all,
+    [ShippingMethodPostalCodeRule],
+)
@@ -1,8 +1,19 @@
 import re
-from typing import Any, Optional
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from django.conf import settings
 
 from . import PostalCodeRuleInclusionType
 
+if TYPE_CHECKING:
+    from .models import ShippingMethodPostalCodeRule
+
+UK_POSTAL_CODE_PATTERN = r"^([A-Z]{1,2})([0-9]+)([A-Z]?) ?([0-9][A-Z]{2})$"
+IRISH_POSTAL_CODE_PATTERN = r"([\dA-Z]{3}) ?([\dA-Z]{4})"
+
 
 def group_values(pattern, *values):
     result: list[Optional[tuple[Any, ...]]] = []
@@ -42,26 +53,59 @@ def compare_values(code, start, end):
     return start <= code <= end
 
 
-def check_uk_postal_code(code, start, end):
-    """Check postal code for uk, split the code by regex.
+def normalize_uk_postal_code(code):
+    """Split UK postal code by regex into a tuple comparable with other codes.
 
     Example postal codes: BH20 2BC  (UK), IM16 7HF  (Isle of Man).
     """
-    pattern = r"^([A-Z]{1,2})([0-9]+)([A-Z]?) ?([0-9][A-Z]{2})$"
-    code, start, end = group_values(pattern, code, start, end)
-    # replace second item of each tuple with it's value casted to int
-    code, start, end = cast_tuple_index_to_type(1, int, code, start, end)
-    return compare_values(code, start, end)
+    (code,) = group_values(UK_POSTAL_CODE_PATTERN, code)
+    # replace second item of the tuple with it's value casted to int
+    (code,) = cast_tuple_index_to_type(1, int, code)
+    return code
 
 
-def check_irish_postal_code(code, start, end):
-    """Check postal code for Ireland, split the code by regex.
+def normalize_irish_postal_code(code):
+    """Split Irish postal code by regex into a tuple comparable with other codes.
 
     Example postal codes: A65 2F0A, A61 2F0G.
     """
-    pattern = r"([\dA-Z]{3}) ?([\dA-Z]{4})"
-    code, start, end = group_values(pattern, code, start, end)
-    return compare_values(code, start, end)
+    (code,) = group_values(IRISH_POSTAL_CODE_PATTERN, code)
+    return code
+
+
+def normalize_any_postal_code(code):
+    """Fallback for any country not present in `POSTAL_CODE_NORMALIZERS`.
+
+    Codes are compared lexicographically without splitting to sections.
+    """
+    return code
+
+
+POSTAL_CODE_NORMALIZERS: dict[str, Callable[[Any], Any]] = {
+    "GB": normalize_uk_postal_code,  # United Kingdom
+    "IM": normalize_uk_postal_code,  # Isle of Man
+    "GG": normalize_uk_postal_code,  # Guernsey
+    "JE": normalize_uk_postal_code,  # Jersey
+    "IE": normalize_irish_postal_code,  # Ireland
+}
+
+
+def check_uk_postal_code(code, start, end):
+    """Check postal code for uk, split the code by regex."""
+    return compare_values(
+        normalize_uk_postal_code(code),
+        normalize_uk_postal_code(start),
+        normalize_uk_postal_code(end),
+    )
+
+
+def check_irish_postal_code(code, start, end):
+    """Check postal code for Ireland, split the code by regex."""
+    return compare_values(
+        normalize_irish_postal_code(code),
+        normalize_irish_postal_code(start),
+        normalize_irish_postal_code(end),
+    )
 
 
 def check_any_postal_code(code, start, end):
@@ -118,13 +162,130 @@ def is_shipping_method_applicable_for_postal_code(
     return False
 
 
+class PostalCodeRanges:
+    """Union of postal code ranges normalized for a country.
+
+    Overlapping ranges are merged, so checking whether a code belongs to any of
+    them takes a binary search instead of comparing it with every range.
+    """
+
+    def __init__(self, ranges: Iterable[tuple[Any, Any]]):
+        self.starts: list[Any] = []
+        self.ends: list[Any] = []
+        for start, end in sorted(
+            ranges, key=lambda postal_code_range: postal_code_range[0]
+        ):
+            if end is not None and end < start:
+                continue
+            if self.starts and (self.ends[-1] is None or start <= self.ends[-1]):
+                # `None` stands for a range without the upper bound.
+                if self.ends[-1] is not None and (end is None or end > self.ends[-1]):
+                    self.ends[-1] = end
+                continue
+            self.starts.append(start)
+            self.ends.append(end)
+
+    def __contains__(self, code) -> bool:
+        if not code:
+            return False
+        index = bisect_right(self.starts, code) - 1
+        if index < 0:
+            return False
+        end = self.ends[index]
+        return end is None or code <= end
+
+
+class PostalCodeRuleIndex:
+    """Postal code rules of shipping methods compiled for lookups by postal code.
+
+    Rules of a shipping method are normalized and merged into `PostalCodeRanges`
+    the first time they are checked for a country using a given normalizer, and
+    are reused for all later lookups.
+    """
+
+    def __init__(self, rules: Iterable["ShippingMethodPostalCodeRule"]):
+        self.rules_by_method_id: defaultdict[
+            int, list[ShippingMethodPostalCodeRule]
+        ] = defaultdict(list)
+        for rule in rules:
+            self.rules_by_method_id[rule.shipping_method_id].append(rule)
+        self._compiled: dict[
+            tuple[int, Callable], tuple[Optional[str], PostalCodeRanges]
+        ] = {}
+
+    def _compile(self, method_id: int, normalize: Callable):
+        key = (method_id, normalize)
+        if key not in self._compiled:
+            rules = self.rules_by_method_id[method_id]
+            inclusion_types = {rule.inclusion_type for rule in rules}
+            # Shipping methods with complex rules are not supported for now
+            inclusion_type = (
+                inclusion_types.pop() if len(inclusion_types) == 1 else None
+            )
+            ranges = []
+            for rule in rules:
+                start = normalize(rule.start)
+                if start:
+                    ranges.append((start, normalize(rule.end) or None))
+            self._compiled[key] = (inclusion_type, PostalCodeRanges(ranges))
+        return self._compiled[key]
+
+    def get_excluded_method_ids(
+        self, country: str, postal_code: str, method_ids: Optional[Iterable[int]] = None
+    ) -> list[int]:
+        """Return IDs of shipping methods not applicable for the postal code."""
+        normalize = POSTAL_CODE_NORMALIZERS.get(country, normalize_any_postal_code)
+        code = normalize(postal_code)
+        if method_ids is None:
+            method_ids = self.rules_by_method_id.keys()
+        excluded_method_ids = []
+        for method_id in method_ids:
+            if not self.rules_by_method_id.get(method_id):
+                continue
+            inclusion_type, ranges = self._compile(method_id, normalize)
+            if inclusion_type == PostalCodeRuleInclusionType.INCLUDE:
+                is_applicable = code in ranges
+            elif inclusion_type == PostalCodeRuleInclusionType.EXCLUDE:
+                is_applicable = code not in ranges
+            else:
+                is_applicable = False
+            if not is_applicable:
+                excluded_method_ids.append(method_id)
+        return excluded_method_ids
+
+
+def _get_shipping_method_ids(shipping_methods) -> list[int]:
+    if isinstance(shipping_methods, list) or shipping_methods._result_cache is not None:
+        return [method.pk for method in shipping_methods]
+    return list(shipping_methods.order_by().values_list("pk", flat=True))
+
+
 def filter_shipping_methods_by_postal_code_rules(shipping_methods, shipping_address):
-    """Filter shipping methods for given address by postal code rules."""
+    """Filter shipping methods for given address by postal code rules.
+
+    Excluded methods are found in the compiled postal code rules, so a given
+    queryset is not evaluated here and is returned with an extra filter. A list of
+    shipping methods is filtered in memory. The cached rules cover all shipping
+    methods, so only the IDs of the given ones are read to check their rules.
+    """
+    from .postal_code_rules import get_postal_code_rule_index
 
-    excluded_methods_by_postal_code = []
-    for method in shipping_methods:
-        if not is_shipping_method_applicable_for_postal_code(shipping_address, method):
-            excluded_methods_by_postal_code.append(method.pk)
+    if isinstance(shipping_methods, list) and not shipping_methods:
+        return shipping_methods
+    rule_index = get_postal_code_rule_index(shipping_methods)
+    method_ids = None
+    if settings.SHIPPING_POSTAL_CODE_RULES_CACHE_ENABLED:
+        method_ids = _get_shipping_method_ids(shipping_methods)
+    excluded_methods_by_postal_code = rule_index.get_excluded_method_ids(
+        shipping_address.country.code, shipping_address.postal_code, method_ids
+    )
+    if isinstance(shipping_methods, list):
+        excluded_method_ids = set(excluded_methods_by_postal_code)
+        return [
+            method
+            for method in shipping_methods
+            if method.pk not in excluded_method_ids
+        ]
     if excluded_methods_by_postal_code:
         return shipping_methods.exclude(pk__in=excluded_methods_by_postal_code)
     return shipping_methods
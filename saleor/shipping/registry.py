@@ -0,0 +1,223 @@
+"""Process-wide registry of shipping methods available in channels and countries.
+
+Listing delivery methods of a checkout or an order joins shipping zones, their
+channels, channel listings and excluded products every time the checkout is
+updated. When `SHIPPING_METHODS_CACHE_ENABLED` is set, the
+`applicable_shipping_methods_for_instance` queryset method filters shipping methods
+kept in a per-process snapshot instead.
+
+Shipping methods applicable for a country, channel and currency depend on the price
+and weight only through the ranges they fall in between the methods' minimum and
+maximum order prices and weights. The snapshot memoizes methods matching every such
+range once it has been computed, and filters out methods excluding ordered products
+on each lookup.
+
+The snapshot is invalidated in the same way as the reference data snapshots: saving
+or deleting shipping zones, shipping methods, their channel listings or tax classes,
+and changing channels of zones or products excluded from methods bumps the version
+once the transaction is committed. Code modifying these objects with bulk queries
+calls `invalidate()` explicitly.
+"""
+
+import copy
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Optional
+
+from django.conf import settings
+from django.db.models.signals import m2m_changed
+from measurement.measures import Weight
+from prices import Money
+
+from ..core.reference_data import ReferenceData, ReferenceDataSnapshot
+from ..tax.models import TaxClass
+from . import ShippingMethodType
+from .models import ShippingMethod, ShippingMethodChannelListing, ShippingZone
+
+
+def _get_range_key(bounds: list, value) -> tuple[int, int]:
+    # Values with the same key compare in the same way with all bounds.
+    return bisect_left(bounds, value), bisect_right(bounds, value)
+
+
+def _get_weight_value(weight: Optional[Weight]) -> Optional[float]:
+    # Weights are compared in the standard unit, in which they are stored.
+    return weight.standard if weight is not None else None
+
+
+class ShippingMethodsSnapshot(ReferenceDataSnapshot):
+    """Shipping methods with channel listings, indexed by channel and currency."""
+
+    def __init__(
+        self,
+        version: Optional[int],
+        shipping_methods: Iterable[ShippingMethod],
+        zone_channel_ids: Iterable[tuple[int, int]],
+        excluded_product_ids: Iterable[tuple[int, int]],
+    ):
+        super().__init__(version, shipping_methods)
+        channel_ids_by_zone_id: defaultdict[int, set[int]] = defaultdict(set)
+        for zone_id, channel_id in zone_channel_ids:
+            channel_ids_by_zone_id[zone_id].add(channel_id)
+        self.excluded_product_ids_by_method_id: defaultdict[
+            int, set[int]
+        ] = defaultdict(set)
+        for method_id, product_id in excluded_product_ids:
+            self.excluded_product_ids_by_method_id[method_id].add(product_id)
+
+        self.methods_by_channel_and_currency: defaultdict[
+            tuple[int, str], list[tuple[ShippingMethod, ShippingMethodChannelListing]]
+        ] = defaultdict(list)
+        for method in self.objects:
+            zone_channel_ids_set = channel_ids_by_zone_id[method.shipping_zone_id]
+            for listing in method.channel_listings.all():
+                if listing.channel_id in zone_channel_ids_set:
+                    key = (listing.channel_id, listing.currency)
+                    self.methods_by_channel_and_currency[key].append((method, listing))
+        self.country_codes_by_zone_id = {
+            method.shipping_zone_id: {
+                country.code for country in method.shipping_zone.countries
+            }
+            for method in self.objects
+        }
+        for methods in self.methods_by_channel_and_currency.values():
+            methods.sort(key=lambda item: (item[1].price_amount, item[0].pk))
+
+        self._bounds: dict[tuple[int, str], tuple[list, list]] = {}
+        self._applicable_method_ids: dict[tuple, list[int]] = {}
+
+    def _get_bounds(self, channel_id: int, currency: str) -> tuple[list, list]:
+        key = (channel_id, currency)
+        if key not in self._bounds:
+            price_bounds = set()
+            weight_bounds = set()
+            for method, listing in self.methods_by_channel_and_currency.get(key, []):
+                if method.type == ShippingMethodType.PRICE_BASED:
+                    price_bounds.add(listing.minimum_order_price_amount)
+                    price_bounds.add(listing.maximum_order_price_amount)
+                elif method.type == ShippingMethodType.WEIGHT_BASED:
+                    weight_bounds.add(_get_weight_value(method.minimum_order_weight))
+                    weight_bounds.add(_get_weight_value(method.maximum_order_weight))
+            price_bounds.discard(None)
+            weight_bounds.discard(None)
+            self._bounds[key] = (sorted(price_bounds), sorted(weight_bounds))
+        return self._bounds[key]
+
+    def _get_applicable_method_ids(
+        self, country_code: str, channel_id: int, price: Money, weight: Weight
+    ) -> list[int]:
+        price_bounds, weight_bounds = self._get_bounds(channel_id, price.currency)
+        weight_value = weight.standard
+        key = (
+            country_code,
+            channel_id,
+            price.currency,
+            _get_range_key(price_bounds, price.amount),
+            _get_range_key(weight_bounds, weight_value),
+        )
+        if key not in self._applicable_method_ids:
+            method_ids = []
+            for method, listing in self.methods_by_channel_and_currency.get(
+                (channel_id, price.currency), []
+            ):
+                country_codes = self.country_codes_by_zone_id[method.shipping_zone_id]
+                if country_code in country_codes and _is_method_applicable(
+                    method, listing, price, weight_value
+                ):
+                    method_ids.append(method.pk)
+            self._applicable_method_ids[key] = method_ids
+        return self._applicable_method_ids[key]
+
+    def get_applicable_shipping_methods(
+        self,
+        price: Money,
+        channel_id: int,
+        weight: Weight,
+        country_code: str,
+        product_ids: Optional[Iterable[int]] = None,
+    ) -> list[ShippingMethod]:
+        """Return copies of applicable shipping methods ordered by price.
+
+        Mirrors `ShippingMethodQueryset.applicable_shipping_methods`.
+        """
+        product_ids = set(product_ids or [])
+        index = self.index("pk")
+        return copy.deepcopy(
+            [
+                index[method_id]
+                for method_id in self._get_applicable_method_ids(
+                    country_code, channel_id, price, weight
+                )
+                if product_ids.isdisjoint(
+                    self.excluded_product_ids_by_method_id.get(method_id, ())
+                )
+            ]
+        )
+
+
+def _is_method_applicable(
+    method: ShippingMethod,
+    listing: ShippingMethodChannelListing,
+    price: Money,
+    weight_value: float,
+) -> bool:
+    if method.type == ShippingMethodType.PRICE_BASED:
+        min_price = listing.minimum_order_price_amount
+        max_price = listing.maximum_order_price_amount
+        return (min_price is None or min_price <= price.amount) and (
+            max_price is None or max_price >= price.amount
+        )
+    if method.type == ShippingMethodType.WEIGHT_BASED:
+        min_weight = _get_weight_value(method.minimum_order_weight)
+        max_weight = _get_weight_value(method.maximum_order_weight)
+        return (min_weight is None or min_weight <= weight_value) and (
+            max_weight is None or max_weight >= weight_value
+        )
+    return False
+
+
+class ShippingMethodsRegistry(ReferenceData):
+    def load_snapshot(self, version: Optional[int] = None) -> ShippingMethodsSnapshot:
+        database = settings.DATABASE_CONNECTION_DEFAULT_NAME
+        # Prefetches are not applied to `iterator()`, so the queryset is evaluated.
+        shipping_methods = list(
+            self.get_queryset()
+            .using(database)
+            .select_related("shipping_zone", "tax_class")
+            .prefetch_related("channel_listings")
+        )
+        zone_channel_ids = ShippingZone.channels.through.objects.using(
+            database
+        ).values_list("shippingzone_id", "channel_id")
+        excluded_product_ids = ShippingMethod.excluded_products.through.objects.using(
+            database
+        ).values_list("shippingmethod_id", "product_id")
+        return ShippingMethodsSnapshot(
+            version, shipping_methods, zone_channel_ids, excluded_product_ids
+        )
+
+    def get_snapshot(self) -> ShippingMethodsSnapshot:
+        return super().get_snapshot()  # type: ignore[return-value]
+
+    def connect_signals(self):
+        super().connect_signals()
+        for through in [
+            ShippingZone.channels.through,
+            ShippingMethod.excluded_products.through,
+        ]:
+            m2m_changed.connect(
+                self.handle_change,
+                sender=through,
+                weak=False,
+                dispatch_uid=(
+                    f"invalidate_{self.name}_on_{through._meta.label_lower}_change"
+                ),
+            )
+
+
+shipping_methods_registry = ShippingMethodsRegistry(
+    "shipping_methods",
+    ShippingMethod.objects.all,
+    [ShippingZone, ShippingMethod, ShippingMethodChannelListing, TaxClass],
+)
@@ -2,9 +2,14 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from .. import PostalCodeRuleInclusionType
+from .. import PostalCodeRuleInclusionType, ShippingMethodType
+from ..models import ShippingMethod, ShippingMethodPostalCodeRule
+from ..postal_code_rules import postal_code_rules
 from ..postal_codes import (
+    PostalCodeRanges,
+    PostalCodeRuleIndex,
     check_postal_code_in_range,
+    filter_shipping_methods_by_postal_code_rules,
     is_shipping_method_applicable_for_postal_code,
 )
 
@@ -122,3 +127,220 @@ def test_is_shipping_method_applicable_for_postal_code(
     assert (
         is_shipping_method_applicable_for_postal_code(Mock(), Mock()) is is_applicable
     )
+
+
+@pytest.mark.parametrize(
+    ("ranges", "code", "in_ranges"),
+    [
+        ([], "50-000", False),
+        ([("50-000", "60-000")], "", False),
+        ([("50-000", "60-000")], "49-999", False),
+        ([("50-000", "60-000")], "50-000", True),
+        ([("50-000", "60-000")], "60-000", True),
+        ([("50-000", "60-000")], "60-001", False),
+        ([("50-000", None)], "99-999", True),
+        ([("50-000", "55-000"), ("54-000", "60-000")], "57-000", True),
+        ([("50-000", "60-000"), ("51-000", "52-000")], "57-000", True),
+        ([("50-000", "52-000"), ("55-000", "60-000")], "53-000", False),
+        ([("50-000", None), ("55-000", "60-000")], "61-000", True),
+        ([("60-000", "50-000")], "55-000", False),
+    ],
+)
+def test_postal_code_ranges(ranges, code, in_ranges):
+    assert (code in PostalCodeRanges(ranges)) is in_ranges
+
+
+@pytest.mark.parametrize(
+    ("country", "code", "rules"),
+    [
+        ("GB", "BH3 2BC", [("BH2 1AA", "BH4 9ZZ")]),
+        ("GB", "BH20 2BC", [("BH2 1AA", "BH4 9ZZ"), ("BH16 7HA", None)]),
+        ("GB", "BH16 7HB", [("BH16 7HC", "BH16 7HD"), ("BH10 7HA", "BH12 1AA")]),
+        ("GB", "invalid", [("BH2 1AA", "BH4 9ZZ")]),
+        ("GB", "BH3 2BC", [("invalid", "BH4 9ZZ")]),
+        ("GB", "BH30 2BC", [("BH2 1AA", "invalid")]),
+        ("IE", "A65 2F0B", [("A65 2F0A", "A65 2F0C")]),
+        ("IE", "A65 2F0B", [("A65 2F0C", "A65 2F0D")]),
+        ("PL", "64-620", [("63-200", "63-650"), ("64-200", "64-650")]),
+        ("PL", "64-620", [("63-200", "63-650"), ("64-630", None)]),
+    ],
+)
+@pytest.mark.parametrize(
+    "inclusion_type",
+    [PostalCodeRuleInclusionType.INCLUDE, PostalCodeRuleInclusionType.EXCLUDE],
+)
+def test_postal_code_rule_index_matches_checking_every_rule(
+    country, code, rules, inclusion_type
+):
+    # given
+    method = Mock(pk=1)
+    method.postal_code_rules.all.return_value = [
+        Mock(
+            shipping_method_id=method.pk,
+            start=start,
+            end=end,
+            inclusion_type=inclusion_type,
+        )
+        for start, end in rules
+    ]
+    address = Mock(postal_code=code, country=Mock(code=country))
+    rule_index = PostalCodeRuleIndex(method.postal_code_rules.all())
+
+    # when
+    excluded_method_ids = rule_index.get_excluded_method_ids(country, code)
+
+    # then
+    is_applicable = is_shipping_method_applicable_for_postal_code(address, method)
+    assert (method.pk not in excluded_method_ids) is is_applicable
+
+
+def test_postal_code_rule_index_excludes_methods_with_mixed_rules():
+    # given
+    rule_index = PostalCodeRuleIndex(
+        [
+            Mock(
+                shipping_method_id=1,
+                start="50-000",
+                end="60-000",
+                inclusion_type=PostalCodeRuleInclusionType.INCLUDE,
+            ),
+            Mock(
+                shipping_method_id=1,
+                start="70-000",
+                end=None,
+                inclusion_type=PostalCodeRuleInclusionType.EXCLUDE,
+            ),
+        ]
+    )
+
+    # when
+    excluded_method_ids = rule_index.get_excluded_method_ids("PL", "55-000")
+
+    # then
+    assert excluded_method_ids == [1]
+
+
+@pytest.fixture
+def _postal_code_rules_cache(settings):
+    settings.SHIPPING_POSTAL_CODE_RULES_CACHE_ENABLED = True
+    postal_code_rules.clear()
+    yield
+    postal_code_rules.clear()
+
+
+def test_filter_shipping_methods_by_postal_code_rules(
+    shipping_zone, address, django_assert_num_queries
+):
+    # given
+    excluded_method, included_method = ShippingMethod.objects.bulk_create(
+        [
+            ShippingMethod(
+                name="Excluded",
+                type=ShippingMethodType.PRICE_BASED,
+                shipping_zone=shipping_zone,
+            ),
+            ShippingMethod(
+                name="Included",
+                type=ShippingMethodType.PRICE_BASED,
+                shipping_zone=shipping_zone,
+            ),
+        ]
+    )
+    excluded_method.postal_code_rules.create(start="50-000", end="60-000")
+    included_method.postal_code_rules.create(
+        start="50-000", inclusion_type=PostalCodeRuleInclusionType.INCLUDE
+    )
+    address.country = "PL"
+    address.postal_code = "53-601"
+
+    # when
+    with django_assert_num_queries(1):
+        shipping_methods = filter_shipping_methods_by_postal_code_rules(
+            ShippingMethod.objects.all(), address
+        )
+
+    # then
+    assert set(shipping_methods) == (
+        set(shipping_zone.shipping_methods.all()) - {excluded_method}
+    )
+
+
+@pytest.mark.usefixtures("_postal_code_rules_cache")
+def test_filter_shipping_methods_by_postal_code_rules_from_cache(
+    shipping_method, address, django_assert_num_queries
+):
+    # given
+    shipping_method.postal_code_rules.bulk_create(
+        [
+            ShippingMethodPostalCodeRule(
+                shipping_method=shipping_method,
+                start=f"{index:02}-000",
+                end=f"{index:02}-999",
+            )
+            for index in range(0, 100, 2)
+        ]
+    )
+    address.country = "PL"
+    address.postal_code = "53-601"
+    shipping_methods = ShippingMethod.objects.all()
+    filter_shipping_methods_by_postal_code_rules(shipping_methods, address)
+
+    # when
+    with django_assert_num_queries(1):
+        filtered_shipping_methods = filter_shipping_methods_by_postal_code_rules(
+            shipping_methods, address
+        )
+
+    # then
+    assert list(filtered_shipping_methods) == [shipping_method]
+
+
+@pytest.mark.usefixtures("_postal_code_rules_cache")
+def test_filter_shipping_methods_by_postal_code_rules_from_cache_checks_given_methods(
+    shipping_zone, address
+):
+    # given
+    given_method, other_method = ShippingMethod.objects.bulk_create(
+        [
+            ShippingMethod(
+                name=name,
+                type=ShippingMethodType.PRICE_BASED,
+                shipping_zone=shipping_zone,
+            )
+            for name in ["Given", "Other"]
+        ]
+    )
+    for method in [given_method, other_method]:
+        method.postal_code_rules.create(start="50-000", end="60-000")
+    address.country = "PL"
+    address.postal_code = "53-601"
+
+    # when
+    filtered_shipping_methods = filter_shipping_methods_by_postal_code_rules(
+        ShippingMethod.objects.filter(pk=given_method.pk), address
+    )
+
+    # then
+    assert not filtered_shipping_methods
+    rule_index = postal_code_rules.get_snapshot().rule_index
+    assert {method_id for method_id, _ in rule_index._compiled} == {given_method.pk}
+
+
+@pytest.mark.usefixtures("_postal_code_rules_cache")
+def test_postal_code_rules_cache_invalidated_after_rule_create(
+    shipping_method, address, django_capture_on_commit_callbacks
+):
+    # given
+    address.country = "PL"
+    address.postal_code = "53-601"
+    shipping_methods = ShippingMethod.objects.filter(pk=shipping_method.pk)
+    assert list(
+        filter_shipping_methods_by_postal_code_rules(shipping_methods, address)
+    ) == [shipping_method]
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        shipping_method.postal_code_rules.create(start="50-000", end="60-000")
+
+    # then
+    assert not filter_shipping_methods_by_postal_code_rules(shipping_methods, address)
@@ -0,0 +1,297 @@
+import pytest
+from measurement.measures import Weight
+from prices import Money
+
+from ...checkout.fetch import fetch_checkout_lines
+from .. import ShippingMethodType
+from ..models import ShippingMethod, ShippingMethodChannelListing
+from ..registry import shipping_methods_registry
+
+
+@pytest.fixture(autouse=True)
+def _shipping_methods_registry(settings):
+    settings.SHIPPING_METHODS_CACHE_ENABLED = True
+    shipping_methods_registry.clear()
+    yield
+    shipping_methods_registry.clear()
+
+
+@pytest.fixture
+def shipping_methods_with_bounds(shipping_zone, channel_USD, other_channel_USD):
+    price_methods = ShippingMethod.objects.bulk_create(
+        [
+            ShippingMethod(
+                name=f"Price {min_price}-{max_price}",
+                type=ShippingMethodType.PRICE_BASED,
+                shipping_zone=shipping_zone,
+            )
+            for min_price, max_price in [(0, 10), (10, 20), (15, None)]
+        ]
+    )
+    weight_methods = ShippingMethod.objects.bulk_create(
+        [
+            ShippingMethod(
+                name=f"Weight {min_weight}-{max_weight}",
+                type=ShippingMethodType.WEIGHT_BASED,
+                shipping_zone=shipping_zone,
+                minimum_order_weight=min_weight,
+                maximum_order_weight=max_weight,
+            )
+            for min_weight, max_weight in [
+                (Weight(kg=0), Weight(kg=1)),
+                (Weight(kg=1), Weight(kg=5)),
+                (Weight(g=1500), None),
+            ]
+        ]
+    )
+    listings = [
+        ShippingMethodChannelListing(
+            shipping_method=method,
+            channel=channel_USD,
+            currency=channel_USD.currency_code,
+            minimum_order_price_amount=min_price,
+            maximum_order_price_amount=max_price,
+            price_amount=index,
+        )
+        for index, (method, (min_price, max_price)) in enumerate(
+            zip(price_methods, [(0, 10), (10, 20), (15, None)])
+        )
+    ]
+    listings += [
+        ShippingMethodChannelListing(
+            shipping_method=method,
+            channel=channel,
+            currency=channel.currency_code,
+            price_amount=index,
+        )
+        for index, method in enumerate(weight_methods)
+        for channel in [channel_USD, other_channel_USD]
+    ]
+    ShippingMethodChannelListing.objects.bulk_create(listings)
+    return price_methods + weight_methods
+
+
+@pytest.mark.parametrize("price", [0, 5, 10, 12, 15, 20, 25])
+@pytest.mark.parametrize("weight", [Weight(kg=0), Weight(g=1000), Weight(kg=3)])
+@pytest.mark.parametrize("country_code", ["PL", "XX"])
+def test_get_applicable_shipping_methods_matches_queryset(
+    price,
+    weight,
+    country_code,
+    shipping_methods_with_bounds,
+    channel_USD,
+):
+    # given
+    expected_methods = ShippingMethod.objects.applicable_shipping_methods(
+        price=Money(price, "USD"),
+        channel_id=channel_USD.id,
+        weight=weight,
+        country_code=country_code,
+    )
+
+    # when
+    methods = shipping_methods_registry.get_snapshot().get_applicable_shipping_methods(
+        price=Money(price, "USD"),
+        channel_id=channel_USD.id,
+        weight=weight,
+        country_code=country_code,
+    )
+
+    # then
+    assert {method.pk for method in methods} == {
+        method.pk for method in expected_methods
+    }
+
+
+def test_get_applicable_shipping_methods_other_currency(
+    shipping_methods_with_bounds, channel_USD
+):
+    # when
+    methods = shipping_methods_registry.get_snapshot().get_applicable_shipping_methods(
+        price=Money(5, "PLN"),
+        channel_id=channel_USD.id,
+        weight=Weight(kg=0),
+        country_code="PL",
+    )
+
+    # then
+    assert methods == []
+
+
+def test_get_applicable_shipping_methods_with_excluded_products(
+    shipping_methods_with_bounds, channel_USD, product
+):
+    # given
+    excluded_method, *_ = shipping_methods_with_bounds
+    excluded_method.excluded_products.add(product)
+    snapshot = shipping_methods_registry.get_snapshot()
+
+    # when
+    methods_with_product = snapshot.get_applicable_shipping_methods(
+        price=Money(5, "USD"),
+        channel_id=channel_USD.id,
+        weight=Weight(kg=0),
+        country_code="PL",
+        product_ids=[product.pk],
+    )
+    methods_without_product = snapshot.get_applicable_shipping_methods(
+        price=Money(5, "USD"),
+        channel_id=channel_USD.id,
+        weight=Weight(kg=0),
+        country_code="PL",
+    )
+
+    # then
+    assert excluded_method not in methods_with_product
+    assert excluded_method in methods_without_product
+
+
+def test_get_applicable_shipping_methods_ordered_by_price(
+    shipping_methods_with_bounds, channel_USD
+):
+    # when
+    methods = shipping_methods_registry.get_snapshot().get_applicable_shipping_methods(
+        price=Money(10, "USD"),
+        channel_id=channel_USD.id,
+        weight=Weight(kg=1),
+        country_code="PL",
+    )
+
+    # then
+    listings = ShippingMethodChannelListing.objects.filter(
+        channel=channel_USD, shipping_method__in=methods
+    )
+    price_by_method_id = {
+        listing.shipping_method_id: listing.price_amount for listing in listings
+    }
+    prices = [price_by_method_id[method.pk] for method in methods]
+    assert prices == sorted(prices)
+
+
+def test_get_applicable_shipping_methods_skips_queries_after_warm_up(
+    shipping_methods_with_bounds, channel_USD, django_assert_num_queries
+):
+    # given
+    lookup = {
+        "price": Money(10, "USD"),
+        "channel_id": channel_USD.id,
+        "weight": Weight(kg=1),
+        "country_code": "PL",
+    }
+    shipping_methods_registry.get_snapshot().get_applicable_shipping_methods(**lookup)
+
+    # when
+    with django_assert_num_queries(0):
+        methods = (
+            shipping_methods_registry.get_snapshot().get_applicable_shipping_methods(
+                **lookup
+            )
+        )
+        for method in methods:
+            assert method.tax_class_id is None or method.tax_class
+
+    # then
+    assert methods
+
+
+def test_shipping_methods_registry_invalidated_after_listing_change(
+    shipping_methods_with_bounds, channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    method = shipping_methods_with_bounds[0]
+    lookup = {
+        "price": Money(5, "USD"),
+        "channel_id": channel_USD.id,
+        "weight": Weight(kg=0),
+        "country_code": "PL",
+    }
+    assert method in (
+        shipping_methods_registry.get_snapshot().get_applicable_shipping_methods(
+            **lookup
+        )
+    )
+    listing = method.channel_listings.get(channel=channel_USD)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        listing.minimum_order_price_amount = 6
+        listing.save(update_fields=["minimum_order_price_amount"])
+
+    # then
+    assert method not in (
+        shipping_methods_registry.get_snapshot().get_applicable_shipping_methods(
+            **lookup
+        )
+    )
+
+
+def test_shipping_methods_registry_invalidated_after_excluding_products(
+    shipping_methods_with_bounds,
+    channel_USD,
+    product,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    method = shipping_methods_with_bounds[0]
+    lookup = {
+        "price": Money(5, "USD"),
+        "channel_id": channel_USD.id,
+        "weight": Weight(kg=0),
+        "country_code": "PL",
+        "product_ids": [product.pk],
+    }
+    shipping_methods_registry.get_snapshot()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        method.excluded_products.add(product)
+
+    # then
+    assert method not in (
+        shipping_methods_registry.get_snapshot().get_applicable_shipping_methods(
+            **lookup
+        )
+    )
+
+
+def test_applicable_shipping_methods_for_instance_from_registry(
+    settings, checkout_with_item, address, shipping_zone, channel_USD
+):
+    # given
+    checkout = checkout_with_item
+    checkout.shipping_address = address
+    checkout.save(update_fields=["shipping_address"])
+    lines, _ = fetch_checkout_lines(checkout)
+    excluded_method = ShippingMethod.objects.create(
+        name="Excluded by postal code",
+        type=ShippingMethodType.PRICE_BASED,
+        shipping_zone=shipping_zone,
+    )
+    ShippingMethodChannelListing.objects.create(
+        shipping_method=excluded_method,
+        channel=channel_USD,
+        currency=channel_USD.currency_code,
+    )
+    excluded_method.postal_code_rules.create(start=address.postal_code)
+    lookup = {
+        "channel_id": channel_USD.id,
+        "price": Money(0, "USD"),
+        "lines": lines,
+    }
+    settings.SHIPPING_METHODS_CACHE_ENABLED = False
+    expected_methods = list(
+        ShippingMethod.objects.applicable_shipping_methods_for_instance(
+            checkout, **lookup
+        )
+    )
+    settings.SHIPPING_METHODS_CACHE_ENABLED = True
+
+    # when
+    methods = ShippingMethod.objects.applicable_shipping_methods_for_instance(
+        checkout, **lookup
+    )
+
+    # then
+    assert expected_methods
+    assert excluded_method not in expected_methods
+    assert methods == expected_methods
@@ -74,6 +74,7 @@ from ..discount.models import (
 )
 from ..giftcard import GiftCardEvents
 from ..giftcard.models import GiftCard, GiftCardEvent, GiftCardTag
+from ..graphql.document_cache import clear_document_cache
 from ..menu.models import Menu, MenuItem, MenuItemTranslation
 from ..order import OrderOrigin, OrderStatus
 from ..order.actions import cancel_fulfillment, fulfill_order_lines
@@ -244,6 +245,13 @@ def setup_dummy_gateways(settings):
     return settings
 
 
+@pytest.fixture(autouse=True)
+def _clear_graphql_document_cache():
+    clear_document_cache()
+    yield
+    clear_document_cache()
+
+
 @pytest.fixture
 def _sample_gateway(settings):
     settings.PLUGINS += [
@@ -1,16 +1,22 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 
 
 class ThumbnailAppConfig(AppConfig):
     name = "saleor.thumbnail"
 
     def ready(self):
+        from ..product.models import ProductMedia
         from .models import Thumbnail
-        from .signals import delete_thumbnail_image
+        from .signals import create_product_media_thumbnails, delete_thumbnail_image
 
         post_delete.connect(
             delete_thumbnail_image,
             sender=Thumbnail,
             dispatch_uid="delete_thumbnail_image",
         )
+        post_save.connect(
+            create_product_media_thumbnails,
+            sender=ProductMedia,
+            dispatch_uid="create_product_media_thumbnails",
+        )
@@ -1,6 +1,20 @@
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+
 from ..core.tasks import delete_from_storage_task
 
 
 def delete_thumbnail_image(sender, instance, **kwargs):
     if image := instance.image:
         delete_from_storage_task.delay(image.name)
+
+
+def create_product_media_thumbnails(sender, instance, created, **kwargs):
+    if created and instance.image and settings.PRODUCT_MEDIA_THUMBNAIL_SIZES:
+        from .tasks import create_product_media_thumbnails_task
+
+        transaction.on_commit(
+            partial(create_product_media_thumbnails_task.delay, instance.pk)
+        )
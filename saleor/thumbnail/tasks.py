@@ -0,0 +1,79 @@
+from celery.utils.log import get_task_logger
+from django.conf import settings
+
+from ..celeryconf import app
+from ..core.utils.events import call_event
+from ..plugins.manager import get_plugins_manager
+from ..product.models import ProductMedia
+from . import ALLOWED_THUMBNAIL_FORMATS
+from .models import Thumbnail
+from .utils import (
+    ProcessedImage,
+    acquire_thumbnail_lock,
+    get_thumbnail_format,
+    get_thumbnail_lock_key,
+    get_thumbnail_size,
+    prepare_thumbnail_file_name,
+    release_thumbnail_lock,
+)
+
+task_logger = get_task_logger(__name__)
+
+
+@app.task
+def create_product_media_thumbnails_task(product_media_id):
+    """Create thumbnails of the product media in the configured sizes and formats.
+
+    Thumbnails of each format are created from a single decode of the image.
+    Thumbnails which already exist or are being created by a request are skipped.
+    """
+    media = ProductMedia.objects.filter(pk=product_media_id).first()
+    if not media or not media.image:
+        return
+
+    sizes = {
+        get_thumbnail_size(size) for size in settings.PRODUCT_MEDIA_THUMBNAIL_SIZES
+    }
+    existing_thumbnails = set(
+        Thumbnail.objects.filter(product_media=media).values_list("size", "format")
+    )
+    manager = get_plugins_manager()
+    for thumbnail_format in settings.PRODUCT_MEDIA_THUMBNAIL_FORMATS:
+        format = get_thumbnail_format(thumbnail_format)
+        if format and format not in ALLOWED_THUMBNAIL_FORMATS:
+            task_logger.warning("Unsupported thumbnail format: %r.", format)
+            continue
+
+        lock_keys = {}
+        for size in sizes:
+            if (size, format) in existing_thumbnails:
+                continue
+            lock_key = get_thumbnail_lock_key(
+                "ProductMedia", str(media.pk), size, format
+            )
+            if acquire_thumbnail_lock(lock_key):
+                lock_keys[size] = lock_key
+        # thumbnails could be created by requests holding the locks in the meantime
+        created_sizes = Thumbnail.objects.filter(
+            product_media=media, format=format, size__in=lock_keys
+        ).values_list("size", flat=True)
+        for size in created_sizes:
+            release_thumbnail_lock(lock_keys.pop(size))
+        if not lock_keys:
+            continue
+
+        try:
+            processed_image = ProcessedImage(media.image.name, max(lock_keys), format)
+            thumbnail_files = processed_image.create_thumbnails(lock_keys)
+            for size, (thumbnail_file, _) in thumbnail_files.items():
+                thumbnail = Thumbnail(size=size, format=format, product_media=media)
+                thumbnail.image.save(
+                    prepare_thumbnail_file_name(media.image.name, size, format),
+                    thumbnail_file,
+                )
+                thumbnail.save()
+                setattr(thumbnail, "instance", media)
+                call_event(manager.thumbnail_created, thumbnail)
+        finally:
+            for lock_key in lock_keys.values():
+                release_thumbnail_lock(lock_key)
@@ -0,0 +1,156 @@
+import time
+from io import BytesIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
+
+from ...product.models import ProductMedia
+from ..models import Thumbnail
+from ..tasks import create_product_media_thumbnails_task
+from ..utils import get_thumbnail_lock_key
+
+
+def _create_product_media(product, width, height):
+    img_data = BytesIO()
+    Image.new("RGB", size=(width, height)).save(img_data, format="JPEG")
+    return ProductMedia.objects.create(
+        product=product,
+        image=SimpleUploadedFile("product.jpg", img_data.getvalue()),
+    )
+
+
+@mock.patch("saleor.plugins.manager.PluginsManager.thumbnail_created")
+def test_create_product_media_thumbnails_task(
+    mocked_thumbnail_created,
+    product,
+    settings,
+    media_root,
+    django_capture_on_commit_callbacks,
+    record_property,
+):
+    # given
+    settings.PRODUCT_MEDIA_THUMBNAIL_SIZES = [60, 256, 1024]
+    settings.PRODUCT_MEDIA_THUMBNAIL_FORMATS = ["original", "webp"]
+    product_media = _create_product_media(product, 2000, 2000)
+
+    # when
+    start = time.perf_counter()
+    with django_capture_on_commit_callbacks(execute=True):
+        create_product_media_thumbnails_task(product_media.pk)
+    duration = time.perf_counter() - start
+
+    # then
+    record_property("duration_ms", duration * 1000)
+    thumbnails = Thumbnail.objects.filter(product_media=product_media)
+    assert set(thumbnails.values_list("size", "format")) == {
+        (size, format) for size in [64, 256, 1024] for format in [None, "webp"]
+    }
+    for thumbnail in thumbnails:
+        with thumbnail.image.open() as thumbnail_file:
+            assert Image.open(thumbnail_file).size == (thumbnail.size, thumbnail.size)
+    assert mocked_thumbnail_created.call_count == 6
+
+
+def test_create_product_media_thumbnails_task_skips_existing_thumbnails(
+    product_media_image, settings, image, media_root
+):
+    # given
+    settings.PRODUCT_MEDIA_THUMBNAIL_SIZES = [64, 128]
+    thumbnail = Thumbnail.objects.create(
+        product_media=product_media_image, size=128, image=image
+    )
+
+    # when
+    create_product_media_thumbnails_task(product_media_image.pk)
+
+    # then
+    thumbnails = Thumbnail.objects.filter(product_media=product_media_image)
+    assert set(thumbnails.values_list("size", flat=True)) == {64, 128}
+    assert thumbnails.get(size=128) == thumbnail
+
+
+def test_create_product_media_thumbnails_task_skips_locked_sizes(
+    product_media_image, settings, media_root
+):
+    # given
+    settings.PRODUCT_MEDIA_THUMBNAIL_SIZES = [64, 128]
+    lock_key = get_thumbnail_lock_key(
+        "ProductMedia", str(product_media_image.pk), 128, None
+    )
+    cache.add(lock_key, True)
+
+    # when
+    create_product_media_thumbnails_task(product_media_image.pk)
+
+    # then
+    thumbnails = Thumbnail.objects.filter(product_media=product_media_image)
+    assert list(thumbnails.values_list("size", flat=True)) == [64]
+    assert cache.get(lock_key)
+    assert (
+        cache.get(
+            get_thumbnail_lock_key(
+                "ProductMedia", str(product_media_image.pk), 64, None
+            )
+        )
+        is None
+    )
+    cache.delete(lock_key)
+
+
+@mock.patch("saleor.thumbnail.tasks.acquire_thumbnail_lock")
+def test_create_product_media_thumbnails_task_skips_thumbnails_created_before_lock(
+    mocked_acquire_thumbnail_lock, product_media_image, settings, image, media_root
+):
+    # given
+    settings.PRODUCT_MEDIA_THUMBNAIL_SIZES = [64, 128]
+    lock_key = get_thumbnail_lock_key(
+        "ProductMedia", str(product_media_image.pk), 128, None
+    )
+    thumbnail = Thumbnail(product_media=product_media_image, size=128, image=image)
+
+    def acquire_thumbnail_lock(key):
+        # the thumbnail is created by a request that releases the lock right
+        # before it is acquired
+        if key == lock_key:
+            thumbnail.save()
+        return cache.add(key, True)
+
+    mocked_acquire_thumbnail_lock.side_effect = acquire_thumbnail_lock
+
+    # when
+    create_product_media_thumbnails_task(product_media_image.pk)
+
+    # then
+    thumbnails = Thumbnail.objects.filter(product_media=product_media_image)
+    assert set(thumbnails.values_list("size", flat=True)) == {64, 128}
+    assert thumbnails.get(size=128) == thumbnail
+    assert cache.get(lock_key) is None
+
+
+@mock.patch("saleor.thumbnail.tasks.create_product_media_thumbnails_task.delay")
+def test_product_media_thumbnails_created_on_upload(
+    mocked_task, product, settings, media_root, django_capture_on_commit_callbacks
+):
+    # given
+    settings.PRODUCT_MEDIA_THUMBNAIL_SIZES = [256]
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        product_media = _create_product_media(product, 10, 10)
+
+    # then
+    mocked_task.assert_called_once_with(product_media.pk)
+
+
+@mock.patch("saleor.thumbnail.tasks.create_product_media_thumbnails_task.delay")
+def test_product_media_thumbnails_not_created_on_upload_by_default(
+    mocked_task, product, media_root, django_capture_on_commit_callbacks
+):
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        _create_product_media(product, 10, 10)
+
+    # then
+    mocked_task.assert_not_called()
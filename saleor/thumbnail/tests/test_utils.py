@@ -1,8 +1,11 @@
-from unittest.mock import MagicMock
+from io import BytesIO
+from unittest.mock import MagicMock, patch
 
 import graphene
 import pytest
+from django.core.cache import cache
 from django.core.files import File
+from PIL import Image
 
 from .. import FILE_NAME_MAX_LENGTH, ThumbnailFormat
 from ..models import Thumbnail
@@ -13,6 +16,7 @@ from ..utils import (
     get_thumbnail_size,
     prepare_image_proxy_url,
     prepare_thumbnail_file_name,
+    wait_for_thumbnail_lock,
 )
 
 
@@ -115,6 +119,44 @@ def test_processed_image_preprocess_method_called(category_with_image, thumb_for
     preprocess_mock.assert_called_once()
 
 
+def _create_jpeg(width, height):
+    img_data = BytesIO()
+    Image.new("RGB", size=(width, height)).save(img_data, format="JPEG")
+    img_data.seek(0)
+    return img_data
+
+
+def test_processed_image_retrieve_image_decodes_jpeg_in_draft_mode():
+    # given
+    processed_image = ProcessedImage(_create_jpeg(2000, 1000), 256)
+
+    # when
+    image, image_format = processed_image.retrieve_image()
+
+    # then
+    assert image_format == "JPEG"
+    assert image.size[0] < 2000
+    assert min(image.size) >= 256
+
+
+def test_processed_image_create_thumbnails():
+    # given
+    processed_image = ProcessedImage(_create_jpeg(2000, 1000), 512)
+
+    # when
+    with patch.object(
+        processed_image, "retrieve_image", wraps=processed_image.retrieve_image
+    ) as retrieve_image_mock:
+        thumbnails = processed_image.create_thumbnails([128, 512, 256])
+
+    # then
+    retrieve_image_mock.assert_called_once_with(512)
+    assert list(thumbnails) == [512, 256, 128]
+    for size, (thumbnail_file, _) in thumbnails.items():
+        thumbnail_file.seek(0)
+        assert Image.open(thumbnail_file).size == (size, size // 2)
+
+
 def test_get_filename_from_url_unique():
     # given
     file_format = "jpg"
@@ -162,3 +204,25 @@ def test_get_filename_from_url_with_short_name_is_not_trimmed():
     assert result.endswith(file_format)
     assert result != f"{file_name}.{file_format}"
     assert len(result.split("_")[0]) < FILE_NAME_MAX_LENGTH
+
+
+@patch("saleor.thumbnail.utils.THUMBNAIL_LOCK_WAIT_TIMEOUT", 0.2)
+def test_wait_for_thumbnail_lock_times_out():
+    # given
+    lock_key = "thumbnail-lock:test"
+    cache.add(lock_key, True)
+
+    # when
+    released = wait_for_thumbnail_lock(lock_key)
+
+    # then
+    assert released is False
+    cache.delete(lock_key)
+
+
+def test_wait_for_thumbnail_lock_released():
+    # when
+    released = wait_for_thumbnail_lock("thumbnail-lock:test")
+
+    # then
+    assert released is True
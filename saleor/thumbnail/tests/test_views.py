@@ -1,8 +1,12 @@
+from unittest import mock
+
 import graphene
+from django.core.cache import cache
 from PIL import Image
 
 from .. import IconThumbnailFormat, ThumbnailFormat
 from ..models import Thumbnail
+from ..utils import get_thumbnail_lock_key
 
 
 def test_handle_thumbnail_view_with_format(client, category_with_image, settings):
@@ -185,6 +189,171 @@ def test_handle_thumbnail_view_for_product_media_thumbnail_already_exist(
     assert Thumbnail.objects.count() == thumbnail_count
 
 
+@mock.patch("saleor.thumbnail.views.wait_for_thumbnail_lock")
+@mock.patch("saleor.thumbnail.views.create_thumbnail")
+def test_handle_thumbnail_view_waits_for_thumbnail_being_created(
+    mocked_create_thumbnail,
+    mocked_wait_for_thumbnail_lock,
+    client,
+    category_with_image,
+    image,
+    media_root,
+):
+    # given
+    size = 64
+    category = category_with_image
+    lock_key = get_thumbnail_lock_key("Category", str(category.id), size, None)
+    cache.add(lock_key, True)
+    thumbnail = Thumbnail(category=category, size=size, image=image)
+    mocked_wait_for_thumbnail_lock.side_effect = lambda key: thumbnail.save()
+    category_id = graphene.Node.to_global_id("Category", category.id)
+
+    # when
+    response = client.get(f"/thumbnail/{category_id}/{size}/")
+
+    # then
+    mocked_wait_for_thumbnail_lock.assert_called_once_with(lock_key)
+    mocked_create_thumbnail.assert_not_called()
+    assert response.status_code == 302
+    assert response.url == thumbnail.image.url
+    cache.delete(lock_key)
+
+
+@mock.patch("saleor.thumbnail.views.wait_for_thumbnail_lock")
+def test_handle_thumbnail_view_creates_thumbnail_when_lock_owner_failed(
+    mocked_wait_for_thumbnail_lock, client, category_with_image, settings
+):
+    # given
+    size = 64
+    category = category_with_image
+    lock_key = get_thumbnail_lock_key("Category", str(category.id), size, None)
+    cache.add(lock_key, True)
+    mocked_wait_for_thumbnail_lock.side_effect = lambda key: cache.delete(key)
+    category_id = graphene.Node.to_global_id("Category", category.id)
+
+    # when
+    response = client.get(f"/thumbnail/{category_id}/{size}/")
+
+    # then
+    assert response.status_code == 302
+    assert Thumbnail.objects.filter(category=category, size=size).exists()
+    assert cache.get(lock_key) is None
+
+
+@mock.patch("saleor.thumbnail.views.wait_for_thumbnail_lock")
+@mock.patch("saleor.thumbnail.views.create_thumbnail")
+def test_handle_thumbnail_view_waits_again_when_lock_taken_over(
+    mocked_create_thumbnail,
+    mocked_wait_for_thumbnail_lock,
+    client,
+    category_with_image,
+    image,
+    media_root,
+):
+    # given
+    size = 64
+    category = category_with_image
+    lock_key = get_thumbnail_lock_key("Category", str(category.id), size, None)
+    cache.add(lock_key, True)
+    thumbnail = Thumbnail(category=category, size=size, image=image)
+
+    def wait_for_thumbnail_lock(key):
+        # the lock is kept by another request on the first wait, as if it took
+        # the lock over from a failed owner, and it creates the thumbnail
+        if mocked_wait_for_thumbnail_lock.call_count == 2:
+            thumbnail.save()
+        return True
+
+    mocked_wait_for_thumbnail_lock.side_effect = wait_for_thumbnail_lock
+    category_id = graphene.Node.to_global_id("Category", category.id)
+
+    # when
+    response = client.get(f"/thumbnail/{category_id}/{size}/")
+
+    # then
+    assert mocked_wait_for_thumbnail_lock.call_count == 2
+    mocked_create_thumbnail.assert_not_called()
+    assert response.status_code == 302
+    assert response.url == thumbnail.image.url
+    cache.delete(lock_key)
+
+
+@mock.patch("saleor.thumbnail.views.acquire_thumbnail_lock")
+@mock.patch("saleor.thumbnail.views.create_thumbnail")
+def test_handle_thumbnail_view_thumbnail_created_before_lock_acquired(
+    mocked_create_thumbnail,
+    mocked_acquire_thumbnail_lock,
+    client,
+    category_with_image,
+    image,
+    media_root,
+):
+    # given
+    size = 64
+    category = category_with_image
+    thumbnail = Thumbnail(category=category, size=size, image=image)
+
+    def acquire_thumbnail_lock(key):
+        # the previous lock owner creates the thumbnail and releases the lock
+        # right before it is acquired
+        thumbnail.save()
+        return cache.add(key, True)
+
+    mocked_acquire_thumbnail_lock.side_effect = acquire_thumbnail_lock
+    category_id = graphene.Node.to_global_id("Category", category.id)
+
+    # when
+    response = client.get(f"/thumbnail/{category_id}/{size}/")
+
+    # then
+    mocked_create_thumbnail.assert_not_called()
+    assert response.status_code == 302
+    assert response.url == thumbnail.image.url
+    lock_key = get_thumbnail_lock_key("Category", str(category.id), size, None)
+    assert cache.get(lock_key) is None
+
+
+@mock.patch("saleor.thumbnail.views.wait_for_thumbnail_lock", return_value=False)
+@mock.patch("saleor.thumbnail.views.create_thumbnail")
+def test_handle_thumbnail_view_thumbnail_still_being_created(
+    mocked_create_thumbnail,
+    mocked_wait_for_thumbnail_lock,
+    client,
+    category_with_image,
+):
+    # given
+    size = 64
+    category = category_with_image
+    lock_key = get_thumbnail_lock_key("Category", str(category.id), size, None)
+    cache.add(lock_key, True)
+    category_id = graphene.Node.to_global_id("Category", category.id)
+
+    # when
+    response = client.get(f"/thumbnail/{category_id}/{size}/")
+
+    # then
+    mocked_create_thumbnail.assert_not_called()
+    assert response.status_code == 503
+    assert response["Retry-After"] == "1"
+    assert cache.get(lock_key)
+    cache.delete(lock_key)
+
+
+def test_handle_thumbnail_view_releases_lock(client, category_with_image):
+    # given
+    size = 64
+    category = category_with_image
+    category_id = graphene.Node.to_global_id("Category", category.id)
+
+    # when
+    response = client.get(f"/thumbnail/{category_id}/{size}/")
+
+    # then
+    assert response.status_code == 302
+    lock_key = get_thumbnail_lock_key("Category", str(category.id), size, None)
+    assert cache.get(lock_key) is None
+
+
 def test_handle_thumbnail_view_no_image(client, category):
     # given
     size = 60
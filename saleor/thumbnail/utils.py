@@ -1,10 +1,13 @@
 import os
 import secrets
+import time
+from collections.abc import Iterable
 from io import BytesIO
 from typing import TYPE_CHECKING, Optional, Union
 
 import graphene
 import magic
+from django.core.cache import cache
 from django.core.files import File
 from django.core.files.storage import default_storage
 from django.urls import reverse
@@ -22,6 +25,13 @@ from . import (
 if TYPE_CHECKING:
     from .models import Thumbnail
 
+# Time (sec) after which the lock of a thumbnail being created expires, in case
+# the process creating it dies.
+THUMBNAIL_LOCK_TIMEOUT = 60
+# Time (sec) for which a request waits for a thumbnail created by another one.
+THUMBNAIL_LOCK_WAIT_TIMEOUT = 3
+THUMBNAIL_LOCK_POLL_INTERVAL = 0.1
+
 
 def get_image_or_proxy_url(
     thumbnail: Optional["Thumbnail"],
@@ -79,6 +89,35 @@ def get_icon_thumbnail_format(format: Optional[str]) -> Optional[str]:
     return format
 
 
+def get_thumbnail_lock_key(
+    object_type: str, instance_pk: str, size: int, format: Optional[str]
+) -> str:
+    format = format or ThumbnailFormat.ORIGINAL
+    return f"thumbnail-lock:{object_type}:{instance_pk}:{size}:{format}"
+
+
+def acquire_thumbnail_lock(lock_key: str) -> bool:
+    """Return whether the caller is the only one creating the thumbnail."""
+    return cache.add(lock_key, True, THUMBNAIL_LOCK_TIMEOUT)
+
+
+def release_thumbnail_lock(lock_key: str):
+    cache.delete(lock_key)
+
+
+def wait_for_thumbnail_lock(lock_key: str) -> bool:
+    """Wait shortly for the lock owner to create the thumbnail.
+
+    Return whether the lock was released within `THUMBNAIL_LOCK_WAIT_TIMEOUT`.
+    """
+    deadline = time.monotonic() + THUMBNAIL_LOCK_WAIT_TIMEOUT
+    while cache.get(lock_key) is not None:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(THUMBNAIL_LOCK_POLL_INTERVAL)
+    return True
+
+
 def prepare_thumbnail_file_name(
     file_name: str, size: int, format: Optional[str]
 ) -> str:
@@ -125,13 +164,35 @@ class ProcessedImage:
         )
         return image_file, thumbnail_format
 
-    def retrieve_image(self):
-        """Return a PIL Image instance stored at `image_source`."""
+    def create_thumbnails(self, sizes: Iterable[int]):
+        """Return thumbnails in all given sizes, created from a single decode.
+
+        The image is decoded for the largest size and each smaller thumbnail is
+        downscaled from the previous one.
+        """
+        sizes = sorted(set(sizes), reverse=True)
+        image, image_format = self.retrieve_image(sizes[0])
+        image, save_kwargs = self.preprocess(image, image_format)
+        return {
+            size: self.process_image(image=image, save_kwargs=save_kwargs, size=size)
+            for size in sizes
+        }
+
+    def retrieve_image(self, size: Optional[int] = None):
+        """Return a PIL Image instance stored at `image_source`.
+
+        JPEG images are decoded in draft mode, at the smallest scale which is still
+        larger than the thumbnail size.
+        """
         image = self.image_source
         if isinstance(self.image_source, str):
             image = self.storage.open(self.image_source, "rb")
         image_format = self.get_image_metadata_from_file(image)
-        return (Image.open(image), image_format)
+        pil_image = Image.open(image)
+        if image_format == "JPEG":
+            size = size or self.size
+            pil_image.draft(pil_image.mode, (size, size))
+        return (pil_image, image_format)
 
     def get_image_metadata_from_file(self, file_like):
         """Return a image format and InMemoryUploadedFile-friendly save format.
@@ -224,14 +285,15 @@ class ProcessedImage:
 
         return (image, save_kwargs)
 
-    def process_image(self, image, save_kwargs):
+    def process_image(self, image, save_kwargs, size: Optional[int] = None):
         """Return a BytesIO instance of `image` that fits in a bounding box.
 
-        Bounding box dimensions are `width`x`height`.
+        Bounding box dimensions are `size`x`size`. The image is resized in place.
         """
         image_file = BytesIO()
+        size = size or self.size
         image.thumbnail(
-            (self.size, self.size),
+            (size, size),
         )
         image.save(image_file, **save_kwargs)
         image_file.seek(0)
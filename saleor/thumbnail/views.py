@@ -2,7 +2,7 @@ from collections import namedtuple
 from typing import Optional
 
 from django.core.exceptions import ObjectDoesNotExist
-from django.http import HttpResponseNotFound, HttpResponseRedirect
+from django.http import HttpResponse, HttpResponseNotFound, HttpResponseRedirect
 from graphql.error import GraphQLError
 
 from ..account.models import User
@@ -16,8 +16,12 @@ from . import ALLOWED_ICON_THUMBNAIL_FORMATS, ALLOWED_THUMBNAIL_FORMATS
 from .utils import (
     ProcessedIconImage,
     ProcessedImage,
+    acquire_thumbnail_lock,
+    get_thumbnail_lock_key,
     get_thumbnail_size,
     prepare_thumbnail_file_name,
+    release_thumbnail_lock,
+    wait_for_thumbnail_lock,
 )
 
 ModelData = namedtuple("ModelData", ["model", "image_field", "thumbnail_field"])
@@ -36,6 +40,8 @@ TYPE_TO_MODEL_DATA_MAPPING = {
     **ICON_TYPE_TO_MODEL_DATA_MAPPING,
 }
 UUID_IDENTIFIABLE_TYPES = ["User", "App", "AppInstallation"]
+# Time (sec) after which clients are asked to retry a thumbnail being created.
+THUMBNAIL_RETRY_AFTER = 1
 
 
 def handle_thumbnail(
@@ -45,6 +51,8 @@ def handle_thumbnail(
 
     If the provided size is not in the available resolution list, the thumbnail with
     the closest available size is created and returned, if it does not exist.
+    Concurrent requests for the same missing thumbnail wait shortly for the one
+    creating it, and get a 503 response when it takes longer.
     """
     # try to find corresponding instance based on given instance_id
     try:
@@ -75,11 +83,37 @@ def handle_thumbnail(
     else:
         instance_id_lookup = model_data.thumbnail_field + "_id"
 
-    if thumbnail := Thumbnail.objects.filter(
-        format=format, size=size_px, **{instance_id_lookup: pk}
-    ).first():
+    thumbnail_lookup = {"format": format, "size": size_px, instance_id_lookup: pk}
+    if thumbnail := Thumbnail.objects.filter(**thumbnail_lookup).first():
         return HttpResponseRedirect(thumbnail.image.url)
 
+    lock_key = get_thumbnail_lock_key(object_type, pk, size_px, format)
+    # When the lock owner fails to create the thumbnail, another waiting request
+    # can take the lock over first, so the lock is waited for again.
+    while not acquire_thumbnail_lock(lock_key):
+        released = wait_for_thumbnail_lock(lock_key)
+        if thumbnail := Thumbnail.objects.filter(**thumbnail_lookup).first():
+            return HttpResponseRedirect(thumbnail.image.url)
+        if not released:
+            response = HttpResponse("Thumbnail is being created.", status=503)
+            response["Retry-After"] = str(THUMBNAIL_RETRY_AFTER)
+            return response
+    try:
+        # the thumbnail could be created by the previous lock owner in the meantime
+        if thumbnail := Thumbnail.objects.filter(**thumbnail_lookup).first():
+            return HttpResponseRedirect(thumbnail.image.url)
+        return create_thumbnail(object_type, model_data, pk, size_px, format)
+    finally:
+        release_thumbnail_lock(lock_key)
+
+
+def create_thumbnail(
+    object_type: str,
+    model_data: ModelData,
+    pk: str,
+    size_px: int,
+    format: Optional[str],
+):
     try:
         if object_type in UUID_IDENTIFIABLE_TYPES:
             instance = model_data.model.objects.get(uuid=pk)
@@ -1,6 +1,7 @@
 import math
 from collections import defaultdict, namedtuple
 from collections.abc import Iterable
+from functools import partial
 from typing import TYPE_CHECKING, Any, Optional, cast
 from uuid import UUID
 
@@ -88,7 +89,7 @@ def allocate_stocks(
         .order_by("pk")
         .values("id", "product_variant", "pk", "quantity", "warehouse_id")
     )
-    stocks_id = (stock.pop("id") for stock in stocks)
+    stocks_id = [stock.pop("id") for stock in stocks]
 
     quantity_reservation_for_stocks: dict = _prepare_stock_to_reserved_quantity_map(
         checkout_lines, check_reservations, stocks_id
@@ -117,12 +118,15 @@ def allocate_stocks(
     )
 
     variant_to_stocks: dict[int, list[StockData]] = defaultdict(list)
+    stock_quantities: dict[int, int] = {}
     for stock_data in stocks:
         variant = stock_data.pop("product_variant")
         variant_to_stocks[variant].append(StockData(**stock_data))
+        stock_quantities[stock_data["pk"]] = stock_data["quantity"]
 
     insufficient_stock: list[InsufficientStockData] = []
     allocations: list[Allocation] = []
+    quantity_allocated_by_stock: dict[int, int] = defaultdict(int)
     for line_info in order_lines_info:
         line_info.variant = cast(ProductVariant, line_info.variant)
         stock_allocations = variant_to_stocks[line_info.variant.pk]
@@ -134,31 +138,47 @@ def allocate_stocks(
             insufficient_stock,
         )
         allocations.extend(allocation_items)
+        # Keep the allocated quantities up to date, so the next lines of the same
+        # variant and the out of stock check below don't have to query them.
+        for allocation in allocation_items:
+            quantity_allocation_for_stocks[
+                allocation.stock_id
+            ] += allocation.quantity_allocated
+            quantity_allocated_by_stock[
+                allocation.stock_id
+            ] += allocation.quantity_allocated
 
     if insufficient_stock:
         raise InsufficientStock(insufficient_stock)
 
     if allocations:
-        stocks_to_update = []
-        for alloc in Allocation.objects.bulk_create(allocations):
-            stock = alloc.stock
-            stock.quantity_allocated = (
-                F("quantity_allocated") + alloc.quantity_allocated
-            )
-            stocks_to_update.append(stock)
-        Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+        Allocation.objects.bulk_create(allocations)
+        Stock.objects.bulk_update(
+            [
+                Stock(
+                    pk=stock_pk,
+                    quantity_allocated=F("quantity_allocated") + quantity,
+                )
+                for stock_pk, quantity in quantity_allocated_by_stock.items()
+            ],
+            ["quantity_allocated"],
+        )
 
-        for allocation in allocations:
-            allocated_stock = (
-                Allocation.objects.filter(stock_id=allocation.stock_id).aggregate(
-                    Sum("quantity_allocated")
-                )["quantity_allocated__sum"]
-                or 0
+        out_of_stock_ids = [
+            stock_pk
+            for stock_pk in quantity_allocated_by_stock
+            if stock_quantities[stock_pk] - quantity_allocation_for_stocks[stock_pk]
+            <= 0
+        ]
+        if out_of_stock_ids:
+            transaction.on_commit(
+                partial(_trigger_out_of_stock_events, manager, out_of_stock_ids)
             )
-            if not max(allocation.stock.quantity - allocated_stock, 0):
-                transaction.on_commit(
-                    lambda: manager.product_variant_out_of_stock(allocation.stock)
-                )
+
+
+def _trigger_out_of_stock_events(manager: PluginsManager, stock_ids: list[int]):
+    for stock in Stock.objects.filter(pk__in=stock_ids).order_by("pk"):
+        manager.product_variant_out_of_stock(stock)
 
 
 def _prepare_stock_to_reserved_quantity_map(
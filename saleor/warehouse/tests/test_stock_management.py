@@ -1,14 +1,18 @@
+import time
 from unittest import mock
 
 import pytest
+from django.db import connection
 from django.db.models import Sum
 from django.db.models.functions import Coalesce
+from django.test.utils import CaptureQueriesContext
 
 from ...channel import AllocationStrategy
 from ...core.exceptions import InsufficientStock
 from ...order.fetch import OrderLineInfo
 from ...order.models import OrderLine
 from ...plugins.manager import get_plugins_manager
+from ...product.models import ProductVariant
 from ...tests.utils import flush_post_commit_hooks
 from ...warehouse.models import Stock
 from ..management import (
@@ -42,6 +46,133 @@ def test_allocate_stocks(order_line, stock, channel_USD):
     assert allocation.quantity_allocated == stock.quantity_allocated == 50
 
 
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+def test_allocate_stocks_triggers_out_of_stock_event_after_commit(
+    mocked_out_of_stock,
+    order_line,
+    stock,
+    channel_USD,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    stock.quantity = 50
+    stock.save(update_fields=["quantity"])
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=50)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        allocate_stocks(
+            [line_data], COUNTRY_CODE, channel_USD, manager=get_plugins_manager()
+        )
+
+    # then
+    mocked_out_of_stock.assert_called_once_with(stock)
+
+
+def test_allocate_stocks_multiple_lines_of_the_same_variant(
+    order_line, stock, channel_USD
+):
+    # given
+    stock.quantity = 100
+    stock.save(update_fields=["quantity"])
+    order_line_2 = OrderLine.objects.get(pk=order_line.pk)
+    order_line_2.pk = None
+    order_line_2.save()
+    line_data_1 = OrderLineInfo(
+        line=order_line, variant=order_line.variant, quantity=60
+    )
+    line_data_2 = OrderLineInfo(
+        line=order_line_2, variant=order_line.variant, quantity=30
+    )
+
+    # when
+    allocate_stocks(
+        [line_data_1, line_data_2],
+        COUNTRY_CODE,
+        channel_USD,
+        manager=get_plugins_manager(),
+    )
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity_allocated == 90
+
+
+def test_allocate_stocks_multiple_lines_of_the_same_variant_insufficient_stock(
+    order_line, stock, channel_USD
+):
+    # given
+    stock.quantity = 100
+    stock.save(update_fields=["quantity"])
+    order_line_2 = OrderLine.objects.get(pk=order_line.pk)
+    order_line_2.pk = None
+    order_line_2.save()
+    line_data_1 = OrderLineInfo(
+        line=order_line, variant=order_line.variant, quantity=60
+    )
+    line_data_2 = OrderLineInfo(
+        line=order_line_2, variant=order_line.variant, quantity=60
+    )
+
+    # when
+    with pytest.raises(InsufficientStock):
+        allocate_stocks(
+            [line_data_1, line_data_2],
+            COUNTRY_CODE,
+            channel_USD,
+            manager=get_plugins_manager(),
+        )
+
+    # then
+    assert not Allocation.objects.exists()
+
+
+@pytest.mark.parametrize("lines_count", [1, 10, 100])
+def test_allocate_stocks_queries_do_not_depend_on_lines_count(
+    lines_count, order_line, stock, channel_USD, record_property
+):
+    # given
+    product = order_line.variant.product
+    variants = ProductVariant.objects.bulk_create(
+        [
+            ProductVariant(product=product, sku=f"ALLOCATION-{index}")
+            for index in range(lines_count + 1)
+        ]
+    )
+    Stock.objects.bulk_create(
+        [
+            Stock(product_variant=variant, warehouse=stock.warehouse, quantity=1)
+            for variant in variants
+        ]
+    )
+    first_variant, *variants = variants
+    manager = get_plugins_manager()
+    with CaptureQueriesContext(connection) as single_line_queries:
+        allocate_stocks(
+            [OrderLineInfo(line=order_line, variant=first_variant, quantity=1)],
+            COUNTRY_CODE,
+            channel_USD,
+            manager=manager,
+        )
+    lines_data = [
+        OrderLineInfo(line=order_line, variant=variant, quantity=1)
+        for variant in variants
+    ]
+
+    # when
+    with CaptureQueriesContext(connection) as queries:
+        start = time.perf_counter()
+        allocate_stocks(lines_data, COUNTRY_CODE, channel_USD, manager=manager)
+        duration = time.perf_counter() - start
+
+    # then
+    # Stock rows stay locked until the transaction ends, so the time spent in
+    # allocation is the lower bound of the lock hold time.
+    record_property("lock_hold_time_ms", duration * 1000)
+    assert Allocation.objects.filter(order_line=order_line).count() == lines_count + 1
+    assert len(queries) == len(single_line_queries)
+
+
 def test_allocate_stocks_multiple_lines_the_highest_stock_strategy(
     order_line, order, product, stock, channel_USD
 ):
@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+
+
+class WebhookAppConfig(AppConfig):
+    name = "saleor.webhook"
+
+    def ready(self):
+        self.connect_registry_signals()
+
+    def connect_registry_signals(self):
+        from .registry import webhook_registry
+
+        webhook_registry.connect_signals()
@@ -0,0 +1,106 @@
+"""Process-wide registry of active webhooks grouped by event type.
+
+Every event triggered by the plugins manager has to find webhooks subscribed to it,
+which requires joining apps, their permissions, webhook events and webhooks. Those
+tables change only when apps are installed or reconfigured, so `get_webhooks_for_event`
+can opt into reading them from a snapshot kept per process.
+
+The registry is versioned in the same way as the reference data snapshots: saving or
+deleting webhooks, webhook events and apps, or changing app permissions, bumps the
+version once the transaction is committed. Code creating these objects with bulk
+queries calls `invalidate()` explicitly.
+"""
+
+import copy
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Optional
+
+from django.conf import settings
+from django.db.models.signals import m2m_changed
+
+from ..app.models import App
+from ..core.reference_data import ReferenceData, ReferenceDataSnapshot
+from .event_types import WebhookEventAsyncType, WebhookEventSyncType
+from .models import Webhook, WebhookEvent
+
+
+class WebhookRegistrySnapshot(ReferenceDataSnapshot):
+    """Active webhooks of active apps, indexed by subscribed event types."""
+
+    def __init__(self, version: Optional[int], webhooks: Iterable[Webhook]):
+        super().__init__(version, webhooks)
+        webhooks_by_event_type: defaultdict[str, list[Webhook]] = defaultdict(list)
+        for webhook in self.objects:
+            app = webhook.app
+            # Prime the cache used by `App.get_permissions`, so permission checks
+            # done on the returned webhooks don't query the database either.
+            app._app_perm_cache = {  # type: ignore[attr-defined]
+                f"{permission.content_type.app_label}.{permission.codename}"
+                for permission in app.permissions.all()
+            }
+            for event in webhook.events.all():
+                webhooks_by_event_type[event.event_type].append(webhook)
+        self.webhooks_by_event_type = dict(webhooks_by_event_type)
+
+    def get_webhooks(
+        self,
+        event_type: str,
+        apps_ids: Optional[Iterable[int]] = None,
+        apps_identifier: Optional[Iterable[str]] = None,
+    ) -> list[Webhook]:
+        event_types = [event_type]
+        if event_type in WebhookEventAsyncType.ALL:
+            event_types.append(WebhookEventAsyncType.ANY)
+
+        required_permission = WebhookEventAsyncType.PERMISSIONS.get(
+            event_type, WebhookEventSyncType.PERMISSIONS.get(event_type)
+        )
+        apps_ids = set(apps_ids) if apps_ids else None
+        apps_identifier = set(apps_identifier) if apps_identifier else None
+
+        webhooks: dict[int, Webhook] = {}
+        for subscribed_event_type in event_types:
+            for webhook in self.webhooks_by_event_type.get(subscribed_event_type, []):
+                app = webhook.app
+                if apps_ids and app.id not in apps_ids:
+                    continue
+                if apps_identifier and app.identifier not in apps_identifier:
+                    continue
+                if required_permission and not app.has_perms([required_permission]):
+                    continue
+                webhooks[webhook.pk] = webhook
+
+        return copy.deepcopy(sorted(webhooks.values(), key=lambda webhook: webhook.pk))
+
+
+class WebhookRegistry(ReferenceData):
+    def load_snapshot(self, version: Optional[int] = None) -> WebhookRegistrySnapshot:
+        # Prefetches are not applied to `iterator()`, so the queryset is evaluated.
+        queryset = self.get_queryset().using(settings.DATABASE_CONNECTION_DEFAULT_NAME)
+        return WebhookRegistrySnapshot(version, list(queryset))
+
+    def get_snapshot(self) -> WebhookRegistrySnapshot:
+        return super().get_snapshot()  # type: ignore[return-value]
+
+    def connect_signals(self):
+        super().connect_signals()
+        m2m_changed.connect(
+            self.handle_change,
+            sender=App.permissions.through,
+            weak=False,
+            dispatch_uid=f"invalidate_{self.name}_on_app_permissions_change",
+        )
+
+
+def get_active_webhooks():
+    return (
+        Webhook.objects.filter(is_active=True, app__is_active=True)
+        .select_related("app")
+        .prefetch_related("events", "app__permissions__content_type")
+    )
+
+
+webhook_registry = WebhookRegistry(
+    "webhooks", get_active_webhooks, [Webhook, WebhookEvent, App]
+)
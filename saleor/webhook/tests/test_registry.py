@@ -0,0 +1,127 @@
+import pytest
+
+from ...app.models import App
+from ..event_types import WebhookEventAsyncType, WebhookEventSyncType
+from ..models import Webhook, WebhookEvent
+from ..registry import webhook_registry
+from ..utils import get_webhooks_for_event
+
+
+@pytest.fixture(autouse=True)
+def _webhook_registry(settings):
+    settings.WEBHOOK_REGISTRY_CACHE_ENABLED = True
+    webhook_registry.clear()
+    yield
+    webhook_registry.clear()
+
+
+@pytest.fixture
+def app_with_webhook_factory(db, permission_manage_orders):
+    def create_app(event_type, identifier=None, is_active=True):
+        app = App.objects.create(
+            name="Registry App", identifier=identifier, is_active=is_active
+        )
+        app.permissions.add(permission_manage_orders)
+        webhook = Webhook.objects.create(name="registry-webhook", app=app)
+        webhook.events.create(event_type=event_type)
+        return app, webhook
+
+    return create_app
+
+
+def test_get_webhooks_for_event_from_registry(app_with_webhook_factory):
+    # given
+    event_type = WebhookEventAsyncType.ORDER_CREATED
+    _, webhook = app_with_webhook_factory(event_type)
+    _, any_webhook = app_with_webhook_factory(WebhookEventAsyncType.ANY)
+    app_with_webhook_factory(event_type, is_active=False)
+    app_with_webhook_factory(WebhookEventAsyncType.PRODUCT_CREATED)
+
+    # when
+    webhooks = get_webhooks_for_event(event_type)
+
+    # then
+    assert webhooks == [webhook, any_webhook]
+
+
+def test_get_webhooks_for_event_from_registry_skips_queries_after_warm_up(
+    app_with_webhook_factory, django_assert_num_queries
+):
+    # given
+    event_type = WebhookEventAsyncType.ORDER_CREATED
+    _, webhook = app_with_webhook_factory(event_type)
+    get_webhooks_for_event(event_type)
+
+    # when
+    with django_assert_num_queries(0):
+        webhooks = get_webhooks_for_event(event_type)
+        webhooks[0].app.has_perms(["order.manage_orders"])
+
+    # then
+    assert webhooks == [webhook]
+
+
+def test_get_webhooks_for_event_from_registry_filters_apps(app_with_webhook_factory):
+    # given
+    event_type = WebhookEventSyncType.PAYMENT_GATEWAY_INITIALIZE_SESSION
+    app_a, webhook_a = app_with_webhook_factory(event_type, identifier="app-a")
+    app_b, webhook_b = app_with_webhook_factory(event_type, identifier="app-b")
+
+    # when
+    webhooks_by_id = get_webhooks_for_event(event_type, apps_ids=[app_a.pk])
+    webhooks_by_identifier = get_webhooks_for_event(
+        event_type, apps_identifier=["app-b"]
+    )
+
+    # then
+    assert webhooks_by_id == [webhook_a]
+    assert webhooks_by_identifier == [webhook_b]
+
+
+def test_get_webhooks_for_event_from_registry_requires_permission(
+    app_with_webhook_factory, django_capture_on_commit_callbacks
+):
+    # given
+    event_type = WebhookEventAsyncType.ORDER_CREATED
+    app, _ = app_with_webhook_factory(event_type)
+    get_webhooks_for_event(event_type)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        app.permissions.clear()
+
+    # then
+    assert get_webhooks_for_event(event_type) == []
+
+
+def test_webhook_registry_invalidated_after_bulk_create(
+    app_with_webhook_factory, django_capture_on_commit_callbacks
+):
+    # given
+    event_type = WebhookEventAsyncType.ORDER_UPDATED
+    _, webhook = app_with_webhook_factory(WebhookEventAsyncType.ORDER_CREATED)
+    assert get_webhooks_for_event(event_type) == []
+
+    # when
+    WebhookEvent.objects.bulk_create(
+        [WebhookEvent(webhook=webhook, event_type=event_type)]
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        webhook_registry.invalidate()
+
+    # then
+    assert get_webhooks_for_event(event_type) == [webhook]
+
+
+def test_get_webhooks_for_event_returns_copies(app_with_webhook_factory):
+    # given
+    event_type = WebhookEventAsyncType.ORDER_CREATED
+    app_with_webhook_factory(event_type)
+    [webhook] = get_webhooks_for_event(event_type)
+
+    # when
+    webhook.target_url = "https://changed.com/"
+
+    # then
+    [cached_webhook] = get_webhooks_for_event(event_type)
+    assert cached_webhook.target_url != webhook.target_url
@@ -1,16 +1,26 @@
 import json
 import logging
+from collections import defaultdict, deque
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import TYPE_CHECKING, Any, Optional
 from urllib.parse import urlparse
 
 from celery import group
+from celery.exceptions import MaxRetriesExceededError, Retry
 from celery.utils.log import get_task_logger
+from django.apps import apps
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Model
+from requests import Session
 
 from ....celeryconf import app
 from ....core import EventDeliveryStatus
-from ....core.models import EventDelivery, EventPayload
+from ....core.models import EventDelivery, EventDeliveryPendingPayload, EventPayload
 from ....core.tracing import webhooks_opentracing_trace
 from ....core.utils import get_domain
 from ....graphql.webhook.subscription_payload import (
@@ -25,10 +35,16 @@ from ..utils import (
     WebhookResponse,
     WebhookSchemes,
     attempt_update,
+    bulk_attempt_update,
+    bulk_delivery_update,
+    clear_successful_deliveries,
     clear_successful_delivery,
     create_attempt,
+    create_attempts,
     delivery_update,
+    get_deliveries_for_webhooks,
     get_delivery_for_webhook,
+    get_http_session,
     handle_webhook_retry,
     send_webhook_using_scheme_method,
 )
@@ -40,6 +56,11 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 task_logger = get_task_logger(__name__)
 
+# IDs of deliveries to publish when the `webhook_deliveries_batch` block exits.
+_pending_delivery_ids: ContextVar[Optional[list[int]]] = ContextVar(
+    "pending_webhook_delivery_ids", default=None
+)
+
 
 def create_deliveries_for_subscriptions(
     event_type, subscribable_object, webhooks, requestor=None
@@ -61,18 +82,22 @@ def create_deliveries_for_subscriptions(
         )
         return []
 
-    event_payloads = []
+    # Identical payloads generated for several webhooks share a single row.
+    event_payloads: dict[str, EventPayload] = {}
     event_deliveries = []
+    # The request is shared by all webhooks, so objects loaded by data loaders for
+    # one app are reused by the others.
+    request = initialize_request(
+        requestor,
+        event_type in WebhookEventSyncType.ALL,
+        event_type=event_type,
+    )
     for webhook in webhooks:
         data = generate_payload_from_subscription(
             event_type=event_type,
             subscribable_object=subscribable_object,
             subscription_query=webhook.subscription_query,
-            request=initialize_request(
-                requestor,
-                event_type in WebhookEventSyncType.ALL,
-                event_type=event_type,
-            ),
+            request=request,
             app=webhook.app,
         )
         if not data:
@@ -80,8 +105,11 @@ def create_deliveries_for_subscriptions(
                 "No payload was generated with subscription for event: %s" % event_type
             )
             continue
-        event_payload = EventPayload(payload=json.dumps({**data}))
-        event_payloads.append(event_payload)
+        payload = json.dumps({**data})
+        event_payload = event_payloads.get(payload)
+        if event_payload is None:
+            event_payload = EventPayload(payload=payload)
+            event_payloads[payload] = event_payload
         event_deliveries.append(
             EventDelivery(
                 status=EventDeliveryStatus.PENDING,
@@ -91,10 +119,115 @@ def create_deliveries_for_subscriptions(
             )
         )
 
-    EventPayload.objects.bulk_create(event_payloads)
+    EventPayload.objects.bulk_create(event_payloads.values())
     return EventDelivery.objects.bulk_create(event_deliveries)
 
 
+def can_defer_subscription_payloads(event_type, subscribable_object, requestor):
+    """Check if subscription payloads can be generated by the worker.
+
+    Only model instances can be read again by the worker. Objects of the deletion
+    events no longer exist once the transaction is committed.
+    """
+    if not settings.WEBHOOK_DEFERRED_SUBSCRIPTION_PAYLOADS_ENABLED:
+        return False
+    if event_type not in WEBHOOK_TYPES_MAP or event_type.endswith("_deleted"):
+        return False
+    if not isinstance(subscribable_object, Model) or subscribable_object.pk is None:
+        return False
+    return requestor is None or isinstance(requestor, Model)
+
+
+def create_deferred_deliveries_for_subscriptions(
+    event_type, subscribable_object, webhooks, requestor=None
+) -> list[EventDelivery]:
+    """Create event deliveries with payloads to be generated by the worker.
+
+    Instead of executing the subscription query for each webhook, only the reference
+    to the subscribable object and the requestor is stored.
+    """
+    event_deliveries = EventDelivery.objects.bulk_create(
+        [
+            EventDelivery(
+                status=EventDeliveryStatus.PENDING,
+                event_type=event_type,
+                webhook=webhook,
+            )
+            for webhook in webhooks
+        ]
+    )
+    EventDeliveryPendingPayload.objects.bulk_create(
+        [
+            EventDeliveryPendingPayload(
+                delivery=delivery,
+                object_model=subscribable_object._meta.label,
+                object_id=str(subscribable_object.pk),
+                requestor_model=requestor._meta.label if requestor else None,
+                requestor_id=str(requestor.pk) if requestor else None,
+            )
+            for delivery in event_deliveries
+        ]
+    )
+    return event_deliveries
+
+
+def get_pending_payload_object(model_label: Optional[str], object_id: Optional[str]):
+    if not model_label:
+        return None
+    model = apps.get_model(model_label)
+    return (
+        model.objects.using(settings.DATABASE_CONNECTION_DEFAULT_NAME)
+        .filter(pk=object_id)
+        .first()
+    )
+
+
+def generate_deferred_payload(delivery: EventDelivery) -> Optional[EventPayload]:
+    """Generate the subscription payload of the deferred delivery.
+
+    Objects are read from the default database, so the payload reflects the data
+    committed by the transaction which triggered the event.
+    """
+    pending_payload = delivery.pending_payload
+    subscribable_object = get_pending_payload_object(
+        pending_payload.object_model, pending_payload.object_id
+    )
+    if subscribable_object is None:
+        task_logger.info(
+            "Event delivery id: %r object %s:%s not found.",
+            delivery.pk,
+            pending_payload.object_model,
+            pending_payload.object_id,
+        )
+        return None
+
+    webhook = delivery.webhook
+    data = generate_payload_from_subscription(
+        event_type=delivery.event_type,
+        subscribable_object=subscribable_object,
+        subscription_query=webhook.subscription_query,
+        request=initialize_request(
+            get_pending_payload_object(
+                pending_payload.requestor_model, pending_payload.requestor_id
+            ),
+            event_type=delivery.event_type,
+        ),
+        app=webhook.app,
+    )
+    if not data:
+        task_logger.info(
+            "No payload was generated with subscription for event: %s"
+            % delivery.event_type
+        )
+        return None
+
+    event_payload = EventPayload.objects.create(payload=json.dumps({**data}))
+    delivery.payload = event_payload
+    delivery.save(update_fields=["payload"])
+    pending_payload.delete()
+    return event_payload
+
+
 def group_webhooks_by_subscription(webhooks):
     subscription = [webhook for webhook in webhooks if webhook.subscription_query]
     regular = [webhook for webhook in webhooks if not webhook.subscription_query]
@@ -121,6 +254,42 @@ def create_event_delivery_list_for_webhooks(
     return event_deliveries
 
 
+def get_delivery_id_batches(delivery_ids: list[int]) -> list[list[int]]:
+    size = settings.WEBHOOK_BATCH_DELIVERY_SIZE
+    return [
+        delivery_ids[index : index + size]
+        for index in range(0, len(delivery_ids), size)
+    ]
+
+
+def publish_delivery_batches(delivery_ids: list[int]):
+    for batch in get_delivery_id_batches(delivery_ids):
+        send_webhook_requests_async.delay(batch)
+
+
+@contextmanager
+def webhook_deliveries_batch():
+    """Publish deliveries of all webhooks triggered within the block together.
+
+    Bulk mutations trigger an event for every object, so deliveries are collected
+    and published in batches of `WEBHOOK_BATCH_DELIVERY_SIZE` once the block exits
+    and the current transaction is committed, instead of one task per event.
+    Applies only when `settings.WEBHOOK_BATCH_DELIVERY_ENABLED` is set.
+    """
+    in_batch = _pending_delivery_ids.get() is not None
+    if not settings.WEBHOOK_BATCH_DELIVERY_ENABLED or in_batch:
+        yield
+        return
+    delivery_ids: list[int] = []
+    token = _pending_delivery_ids.set(delivery_ids)
+    try:
+        yield
+    finally:
+        _pending_delivery_ids.reset(token)
+        if delivery_ids:
+            transaction.on_commit(partial(publish_delivery_batches, delivery_ids))
+
+
 def trigger_webhooks_async(
     data,  # deprecated, legacy_data_generator should be used instead
     event_type,
@@ -137,8 +306,13 @@ def trigger_webhooks_async(
     :param event_type: used in both webhook types as event type.
     :param webhooks: used in both webhook types, queryset of async webhooks.
     :param subscribable_object: subscribable object used in subscription webhooks.
+        With `settings.WEBHOOK_DEFERRED_SUBSCRIPTION_PAYLOADS_ENABLED`, payloads of
+        model instances are generated by the worker sending the delivery.
     :param requestor: used in subscription webhooks to generate meta data for payload.
     :param legacy_data_generator: used to generate payload for regular webhooks.
+
+    With `settings.WEBHOOK_BATCH_DELIVERY_ENABLED`, deliveries are sent in batches
+    by `send_webhook_requests_async`.
     """
     regular_webhooks, subscription_webhooks = group_webhooks_by_subscription(webhooks)
     deliveries = []
@@ -156,18 +330,48 @@ def trigger_webhooks_async(
                 event_type=event_type,
             )
         )
+    deferred_deliveries = []
     if subscription_webhooks:
-        deliveries.extend(
-            create_deliveries_for_subscriptions(
+        if can_defer_subscription_payloads(event_type, subscribable_object, requestor):
+            deferred_deliveries = create_deferred_deliveries_for_subscriptions(
                 event_type=event_type,
                 subscribable_object=subscribable_object,
                 webhooks=subscription_webhooks,
                 requestor=requestor,
             )
-        )
+        else:
+            deliveries.extend(
+                create_deliveries_for_subscriptions(
+                    event_type=event_type,
+                    subscribable_object=subscribable_object,
+                    webhooks=subscription_webhooks,
+                    requestor=requestor,
+                )
+            )
+
+    if settings.WEBHOOK_BATCH_DELIVERY_ENABLED:
+        delivery_ids = [delivery.id for delivery in deliveries]
+        pending_delivery_ids = _pending_delivery_ids.get()
+        if pending_delivery_ids is not None:
+            pending_delivery_ids.extend(delivery_ids)
+        else:
+            publish_delivery_batches(delivery_ids)
+        # Deferred payloads are generated from the committed data, which may be
+        # committed after the batch is published.
+        if deferred_deliveries:
+            transaction.on_commit(
+                partial(
+                    publish_delivery_batches,
+                    [delivery.id for delivery in deferred_deliveries],
+                )
+            )
+        return
 
     for delivery in deliveries:
         send_webhook_request_async.delay(delivery.id)
+    # Deferred payloads are generated from the committed data.
+    for delivery in deferred_deliveries:
+        transaction.on_commit(partial(send_webhook_request_async.delay, delivery.id))
 
 
 @app.task(
@@ -181,6 +385,11 @@ def send_webhook_request_async(self, event_delivery_id):
     if not delivery:
         return None
 
+    if not delivery.payload and hasattr(delivery, "pending_payload"):
+        if not generate_deferred_payload(delivery):
+            delivery.delete()
+            return None
+
     webhook = delivery.webhook
     domain = get_domain()
     attempt = create_attempt(delivery, self.request.id)
@@ -222,6 +431,174 @@ def send_webhook_request_async(self, event_delivery_id):
     clear_successful_delivery(delivery)
 
 
+def send_webhook_request(
+    delivery: EventDelivery, domain: str, session: Optional[Session]
+) -> tuple[WebhookResponse, bool]:
+    """Send the delivery and return the response and whether it can be retried."""
+    webhook = delivery.webhook
+    try:
+        if not delivery.payload:
+            raise ValueError("Event delivery id: %r has no payload." % delivery.pk)
+        with webhooks_opentracing_trace(delivery.event_type, domain, app=webhook.app):
+            response = send_webhook_using_scheme_method(
+                webhook.target_url,
+                domain,
+                webhook.secret_key,
+                delivery.event_type,
+                delivery.payload.payload,
+                webhook.custom_headers,
+                session=session,
+            )
+    except ValueError as e:
+        return WebhookResponse(content=str(e), status=EventDeliveryStatus.FAILED), False
+    status_code = response.response_status_code
+    # do not retry for 30x and 40x status codes
+    can_retry = response.status == EventDeliveryStatus.FAILED and not (
+        status_code and 300 <= status_code < 500
+    )
+    return response, can_retry
+
+
+def send_webhook_requests_by_host(
+    deliveries: list[EventDelivery], domain: str
+) -> list[tuple[WebhookResponse, bool]]:
+    """Send deliveries concurrently, limiting the number of requests to each host.
+
+    Each host gets up to `WEBHOOK_BATCH_DELIVERY_HOST_CONCURRENCY` lanes sending
+    its deliveries one by one, and the lanes share a single pool of at most
+    `WEBHOOK_BATCH_DELIVERY_CONCURRENCY` threads. Requests to the same host reuse
+    the keep-alive session of the worker process. Results of
+    `send_webhook_request` are returned in the order of deliveries.
+    """
+    indexes_by_host: defaultdict[str, deque[int]] = defaultdict(deque)
+    for index, delivery in enumerate(deliveries):
+        host = urlparse(delivery.webhook.target_url).netloc.lower()
+        indexes_by_host[host].append(index)
+    sessions = [
+        get_http_session(delivery.webhook.target_url) for delivery in deliveries
+    ]
+    results: dict[int, tuple[WebhookResponse, bool]] = {}
+    host_concurrency = settings.WEBHOOK_BATCH_DELIVERY_HOST_CONCURRENCY
+
+    def send_to_host(pending: deque[int]) -> None:
+        while True:
+            try:
+                index = pending.popleft()
+            except IndexError:
+                return
+            results[index] = send_webhook_request(
+                deliveries[index], domain, sessions[index]
+            )
+
+    # First lanes of all hosts are started before the following ones.
+    lanes = [
+        pending
+        for lane in range(host_concurrency)
+        for pending in indexes_by_host.values()
+        if lane < len(pending)
+    ]
+    max_workers = min(settings.WEBHOOK_BATCH_DELIVERY_CONCURRENCY, len(lanes))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(send_to_host, lanes))
+    return [results[index] for index in range(len(deliveries))]
+
+
+@app.task(
+    queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
+    bind=True,
+    retry_backoff=10,
+    retry_kwargs={"max_retries": 5},
+)
+def send_webhook_requests_async(self, event_delivery_ids):
+    """Send a batch of event deliveries, grouped by the hosts of their webhooks.
+
+    Attempts and statuses of the deliveries are written in bulk. Deliveries which
+    failed with a retryable error are retried together by a single task.
+    """
+    deliveries = []
+    for delivery in get_deliveries_for_webhooks(event_delivery_ids):
+        if not delivery.payload and hasattr(delivery, "pending_payload"):
+            if not generate_deferred_payload(delivery):
+                delivery.delete()
+                continue
+        deliveries.append(delivery)
+    if not deliveries:
+        return None
+
+    domain = get_domain()
+    attempts = create_attempts(deliveries, self.request.id)
+    results = send_webhook_requests_by_host(deliveries, domain)
+    bulk_attempt_update(
+        [(attempt, response) for attempt, (response, _) in zip(attempts, results)]
+    )
+
+    succeeded, failed, retried = [], [], []
+    for delivery, attempt, (response, can_retry) in zip(deliveries, attempts, results):
+        webhook = delivery.webhook
+        if response.status == EventDeliveryStatus.SUCCESS:
+            task_logger.info(
+                "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
+                webhook.id,
+                webhook.target_url,
+                delivery.event_type,
+                delivery.id,
+            )
+            succeeded.append((delivery, attempt))
+            continue
+        task_logger.info(
+            "[Webhook ID: %r] Failed request to %r: %r for event: %r."
+            " Delivery attempt id: %r",
+            webhook.id,
+            webhook.target_url,
+            response.content,
+            delivery.event_type,
+            attempt.id,
+        )
+        if can_retry:
+            retried.append((delivery, attempt))
+        else:
+            failed.append((delivery, attempt))
+    bulk_delivery_update(
+        [delivery for delivery, _ in succeeded], EventDeliveryStatus.SUCCESS
+    )
+    bulk_delivery_update(
+        [delivery for delivery, _ in failed], EventDeliveryStatus.FAILED
+    )
+    clear_successful_deliveries([delivery for delivery, _ in succeeded])
+
+    retry_error: Optional[Retry] = None
+    if retried:
+        try:
+            countdown = self.retry_backoff * (2**self.request.retries)
+            self.retry(
+                args=([delivery.pk for delivery, _ in retried],),
+                countdown=countdown,
+                **self.retry_kwargs,
+            )
+        except Retry as error:
+            retry_error = error
+        except MaxRetriesExceededError:
+            task_logger.info(
+                "Failed requests: exceeded retry limit. Delivery IDs: %r",
+                [delivery.pk for delivery, _ in retried],
+            )
+            bulk_delivery_update(
+                [delivery for delivery, _ in retried], EventDeliveryStatus.FAILED
+            )
+            failed, retried = failed + retried, []
+
+    next_retry = (
+        observability.task_next_retry_date(retry_error) if retry_error else None
+    )
+    for _, attempt in succeeded + failed:
+        observability.report_event_delivery_attempt(attempt)
+    for _, attempt in retried:
+        observability.report_event_delivery_attempt(attempt, next_retry)
+    if retry_error:
+        raise retry_error
+    return None
+
+
 def send_observability_events(webhooks: list[WebhookData], events: list[Any]):
     event_type = WebhookEventAsyncType.OBSERVABILITY
     for webhook in webhooks:
@@ -17,7 +17,7 @@ from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.urls import reverse
 from google.cloud import pubsub_v1
-from requests import RequestException
+from requests import RequestException, Session
 from requests_hardened.ip_filter import InvalidIPAddress
 
 from ...app.headers import AppHeaders, DeprecatedAppHeaders
@@ -104,6 +104,7 @@ def send_webhook_using_http(
     event_type,
     timeout=settings.WEBHOOK_TIMEOUT,
     custom_headers: Optional[dict[str, str]] = None,
+    session: Optional[Session] = None,
 ) -> WebhookResponse:
     """Send a webhook request using http / https protocol.
 
@@ -114,6 +115,7 @@ def send_webhook_using_http(
     :param event_type: Webhook event type.
     :param timeout: Request timeout.
     :param custom_headers: Custom headers which will be added to request headers.
+    :param session: Keep-alive session used instead of a new connection.
 
     :return: WebhookResponse object.
     """
@@ -132,8 +134,9 @@ def send_webhook_using_http(
     if custom_headers:
         headers.update(custom_headers)
 
+    send_request = session.request if session else HTTPClient.send_request
     try:
-        response = HTTPClient.send_request(
+        response = send_request(
             "POST",
             target_url,
             data=message,
@@ -265,6 +268,7 @@ def send_webhook_using_scheme_method(
     event_type,
     data,
     custom_headers=None,
+    session: Optional[Session] = None,
 ) -> WebhookResponse:
     parts = urlparse(target_url)
     message = data.encode("utf-8")
@@ -285,6 +289,7 @@ def send_webhook_using_scheme_method(
             signature,
             event_type,
             custom_headers=custom_headers,
+            session=session,
         )
     raise ValueError(f"Unknown webhook scheme: {parts.scheme!r}")
 
@@ -339,11 +344,30 @@ def handle_webhook_retry(
     return is_success
 
 
+# Keep-alive sessions reused by batched deliveries of the worker process, by origin.
+_http_sessions: dict[str, Session] = {}
+
+
+def get_http_session(target_url: str) -> Optional[Session]:
+    """Return the session of the worker process for the target URL's origin.
+
+    Sessions are kept only for HTTP webhooks, other schemes use their own clients.
+    """
+    parts = urlparse(target_url)
+    scheme = parts.scheme.lower()
+    if scheme not in (WebhookSchemes.HTTP, WebhookSchemes.HTTPS):
+        return None
+    origin = f"{scheme}://{parts.netloc.lower()}"
+    if origin not in _http_sessions:
+        _http_sessions[origin] = HTTPClient.get_session()
+    return _http_sessions[origin]
+
+
 def get_delivery_for_webhook(event_delivery_id) -> Optional["EventDelivery"]:
     try:
-        delivery = EventDelivery.objects.select_related("payload", "webhook__app").get(
-            id=event_delivery_id
-        )
+        delivery = EventDelivery.objects.select_related(
+            "payload", "pending_payload", "webhook__app"
+        ).get(id=event_delivery_id)
     except EventDelivery.DoesNotExist:
         logger.error("Event delivery id: %r not found", event_delivery_id)
         return None
@@ -355,6 +379,26 @@ def get_delivery_for_webhook(event_delivery_id) -> Optional["EventDelivery"]:
     return delivery
 
 
+def get_deliveries_for_webhooks(event_delivery_ids) -> list["EventDelivery"]:
+    """Return deliveries of active webhooks and fail the deliveries of disabled ones."""
+    deliveries = EventDelivery.objects.select_related(
+        "payload", "pending_payload", "webhook__app"
+    ).filter(id__in=event_delivery_ids)
+    active_deliveries, inactive_deliveries = [], []
+    for delivery in deliveries:
+        if delivery.webhook.is_active:
+            active_deliveries.append(delivery)
+        else:
+            inactive_deliveries.append(delivery)
+    if inactive_deliveries:
+        bulk_delivery_update(inactive_deliveries, EventDeliveryStatus.FAILED)
+        logger.info(
+            "Event delivery ids: %r webhooks are disabled.",
+            [delivery.pk for delivery in inactive_deliveries],
+        )
+    return active_deliveries
+
+
 @contextmanager
 def catch_duration_time():
     start = time()
@@ -377,7 +421,37 @@ def create_attempt(
     return attempt
 
 
-def attempt_update(
+def create_attempts(
+    deliveries: list["EventDelivery"],
+    task_id: Optional[str] = None,
+) -> list["EventDeliveryAttempt"]:
+    return EventDeliveryAttempt.objects.bulk_create(
+        [
+            EventDeliveryAttempt(
+                delivery=delivery,
+                task_id=task_id,
+                duration=None,
+                response=None,
+                request_headers=None,
+                response_headers=None,
+                status=EventDeliveryStatus.PENDING,
+            )
+            for delivery in deliveries
+        ]
+    )
+
+
+ATTEMPT_RESPONSE_FIELDS = [
+    "duration",
+    "response",
+    "response_headers",
+    "response_status_code",
+    "request_headers",
+    "status",
+]
+
+
+def set_attempt_response(
     attempt: "EventDeliveryAttempt",
     webhook_response: "WebhookResponse",
 ):
@@ -387,15 +461,23 @@ def attempt_update(
     attempt.response_status_code = webhook_response.response_status_code
     attempt.request_headers = json.dumps(webhook_response.request_headers)
     attempt.status = webhook_response.status
-    attempt.save(
-        update_fields=[
-            "duration",
-            "response",
-            "response_headers",
-            "response_status_code",
-            "request_headers",
-            "status",
-        ]
+
+
+def attempt_update(
+    attempt: "EventDeliveryAttempt",
+    webhook_response: "WebhookResponse",
+):
+    set_attempt_response(attempt, webhook_response)
+    attempt.save(update_fields=ATTEMPT_RESPONSE_FIELDS)
+
+
+def bulk_attempt_update(
+    attempts_with_responses: list[tuple["EventDeliveryAttempt", "WebhookResponse"]],
+):
+    for attempt, webhook_response in attempts_with_responses:
+        set_attempt_response(attempt, webhook_response)
+    EventDeliveryAttempt.objects.bulk_update(
+        [attempt for attempt, _ in attempts_with_responses], ATTEMPT_RESPONSE_FIELDS
     )
 
 
@@ -407,11 +489,39 @@ def clear_successful_delivery(delivery: "EventDelivery"):
             EventPayload.objects.filter(pk=payload_id, deliveries__isnull=True).delete()
 
 
+def clear_successful_deliveries(deliveries: list["EventDelivery"]):
+    deliveries = [
+        delivery
+        for delivery in deliveries
+        if delivery.status == EventDeliveryStatus.SUCCESS
+    ]
+    if not deliveries:
+        return
+    payload_ids = {
+        delivery.payload_id for delivery in deliveries if delivery.payload_id
+    }
+    EventDelivery.objects.filter(
+        pk__in=[delivery.pk for delivery in deliveries]
+    ).delete()
+    if payload_ids:
+        EventPayload.objects.filter(
+            pk__in=payload_ids, deliveries__isnull=True
+        ).delete()
+
+
 def delivery_update(delivery: "EventDelivery", status: str):
     delivery.status = status
     delivery.save(update_fields=["status"])
 
 
+def bulk_delivery_update(deliveries: list["EventDelivery"], status: str):
+    for delivery in deliveries:
+        delivery.status = status
+    EventDelivery.objects.filter(
+        pk__in=[delivery.pk for delivery in deliveries]
+    ).update(status=status)
+
+
 def trigger_transaction_request(
     transaction_data: "TransactionActionData", event_type: str, requestor
 ):
@@ -437,9 +547,10 @@ def trigger_transaction_request(
             ),
         )
         return None
-    webhook = get_webhooks_for_event(
+    webhooks = get_webhooks_for_event(
         event_type, apps_ids=[transaction_data.transaction_app_owner.pk]
-    ).first()
+    )
+    webhook = webhooks[0] if webhooks else None
     if not webhook:
         create_failed_transaction_event(
             transaction_data.event,
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 from django.conf import settings
 from django.db.models import Q
@@ -7,6 +7,7 @@ from django.db.models.expressions import Exists, OuterRef
 from ..app.models import App
 from .event_types import WebhookEventAsyncType, WebhookEventSyncType
 from .models import Webhook, WebhookEvent
+from .registry import webhook_registry
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -17,8 +18,18 @@ def get_webhooks_for_event(
     webhooks: Optional["QuerySet[Webhook]"] = None,
     apps_ids: Optional["list[int]"] = None,
     apps_identifier: Optional[list[str]] = None,
-) -> "QuerySet[Webhook]":
-    """Get active webhooks from the database for an event."""
+) -> Union["QuerySet[Webhook]", list[Webhook]]:
+    """Get active webhooks for an event.
+
+    When `settings.WEBHOOK_REGISTRY_CACHE_ENABLED` is set and no webhooks are
+    provided, webhooks are returned from the per-process registry instead of the
+    database.
+    """
+    if webhooks is None and settings.WEBHOOK_REGISTRY_CACHE_ENABLED:
+        return webhook_registry.get_snapshot().get_webhooks(
+            event_type, apps_ids=apps_ids, apps_identifier=apps_identifier
+        )
+
     permissions = {}
     required_permission = WebhookEventAsyncType.PERMISSIONS.get(
         event_type, WebhookEventSyncType.PERMISSIONS.get(event_type)